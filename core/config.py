@@ -5,11 +5,21 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Last.fm
-LASTFM_API_URL = "http://ws.audioscrobbler.com/2.0/"
+LASTFM_API_URL = "https://ws.audioscrobbler.com/2.0/"
 LASTFM_API_KEY = os.getenv('LASTFM_API_KEY')
 LASTFM_API_SECRET = os.getenv('LASTFM_API_SECRET')
 LASTFM_USERNAME = os.getenv('LASTFM_USERNAME')
 LASTFM_PASSWORD = os.getenv('LASTFM_PASSWORD')
+LASTFM_REQUESTS_PER_SECOND = float(os.getenv('LASTFM_REQUESTS_PER_SECOND', 5))
+LASTFM_REQUEST_BURST = int(os.getenv('LASTFM_REQUEST_BURST', 5))
+LASTFM_HTTP_MAX_CONNECTIONS = int(os.getenv('LASTFM_HTTP_MAX_CONNECTIONS', 10))
+LASTFM_HTTP_MAX_KEEPALIVE = int(os.getenv('LASTFM_HTTP_MAX_KEEPALIVE', 10))
+LASTFM_HTTP_TIMEOUT = float(os.getenv('LASTFM_HTTP_TIMEOUT', 20))
+LASTFM_HTTP_CONNECT_TIMEOUT = float(os.getenv('LASTFM_HTTP_CONNECT_TIMEOUT', 5))
+# requires the optional `h2` package
+LASTFM_HTTP2 = os.getenv('LASTFM_HTTP2', 'false').lower() == 'true'
+# fail instead of warn when an entity fetch makes more requests than expected, e.g. in tests
+LASTFM_STRICT_REQUEST_COUNTS = os.getenv('LASTFM_STRICT_REQUEST_COUNTS', 'false').lower() == 'true'
 
 # Frontend
 WEB_APP_URL = os.getenv('WEB_APP_URL')
@@ -19,9 +29,39 @@ APP_TOKEN = os.getenv('APP_TOKEN')
 SPOTIFY_CLIENT_ID = os.getenv('SPOTIFY_CLIENT_ID')
 SPOTIFY_CLIENT_SECRET = os.getenv('SPOTIFY_CLIENT_SECRET')
 SPOTIFY_REDIRECT_URI = os.getenv('SPOTIFY_REDIRECT_URI')
+SPOTIFY_EXECUTOR_WORKERS = int(os.getenv('SPOTIFY_EXECUTOR_WORKERS', 4))
+
+# Apple Music
+APPLE_MUSIC_EXECUTOR_WORKERS = int(os.getenv('APPLE_MUSIC_EXECUTOR_WORKERS', 2))
 
 # Database
 DATABASE_URL = os.getenv('DATABASE_URL')
 
+# Sync
+SYNC_WORKERS = int(os.getenv('SYNC_WORKERS', 4))
+SYNC_WINDOW_DAYS = int(os.getenv('SYNC_WINDOW_DAYS', 90))
+# a running sync job with no checkpoint for this long is treated as interrupted by --resume
+SYNC_JOB_STALE_MINUTES = int(os.getenv('SYNC_JOB_STALE_MINUTES', 15))
+REF_DATA_TTL_DAYS = int(os.getenv('REF_DATA_TTL_DAYS', 30))
+REF_DATA_MAX_PER_RUN = int(os.getenv('REF_DATA_MAX_PER_RUN', 500))
+
+# Last.fm response cache
+LASTFM_CACHE_ENABLED = os.getenv('LASTFM_CACHE_ENABLED', 'true').lower() == 'true'
+LASTFM_CACHE_PATH = os.getenv(
+    'LASTFM_CACHE_PATH',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache', 'lastfm.sqlite3')
+)
+LASTFM_CACHE_MAX_ENTRIES = int(os.getenv('LASTFM_CACHE_MAX_ENTRIES', 50000))
+# TTLs in seconds
+LASTFM_CACHE_TTL_ARTIST = int(os.getenv('LASTFM_CACHE_TTL_ARTIST', 7 * 86400))
+LASTFM_CACHE_TTL_ALBUM = int(os.getenv('LASTFM_CACHE_TTL_ALBUM', 86400))
+LASTFM_CACHE_TTL_TRACK = int(os.getenv('LASTFM_CACHE_TTL_TRACK', 86400))
+LASTFM_CACHE_TTL_ALBUM_IMAGE = int(os.getenv('LASTFM_CACHE_TTL_ALBUM_IMAGE', 30 * 86400))
+# how long an artist, album or track Last.fm could not find is skipped
+LASTFM_CACHE_TTL_UNRESOLVED = int(os.getenv('LASTFM_CACHE_TTL_UNRESOLVED', 7 * 86400))
+# in-process memo in front of the cache for album lookups on the now playing path
+LASTFM_MEMO_TTL = int(os.getenv('LASTFM_MEMO_TTL', 600))
+LASTFM_MEMO_MAX_ENTRIES = int(os.getenv('LASTFM_MEMO_MAX_ENTRIES', 256))
+
 # General settings
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
\ No newline at end of file
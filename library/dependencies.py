@@ -1,3 +1,4 @@
+from services.history_service import HistoryService
 from services.lastfm_service import LastFmService
 from services.spotify_service import SpotifyService
 from services.sync_service import SyncService
@@ -5,6 +6,7 @@ from services.sync_service import SyncService
 lastfm: LastFmService | None = None
 spotify: SpotifyService | None = None
 sync_service: SyncService | None = None
+history_service: HistoryService | None = None
 
 
 async def get_lastfm_service() -> LastFmService:
@@ -26,3 +28,21 @@ async def get_sync_service() -> SyncService:
     if sync_service is None:
         sync_service = SyncService()
     return sync_service
+
+
+async def get_history_service() -> HistoryService:
+    global history_service
+    if history_service is None:
+        history_service = HistoryService()
+    return history_service
+
+
+async def close_services() -> None:
+    """Release the connections held by the shared services."""
+    global lastfm, spotify
+    if lastfm is not None:
+        await lastfm.close()
+        lastfm = None
+    if spotify is not None:
+        await spotify.close()
+        spotify = None
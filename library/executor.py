@@ -0,0 +1,175 @@
+import asyncio
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from enum import IntEnum
+from typing import Any, Callable
+
+
+class Lane(IntEnum):
+    """Queued calls in a lower lane are started first."""
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+# The lane for blocking calls made by the current task, so callers deep in a sync job
+# don't need to pass it through every service method.
+_lane: ContextVar[Lane] = ContextVar("executor_lane", default=Lane.INTERACTIVE)
+
+
+@contextmanager
+def background():
+    """Run the blocking calls made inside the block in the background lane."""
+    token = _lane.set(Lane.BACKGROUND)
+    try:
+        yield
+    finally:
+        _lane.reset(token)
+
+
+class _Job:
+    def __init__(self, func: Callable[[], Any], lane: Lane):
+        self.func = func
+        self.lane = lane
+        self.future: Future = Future()
+        self.queued_at = time.monotonic()
+
+
+_SHUTDOWN = None
+
+
+class BoundedExecutor:
+    """
+    Thread pool of `workers` threads owned by one service, so a burst of calls to one
+    blocking library cannot hold up another, e.g. a long batch of Spotify lookups and the
+    one-second Apple Music poll.
+
+    Queued calls are started interactive lane first, then in the order they arrived.
+    A call that is cancelled while still queued is never run.
+    """
+    def __init__(self, name: str, workers: int = 4):
+        self.name = name
+        self.workers = max(workers, 1)
+        self._queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._order = itertools.count()
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+        # metrics
+        self.running = 0
+        self.queued = {lane: 0 for lane in Lane}
+        self.started = {lane: 0 for lane in Lane}
+        self.completed = {lane: 0 for lane in Lane}
+        self.cancelled = {lane: 0 for lane in Lane}
+        self.total_wait = {lane: 0.0 for lane in Lane}
+        self.max_wait = {lane: 0.0 for lane in Lane}
+
+        executors[name] = self
+
+    def submit(self, func: Callable[..., Any], *args, lane: Lane = None, **kwargs) -> Future:
+        lane = _lane.get() if lane is None else lane
+        # run with the caller's context vars, like asyncio.to_thread
+        context = copy_context()
+        job = _Job(lambda: context.run(func, *args, **kwargs), lane)
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"Executor {self.name} is shut down.")
+            self.queued[lane] += 1
+            if len(self._threads) < self.workers and sum(self.queued.values()) > self._idle():
+                thread = threading.Thread(target=self._work, name=f"{self.name}-{len(self._threads)}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+
+        self._queue.put((lane, next(self._order), job))
+        return job.future
+
+    async def run(self, func: Callable[..., Any], *args, lane: Lane = None, **kwargs) -> Any:
+        """
+        Run a blocking call on the pool and wait for it. Cancelling the awaiting task
+        drops the call if it has not started yet.
+        """
+        return await asyncio.wrap_future(self.submit(func, *args, lane=lane, **kwargs))
+
+    def _idle(self) -> int:
+        return len(self._threads) - self.running
+
+    def _work(self) -> None:
+        while (item := self._queue.get()[2]) is not _SHUTDOWN:
+            job: _Job = item
+            wait = time.monotonic() - job.queued_at
+
+            with self._lock:
+                self.queued[job.lane] -= 1
+                if not job.future.set_running_or_notify_cancel():
+                    self.cancelled[job.lane] += 1
+                    continue
+                self.running += 1
+                self.started[job.lane] += 1
+                self.total_wait[job.lane] += wait
+                self.max_wait[job.lane] = max(self.max_wait[job.lane], wait)
+
+            try:
+                job.future.set_result(job.func())
+            except BaseException as e:
+                job.future.set_exception(e)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed[job.lane] += 1
+
+    def shutdown(self, cancel_queued: bool = True) -> None:
+        """Stop the worker threads once they finish their current call."""
+        with self._lock:
+            self._closed = True
+            threads = list(self._threads)
+
+        if cancel_queued:
+            while True:
+                try:
+                    _, _, job = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is _SHUTDOWN:
+                    continue
+                job.future.cancel()
+                with self._lock:
+                    self.queued[job.lane] -= 1
+                    self.cancelled[job.lane] += 1
+
+        # sentinels sort after every lane, so queued calls that were kept still run
+        for _ in threads:
+            self._queue.put((len(Lane), next(self._order), _SHUTDOWN))
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lanes = {}
+            for lane in Lane:
+                started = self.started[lane]
+                lanes[lane.name.lower()] = {
+                    "queued": self.queued[lane],
+                    "completed": self.completed[lane],
+                    "cancelled": self.cancelled[lane],
+                    "avg_wait": round(self.total_wait[lane] / started, 3) if started else 0.0,
+                    "max_wait": round(self.max_wait[lane], 3),
+                }
+            return {
+                "workers": self.workers,
+                "threads": len(self._threads),
+                "running": self.running,
+                "queue_depth": sum(self.queued.values()),
+                "lanes": lanes,
+            }
+
+
+# Every executor by name, for reporting.
+executors: dict[str, BoundedExecutor] = {}
+
+
+def executor_stats() -> dict[str, dict[str, Any]]:
+    return {name: executor.stats() for name, executor in executors.items()}
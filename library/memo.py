@@ -0,0 +1,106 @@
+import asyncio
+import functools
+import inspect
+import time
+from collections import OrderedDict
+from typing import Any
+
+from library.response_cache import normalize_params
+
+
+class AsyncMemo:
+    """
+    In-process memo for an async method: at most `max_entries` results, each kept for `ttl`
+    seconds, least recently used dropped first. Concurrent calls with the same arguments
+    share one in-flight call instead of each making their own. The shared call runs as a task
+    owned by the memo, so cancelling one caller, including the first, does not cancel it for the others.
+
+    This sits in front of the persistent response cache for lookups that repeat within
+    seconds, e.g. the same album for every track of an album on the now playing path.
+    Results are shared between callers, so they must not be modified. `None` results are not kept.
+    """
+    def __init__(self, name: str, ttl: float, max_entries: int = 256):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._in_flight: dict[tuple, asyncio.Task] = {}
+
+        # metrics
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def _get(self, key: tuple) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set(self, key: tuple, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _call_and_store(self, key: tuple, func, args, kwargs) -> Any:
+        value = await func(*args, **kwargs)
+        if value is not None:
+            self._set(key, value)
+        return value
+
+    def _done(self, key: tuple, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # every caller may have been cancelled, so no one else is left to retrieve the error
+        if not task.cancelled():
+            task.exception()
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
+
+    def __call__(self, func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, bypass_cache: bool = False, **kwargs):
+            if bypass_cache:
+                return await func(*args, bypass_cache=True, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = normalize_params({k: v for k, v in bound.arguments.items() if k != "self"})
+            key = tuple(params.items())
+
+            value = self._get(key)
+            if value is not None:
+                self.hits += 1
+                return value
+
+            task = self._in_flight.get(key)
+            if task is not None:
+                self.coalesced += 1
+            else:
+                self.misses += 1
+                task = asyncio.ensure_future(self._call_and_store(key, func, args, kwargs))
+                self._in_flight[key] = task
+                task.add_done_callback(functools.partial(self._done, key))
+
+            return await asyncio.shield(task)
+
+        return wrapper
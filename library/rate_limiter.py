@@ -0,0 +1,78 @@
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every caller of an API, whether they are coroutines
+    or blocking calls running in worker threads.
+
+    Tokens refill at `rate` per second up to `burst`. A caller that finds the bucket
+    empty reserves the next token and waits until it is due, so waiting callers
+    are served in the order they arrived and the combined rate never exceeds `rate`.
+    """
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+        # metrics
+        self.requests = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _reserve(self) -> float:
+        """Take a token, possibly one that is not available yet. Returns how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            self.requests += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            if wait > 0:
+                self.waiting += 1
+                self.max_waiting = max(self.max_waiting, self.waiting)
+            return wait
+
+    def _release_waiter(self) -> None:
+        with self._lock:
+            self.waiting -= 1
+
+    async def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self._release_waiter()
+
+    def acquire_sync(self) -> None:
+        """Blocking variant for code that runs in a worker thread, e.g. blocking client libraries."""
+        wait = self._reserve()
+        if wait > 0:
+            try:
+                time.sleep(wait)
+            finally:
+                self._release_waiter()
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "requests": self.requests,
+                "waiting": self.waiting,
+                "max_waiting": self.max_waiting,
+                "avg_wait": round(self.total_wait / self.requests, 3) if self.requests else 0.0,
+                "max_wait": round(self.max_wait, 3),
+            }
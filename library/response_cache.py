@@ -0,0 +1,336 @@
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable
+
+import orjson
+from loguru import logger
+
+from library.executor import BoundedExecutor
+
+# bump to invalidate every entry when the shape of cached models changes
+CACHE_VERSION = 1
+
+# evict at most once per this many writes, so writes stay cheap
+EVICT_EVERY = 100
+
+# cache hits are recorded in memory and written in one batch once there are this many,
+# or the oldest is this many seconds old, instead of one write per hit
+FLUSH_HITS_EVERY = 100
+FLUSH_HITS_AFTER = 30
+
+_MISSING = object()
+
+
+class Unresolved(Exception):
+    """
+    Raised by a function wrapped with `ResponseCache.cached` when the API cannot resolve
+    what was asked for. The wrapper records it in the negative cache and returns None.
+    """
+    def __init__(self, reason: int, message: str = ""):
+        super().__init__(message)
+        self.reason = reason
+        self.message = message
+
+
+def normalize_params(params: dict) -> dict:
+    """Make equivalent calls share a key, e.g. `"The  Beatles"` and `"the beatles"`."""
+    normalized = {}
+    for name, value in sorted(params.items()):
+        if isinstance(value, str):
+            value = " ".join(value.split()).casefold()
+        normalized[name] = value
+    return normalized
+
+
+class ResponseCache:
+    """
+    Persistent cache of API responses in a SQLite file, so it survives restarts and is
+    shared by every process using the same file (the TUI, the API and the scripts).
+
+    Entries are keyed by method and normalized parameters, expire after a per-method TTL,
+    and the least recently used entries are evicted once there are more than `max_entries`.
+
+    Lookups the API could not resolve, e.g. a misspelled album, are kept in a separate
+    negative cache with the API's reason code, so they are not requested again until they expire.
+
+    The `cached` decorator, `stats`, `unresolved_report` and `flush` run every SQLite call on the cache's
+    own single-thread executor, so waiting for another process's write lock never blocks the event loop,
+    and a flush runs after the writes queued before it.
+    """
+    def __init__(self, path: str, max_entries: int = 50_000, enabled: bool = True):
+        self.path = path
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.hits: dict[str, int] = defaultdict(int)
+        self.misses: dict[str, int] = defaultdict(int)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._executor = BoundedExecutor("response_cache", workers=1)
+
+        # pending hit bookkeeping, see `_record_hit`
+        self._accessed: dict[str, float] = {}
+        self._unresolved_hits: dict[str, tuple[int, float]] = {}
+        self._hits_since: float | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False, isolation_level=None)
+            # WAL lets several processes read while one writes
+            conn.execute("pragma journal_mode=wal")
+            conn.execute("pragma synchronous=normal")
+            conn.execute(
+                "create table if not exists responses ("
+                "key text primary key, method text not null, value blob not null, "
+                "expires_at real not null, accessed_at real not null)"
+            )
+            conn.execute("create index if not exists ix_responses_accessed_at on responses (accessed_at)")
+            conn.execute(
+                "create table if not exists unresolved ("
+                "key text primary key, method text not null, params text not null, "
+                "reason integer not null, message text, expires_at real not null, "
+                "first_seen real not null, last_seen real not null, hits integer not null default 0)"
+            )
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def make_key(method: str, params: dict) -> str:
+        raw = orjson.dumps([CACHE_VERSION, method, normalize_params(params)], default=str)
+        return hashlib.sha1(raw).hexdigest()
+
+    def _flush_hits(self, conn: sqlite3.Connection) -> None:
+        """Write the pending access times and negative cache hit counts. Call with the lock held."""
+        if self._accessed:
+            conn.executemany(
+                "update responses set accessed_at = ? where key = ?",
+                [(accessed_at, key) for key, accessed_at in self._accessed.items()],
+            )
+        if self._unresolved_hits:
+            conn.executemany(
+                "update unresolved set hits = hits + ?, last_seen = ? where key = ?",
+                [(hits, last_seen, key) for key, (hits, last_seen) in self._unresolved_hits.items()],
+            )
+        self._accessed = {}
+        self._unresolved_hits = {}
+        self._hits_since = None
+
+    def _record_hit(self, conn: sqlite3.Connection, now: float) -> None:
+        """Flush the pending hits once enough have piled up. Call with the lock held."""
+        if self._hits_since is None:
+            self._hits_since = now
+        pending = len(self._accessed) + len(self._unresolved_hits)
+        if pending >= FLUSH_HITS_EVERY or now - self._hits_since >= FLUSH_HITS_AFTER:
+            self._flush_hits(conn)
+
+    def _flush(self) -> None:
+        with self._lock:
+            self._flush_hits(self._connect())
+
+    async def flush(self) -> None:
+        """Write the cache hits still batched in memory, after any reads and writes already queued."""
+        await self._executor.run(self._flush)
+
+    def get(self, method: str, key: str) -> Any:
+        """Return the cached value, or `_MISSING` if there is no live entry."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("select value, expires_at from responses where key = ?", (key,)).fetchone()
+            if row is None or row[1] < now:
+                self.misses[method] += 1
+                return _MISSING
+            self._accessed[key] = now
+            self._record_hit(conn, now)
+
+        self.hits[method] += 1
+        return pickle.loads(row[0])
+
+    def set(self, method: str, key: str, value: Any, ttl: int) -> None:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "insert or replace into responses (key, method, value, expires_at, accessed_at) values (?, ?, ?, ?, ?)",
+                (key, method, pickle.dumps(value), now + ttl, now),
+            )
+            self._writes += 1
+            if self._writes % EVICT_EVERY == 0:
+                self._evict(conn, now)
+
+    def get_unresolved(self, key: str) -> tuple[int, str] | None:
+        """The reason code and message of a live negative entry, counting the skipped call."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("select reason, message, expires_at from unresolved where key = ?", (key,)).fetchone()
+            if row is None or row[2] < now:
+                return None
+            hits, _ = self._unresolved_hits.get(key, (0, now))
+            self._unresolved_hits[key] = (hits + 1, now)
+            self._record_hit(conn, now)
+        return row[0], row[1]
+
+    def set_unresolved(self, method: str, key: str, params: dict, reason: int, message: str, ttl: int) -> None:
+        now = time.time()
+        with self._lock:
+            self._connect().execute(
+                "insert into unresolved (key, method, params, reason, message, expires_at, first_seen, last_seen) "
+                "values (?, ?, ?, ?, ?, ?, ?, ?) "
+                "on conflict (key) do update set reason = excluded.reason, message = excluded.message, "
+                "expires_at = excluded.expires_at, last_seen = excluded.last_seen",
+                (key, method, orjson.dumps(params, default=str).decode(), reason, message, now + ttl, now, now),
+            )
+
+    async def unresolved_report(self, limit: int = 20, method: str = None) -> list[dict[str, Any]]:
+        """The live negative entries that saved the most calls."""
+        return await self._executor.run(self._unresolved_report, limit, method)
+
+    def _unresolved_report(self, limit: int, method: str | None) -> list[dict[str, Any]]:
+        query = "select method, params, reason, message, hits, first_seen, expires_at from unresolved where expires_at >= ?"
+        args: list[Any] = [time.time()]
+        if method:
+            query += " and method = ?"
+            args.append(method)
+        query += " order by hits desc, last_seen desc limit ?"
+        args.append(limit)
+
+        with self._lock:
+            conn = self._connect()
+            self._flush_hits(conn)
+            rows = conn.execute(query, args).fetchall()
+        return [
+            {
+                "method": m,
+                "params": orjson.loads(params),
+                "reason": reason,
+                "message": message,
+                "skipped": hits,
+                "first_seen": first_seen,
+                "expires_at": expires_at,
+            }
+            for m, params, reason, message, hits, first_seen, expires_at in rows
+        ]
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        self._flush_hits(conn)
+        conn.execute("delete from unresolved where expires_at < ?", (now,))
+        conn.execute("delete from responses where expires_at < ?", (now,))
+        overflow = conn.execute("select count(*) from responses").fetchone()[0] - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                "delete from responses where key in (select key from responses order by accessed_at limit ?)",
+                (overflow,),
+            )
+            logger.info(f"Evicted {overflow} least recently used responses from the cache.")
+
+    def clear(self, method: str = None) -> None:
+        with self._lock:
+            conn = self._connect()
+            if method:
+                conn.execute("delete from responses where method = ?", (method,))
+                conn.execute("delete from unresolved where method = ?", (method,))
+            else:
+                conn.execute("delete from responses")
+                conn.execute("delete from unresolved")
+
+    def clear_unresolved(self) -> None:
+        with self._lock:
+            self._connect().execute("delete from unresolved")
+
+    async def stats(self) -> dict[str, Any]:
+        return await self._executor.run(self._stats)
+
+    def _stats(self) -> dict[str, Any]:
+        with self._lock:
+            self._flush_hits(self._connect())
+            rows = self._connect().execute("select method, count(*) from responses group by method").fetchall()
+            unresolved = self._connect().execute(
+                "select count(*), coalesce(sum(hits), 0) from unresolved where expires_at >= ?", (time.time(),)
+            ).fetchone()
+        entries = dict(rows)
+        methods = sorted(set(entries) | set(self.hits) | set(self.misses))
+        return {
+            "enabled": self.enabled,
+            "entries": sum(entries.values()),
+            "max_entries": self.max_entries,
+            "unresolved": {"entries": unresolved[0], "skipped": unresolved[1]},
+            "methods": {
+                m: {"entries": entries.get(m, 0), "hits": self.hits[m], "misses": self.misses[m]}
+                for m in methods
+            },
+        }
+
+    def cached(
+            self,
+            method: str,
+            ttl: int,
+            key: Callable[..., dict] = None,
+            negative_ttl: int = None,
+            entity: tuple[str, ...] = None,
+    ):
+        """
+        Cache the result of an async method. `None` results are not cached.
+
+        Parameters are taken from the call's arguments (excluding `self`), unless `key`
+        builds them from the same arguments, e.g. for arguments that are not plain values.
+        Callers can pass `bypass_cache=True` to skip the lookup and store a fresh result.
+
+        When the method raises `Unresolved`, None is returned, and with `negative_ttl` the
+        lookup is not attempted again for that long. Negative entries are keyed by the `entity`
+        arguments only, e.g. an album's title and artist regardless of what details were asked for.
+        """
+        def decorator(func):
+            signature = inspect.signature(func)
+
+            async def call(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs), None
+                except Unresolved as e:
+                    return None, e
+
+            @functools.wraps(func)
+            async def wrapper(*args, bypass_cache: bool = False, **kwargs):
+                if not self.enabled:
+                    return (await call(*args, **kwargs))[0]
+
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                if key:
+                    params = key(*args, **kwargs)
+                else:
+                    params = {k: v for k, v in bound.arguments.items() if k != "self"}
+                cache_key = self.make_key(method, params)
+
+                negative_key = None
+                if negative_ttl:
+                    entity_params = {k: bound.arguments[k] for k in entity} if entity else params
+                    negative_key = self.make_key(f"{method}:unresolved", entity_params)
+
+                if not bypass_cache:
+                    value = await self._executor.run(self.get, method, cache_key)
+                    if value is not _MISSING:
+                        return value
+                    if negative_key and await self._executor.run(self.get_unresolved, negative_key):
+                        return None
+
+                value, unresolved = await call(*args, **kwargs)
+                if value is not None:
+                    await self._executor.run(self.set, method, cache_key, value, ttl)
+                elif unresolved and negative_key:
+                    await self._executor.run(
+                        self.set_unresolved,
+                        method, negative_key, entity_params, unresolved.reason, unresolved.message, negative_ttl,
+                    )
+                return value
+
+            return wrapper
+        return decorator
@@ -1,4 +1,5 @@
 from collections import Counter
+from datetime import datetime
 from typing import List, Dict
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -24,6 +25,9 @@ class SessionScrobbles(BaseModel):
 
     def add_pending(self, track: Track) -> None:
         if track not in self.pending:
+            # scrobbled later, so keep when it was played
+            if track.time_to_scrobble is None:
+                track.time_to_scrobble = datetime.now()
             self.pending.append(track)
             logger.info(f"Added track to pending scrobbles: {track.display_name}")
 
@@ -48,12 +52,13 @@ class SessionScrobbles(BaseModel):
         processed_count = 0
         pending_copy = self.pending.copy()
 
-        for track in pending_copy:
-            scrobbled_track = await lastfm_service.scrobble(track)
-            if scrobbled_track:
-                self.add_scrobble(scrobbled_track)
-                self.remove_pending(track)
+        results = await lastfm_service.scrobble_many([(track, track.time_to_scrobble) for track in pending_copy])
+        for result in results:
+            if result.accepted:
+                self.add_scrobble(result.scrobble)
                 processed_count += 1
+            if not result.retryable:
+                self.remove_pending(result.track)
 
         logger.info(f"Scrobbled {processed_count} pending track(s)...")
         return processed_count
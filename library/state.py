@@ -4,7 +4,6 @@ from pydantic import HttpUrl, BaseModel
 from library.integrations import Integration
 from library.session_scrobbles import SessionScrobbles
 from models.schemas import Album, LastFmUser, Track
-from services.lastfm_service import get_lastfm_account_details
 
 
 class AppState(BaseModel):
@@ -17,9 +16,13 @@ class AppState(BaseModel):
     spotify_artist_image: HttpUrl | None = None
     session: SessionScrobbles = SessionScrobbles()
 
-    def __init__(self):
-        super().__init__()
-        self.user = get_lastfm_account_details()
+    async def get_user(self) -> LastFmUser:
+        """The Last.fm user is loaded on first use rather than when the state is created."""
+        if self.user is None:
+            from library.dependencies import get_lastfm_service
+            lastfm = await get_lastfm_service()
+            self.user = await lastfm.get_user()
+        return self.user
 
     async def validate_scrobble_state(self) -> bool:
         if not self.scrobble_enabled:
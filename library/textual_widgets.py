@@ -1,8 +1,11 @@
+import calendar
 from collections import defaultdict
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any
 
+from loguru import logger
+
 from pydantic import BaseModel
 from rich.console import Group
 from rich.panel import Panel
@@ -18,11 +21,10 @@ from core import config
 from core.database import get_db
 from library.dependencies import get_lastfm_service, get_sync_service
 from library.session_scrobbles import SessionScrobbles
-from models.db import Scrobble
 from models.schemas import Track, LastFmTrack
 from repositories.filters import ScrobbleFilter
 from repositories.scrobble_repo import ScrobbleRepository
-from services.lastfm_service import LastFmService, get_lastfm_user
+from services.lastfm_service import LastFmService
 from services.sync_service import SyncService
 
 css = """
@@ -467,24 +469,24 @@ class ManualScrobbleWidget(BaseDbWidget):
             return
 
         to_db = []
-        successful_count = 0
 
-        for t in self.tracks:
-            try:
-                scrobbled_track = await self.lastfm_service.scrobble(t, t.time_to_scrobble)
-                if scrobbled_track:
-                    db_obj = Scrobble(
-                        track_name=scrobbled_track.name,
-                        artist_name=scrobbled_track.artist,
-                        album_name=scrobbled_track.album,
-                        scrobbled_at=scrobbled_track.scrobbled_at,
-                    )
-                    to_db.append(db_obj)
-                    successful_count += 1
-                else:
-                    self.notify(f"Failed to scrobble: {t.display_name}", severity="warning")
-            except Exception as e:
-                self.notify(f"Error scrobbling {t.display_name}: {str(e)}", severity="error")
+        try:
+            results = await self.lastfm_service.scrobble_many([(t, t.time_to_scrobble) for t in self.tracks])
+        except Exception as e:
+            self.notify(f"Error scrobbling tracks: {str(e)}", severity="error")
+            results = []
+
+        for result in results:
+            if result.accepted:
+                to_db.append({
+                    "track_name": result.scrobble.name,
+                    "artist_name": result.scrobble.artist,
+                    "album_name": result.scrobble.album,
+                    "scrobbled_at": result.scrobble.scrobbled_at,
+                })
+            else:
+                reason = result.error or result.ignored_message or "ignored by Last.fm"
+                self.notify(f"Failed to scrobble {result.track.display_name}: {reason}", severity="warning")
 
         if len(to_db) > 0:
             if not self.db_connected:
@@ -494,8 +496,8 @@ class ManualScrobbleWidget(BaseDbWidget):
 
             try:
                 repo = ScrobbleRepository()
-                await repo.add_and_commit(to_db)
-                self.notify(f"✓ Scrobbled and saved {len(to_db)} tracks to database")
+                saved = await repo.insert_scrobbles(to_db)
+                self.notify(f"✓ Scrobbled and saved {saved} tracks to database")
             except Exception as e:
                 self.notify(f"Error saving to database: {str(e)}", severity="error")
         else:
@@ -537,7 +539,8 @@ class ManualScrobbleWidget(BaseDbWidget):
             return
 
         if album and album.tracks:
-            self.tracks = album.tracks
+            # the album may be shared through the memo and response cache, so scrobble times go on copies
+            self.tracks = [t.model_copy(deep=True) for t in album.tracks]
             current_listened_at = listened_at
             tracks_list = ""
 
@@ -589,7 +592,7 @@ class LastFmUserWidget(BaseLastfmWidget):
             return
 
         try:
-            user_info = await get_lastfm_user()
+            user_info = await self.lastfm_service.get_user()
         except Exception as e:
             self.update(Panel(f"[red]Error loading user info: {str(e)}[/red]", title="Error"))
             return
@@ -611,11 +614,12 @@ class LastFmUserWidget(BaseLastfmWidget):
         user_table.add_row("Subscriber", "Yes" if user_info.subscriber == "1" else "No")
         user_table.add_row("Profile URL", str(user_info.url))
 
+        self.update(user_table)
+
         try:
             recent_tracks = await self.lastfm_service.get_user_recent_tracks()
         except Exception as e:
-            self.update(user_table)  # Show user info even if tracks fail
-            return
+            return  # Show user info even if tracks fail
 
         tracks_table = Table(title="Recent Scrobbles", expand=True)
         tracks_table.add_column("Track", style="white", width=30)
@@ -634,6 +638,25 @@ class LastFmUserWidget(BaseLastfmWidget):
         combined_display = Group(user_table, "", tracks_table)
         self.update(combined_display)
 
+        loved_table = Table(title="Loved Tracks", expand=True)
+        loved_table.add_column("Track", style="white", width=30)
+        loved_table.add_column("Artist", style="cyan", width=25)
+        loved_table.add_column("Loved", style="green", width=20)
+
+        # show each page of loved tracks as it arrives
+        page_size = 10
+        try:
+            async for t in self.lastfm_service.iter_user_loved_tracks(page_size=page_size, max_items=50):
+                loved_table.add_row(t.name, t.artist, t.loved_at)
+                if loved_table.row_count % page_size == 0:
+                    self.update(Group(user_table, "", tracks_table, "", loved_table))
+        except Exception as e:
+            # keep whatever was loaded
+            logger.error(f"Failed to load loved tracks: {e}")
+            self.notify(f"Error loading loved tracks: {str(e)}", severity="error")
+
+        self.update(Group(user_table, "", tracks_table, "", loved_table))
+
 
 class WrappedWidget(BaseDbWidget):
     def __init__(self, db_connected: bool = False):
@@ -641,9 +664,12 @@ class WrappedWidget(BaseDbWidget):
             id=TuiViews.WRAPPED,
             db_connected=db_connected,
         )
-        self.years = list(range(datetime.now().year, datetime.now().year))
         self.cached_year = None
         self.cached_result = None
+        # both caches hold until a scrobble is added, i.e. the latest scrobble id changes
+        self.cached_scrobble_id = None
+        self.yearly_summary = None
+        self.yearly_summary_scrobble_id = None
 
     @work
     async def get_wrapped_by_year(self, year: int) -> None:
@@ -651,33 +677,34 @@ class WrappedWidget(BaseDbWidget):
             self.update("Database not connected")
             return
 
-        if self.cached_year == year and self.cached_result:
-            self.update(self.cached_result)
-            return
-
-        self.update(f"Crunching your wrapped data for {year}...")
-
         async with get_db() as session:
             repo = ScrobbleRepository(session)
+            latest_scrobble_id = await repo.get_latest_scrobble_id()
 
-            overview = await repo.get_year_overview(year)
+            if self.cached_year == year and self.cached_result and self.cached_scrobble_id == latest_scrobble_id:
+                self.update(self.cached_result)
+                return
 
-            year_comparison_data = []
-            for year_item in sorted(self.years, reverse=True):
-                total = await repo.get_total_scrobbles_by_year(year_item)
-                artists = await repo.get_unique_artists_by_year(year_item)
-                tracks = await repo.get_unique_tracks_by_year(year_item)
-                albums = await repo.get_unique_albums_by_year(year_item)
-                avg_per_day = total / 365 if total > 0 else 0
-
-                year_comparison_data.append({
-                    'year': year_item,
-                    'total': total,
-                    'artists': artists,
-                    'tracks': tracks,
-                    'albums': albums,
-                    'avg_per_day': avg_per_day
-                })
+            self.update(f"Crunching your wrapped data for {year}...")
+
+            overview = await repo.get_year_overview(year)
+            plays_by_weekday_and_hour = await repo.get_plays_by_weekday_and_hour(year)
+
+            if self.yearly_summary is None or self.yearly_summary_scrobble_id != latest_scrobble_id:
+                self.yearly_summary = await repo.get_yearly_summary()
+                self.yearly_summary_scrobble_id = latest_scrobble_id
+
+        year_comparison_data = [
+            {
+                'year': row.year,
+                'total': row.total,
+                'artists': row.artists,
+                'tracks': row.tracks,
+                'albums': row.albums,
+                'avg_per_day': row.total / 365 if row.total > 0 else 0
+            }
+            for row in self.yearly_summary
+        ]
 
         header = Text()
         header.append(f"\nTotal Scrobbles: ", style="white")
@@ -776,6 +803,19 @@ class WrappedWidget(BaseDbWidget):
             fun_facts.append(f" with ", style="white")
             fun_facts.append(f"{count:,} scrobbles", style="bold yellow")
 
+        if plays_by_weekday_and_hour:
+            plays_by_weekday = defaultdict(int)
+            plays_by_hour = defaultdict(int)
+            for weekday, hour, count in plays_by_weekday_and_hour:
+                plays_by_weekday[weekday] += count
+                plays_by_hour[hour] += count
+            busiest_weekday = max(plays_by_weekday, key=plays_by_weekday.get)
+            busiest_hour = max(plays_by_hour, key=plays_by_hour.get)
+            fun_facts.append(f"\n🕒 Busiest listening: ", style="white")
+            fun_facts.append(f"{calendar.day_name[busiest_weekday - 1]}s", style="bold cyan")
+            fun_facts.append(f" around ", style="white")
+            fun_facts.append(f"{busiest_hour:02d}:00", style="bold yellow")
+
         avg_per_day = overview['total_scrobbles'] / 365 if overview['total_scrobbles'] > 0 else 0
         fun_facts.append(f"\n📊 Average per day: ", style="white")
         fun_facts.append(f"{avg_per_day:.1f} scrobbles", style="bold cyan")
@@ -824,6 +864,7 @@ class WrappedWidget(BaseDbWidget):
 
         self.cached_year = year
         self.cached_result = combined
+        self.cached_scrobble_id = latest_scrobble_id
         self.notify(f"Wrapped data for {year} is ready")
 
 
@@ -849,6 +890,7 @@ class SyncScrobblesWidget(BaseDbWidget):
         )
 
         self.sync_button = Button("Sync Scrobbles", id="sync-scrobbles")
+        self.resume_button = Button("Resume Last Sync", id="resume-sync")
         self.sync_ref_data_button = Button("Sync Reference Data", id="sync-ref-data")
         self.clear_button = Button("Clear", id="clear-sync")
 
@@ -862,6 +904,7 @@ class SyncScrobblesWidget(BaseDbWidget):
         await self.mount(self.time_to_input)
 
         quick_select = Container(
+            Button("New Since Last Sync", id="quick-new"),
             Button("Last 7 Days", id="quick-7days"),
             Button("Last 30 Days", id="quick-30days"),
             Button("This Year", id="quick-this-year"),
@@ -874,6 +917,7 @@ class SyncScrobblesWidget(BaseDbWidget):
         await self.mount(
             Container(
                 self.sync_button,
+                self.resume_button,
                 self.sync_ref_data_button,
                 self.clear_button,
                 classes="controls"
@@ -893,10 +937,12 @@ class SyncScrobblesWidget(BaseDbWidget):
         self.result_display.update("")
 
     @work
-    async def handle_sync_scrobbles(self):
+    async def handle_sync_scrobbles(self, resume: bool = False, incremental: bool = False):
         """
         Sync scrobbles from Last.fm API to database.
         Converts user input dates and calls the sync service.
+        With `resume`, the inputs are ignored and the last unfinished sync is continued.
+        With `incremental`, only scrobbles newer than the database and the start date are fetched.
         """
         if not self.db_connected or not self.sync_service:
             self.update_display("[red]Error: Database not connected or service not initialized[/red]")
@@ -921,7 +967,10 @@ class SyncScrobblesWidget(BaseDbWidget):
             result = await self.sync_service.sync_scrobbles(
                 time_from=time_from,
                 time_to=time_to,
-                clean=True
+                clean=True,
+                workers=config.SYNC_WORKERS,
+                resume=resume,
+                incremental=incremental,
             )
 
             fetched = result.get("fetched_scrobbles", 0)
@@ -930,6 +979,10 @@ class SyncScrobblesWidget(BaseDbWidget):
             date_range = f"from {time_from}" if time_from else "all history"
             if time_to:
                 date_range = f"{date_range} to {time_to}"
+            if resume:
+                date_range = "resumed last sync"
+            elif incremental:
+                date_range = f"{date_range}, new since last sync" if time_from else "new since last sync"
 
             message = f"""[green]✓ Sync Complete![/green]
 
@@ -957,11 +1010,16 @@ Saved: {saved} new scrobbles to database
             return
 
         try:
-            self.update_display("[cyan]Syncing reference data...\nThis may take a while due to Last.fm API rate limits (1 request/second).[/cyan]")
+            self.update_display("[cyan]Syncing reference data...\nThis may take a while due to Last.fm API rate limits.[/cyan]")
 
-            await self.sync_service.sync_all_ref_data()
+            result = await self.sync_service.sync_all_ref_data()
 
-            message = "[green]✓ Reference data sync complete![/green]\nArtist bios, tags, similar artists, and stats have been updated."
+            message = (
+                "[green]✓ Reference data sync complete![/green]\n"
+                f"Synced {result['synced_artists']} artists, {result['synced_albums']} albums "
+                f"and {result['synced_tracks']} tracks.\n"
+                "Artist bios, tags, similar artists, and stats have been updated."
+            )
             self.update_display(message)
             self.notify("Reference data sync complete")
             self.reset_inputs()
@@ -975,17 +1033,26 @@ Saved: {saved} new scrobbles to database
         today = datetime.now()
 
         match event.button.id:
-            case "quick-this-year":
-                self.time_from_input.value = f"{today.year}-01-01"
-                self.time_to_input.value = f"{today.year}-12-31"
-            case "quick-30days":
-                thirty_days_ago = today - timedelta(days=30)
-                self.time_from_input.value = thirty_days_ago.strftime("%Y-%m-%d")
+            case "quick-new":
+                self.time_from_input.value = ""
                 self.time_to_input.value = ""
+                self.handle_sync_scrobbles(incremental=True)
+            # ranges up to today only need what is newer than the database
             case "quick-7days":
                 seven_days_ago = today - timedelta(days=7)
                 self.time_from_input.value = seven_days_ago.strftime("%Y-%m-%d")
                 self.time_to_input.value = ""
+                self.handle_sync_scrobbles(incremental=True)
+            case "quick-30days":
+                thirty_days_ago = today - timedelta(days=30)
+                self.time_from_input.value = thirty_days_ago.strftime("%Y-%m-%d")
+                self.time_to_input.value = ""
+                self.handle_sync_scrobbles(incremental=True)
+            case "quick-this-year":
+                self.time_from_input.value = f"{today.year}-01-01"
+                self.time_to_input.value = ""
+                self.handle_sync_scrobbles(incremental=True)
+            # backfills: fill in the range, synced in full with Sync Scrobbles
             case "quick-last-year":
                 last_year = today.year - 1
                 self.time_from_input.value = f"{last_year}-01-01"
@@ -995,6 +1062,8 @@ Saved: {saved} new scrobbles to database
                 self.time_to_input.value = ""
             case "sync-scrobbles":
                 self.handle_sync_scrobbles()
+            case "resume-sync":
+                self.handle_sync_scrobbles(resume=True)
             case "sync-ref-data":
                 self.handle_sync_ref_data()
             case "clear-sync":
@@ -55,10 +55,3 @@ async def internet(timeout=3):
                 continue
 
     return False
-
-
-def lastfm_friendly(input: str) -> str:
-    # Last.fm API has issues with '+' in artist/track/album names
-    # Because '+' is interpreted as a space, we need to encode it as '%2B'.
-    return input.replace("+", "%2B")
-
@@ -0,0 +1,98 @@
+import asyncio
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from loguru import logger
+
+_DONE = object()
+
+
+class WorkerPool:
+    """
+    Runs `handler` over a stream of items with a fixed number of concurrent workers.
+
+    A producer feeds the items into a bounded queue, so a large source is consumed
+    only as fast as the workers keep up. Failed items are retried with backoff when
+    `retry_on` says the error is transient, and are otherwise logged and counted.
+    """
+    def __init__(
+            self,
+            name: str,
+            handler: Callable[[Any], Awaitable[None]],
+            workers: int = 4,
+            max_retries: int = 3,
+            retry_on: Callable[[Exception], bool] = lambda e: False,
+            progress_every: int = 100,
+    ):
+        self.name = name
+        self.handler = handler
+        self.workers = max(workers, 1)
+        self.max_retries = max_retries
+        self.retry_on = retry_on
+        self.progress_every = progress_every
+
+        self.processed = 0
+        self.failed = 0
+        self.retries = 0
+        self._started_at = 0.0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "processed": self.processed,
+            "failed": self.failed,
+            "retries": self.retries,
+        }
+
+    async def run(self, items: AsyncIterator[Any]) -> dict[str, int]:
+        self._started_at = time.monotonic()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.workers * 2)
+
+        async def work():
+            while (item := await queue.get()) is not _DONE:
+                await self._process(item)
+
+        logger.info(f"Starting {self.name} with {self.workers} workers...")
+        tasks = [asyncio.create_task(work()) for _ in range(self.workers)]
+        try:
+            async for item in items:
+                await queue.put(item)
+            for _ in tasks:
+                await queue.put(_DONE)
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        self._log_progress()
+        return self.stats()
+
+    async def _process(self, item: Any) -> None:
+        attempt = 0
+        while True:
+            try:
+                await self.handler(item)
+                break
+            except Exception as e:
+                if attempt < self.max_retries and self.retry_on(e):
+                    attempt += 1
+                    self.retries += 1
+                    logger.warning(f"{self.name}: retrying {item} ({attempt}/{self.max_retries}) after error: {e}")
+                    await asyncio.sleep(2 ** (attempt - 1))
+                    continue
+
+                self.failed += 1
+                logger.error(f"{self.name}: failed on {item}: {e}")
+                break
+
+        self.processed += 1
+        if self.processed % self.progress_every == 0:
+            self._log_progress()
+
+    def _log_progress(self) -> None:
+        elapsed = time.monotonic() - self._started_at
+        rate = self.processed / elapsed if elapsed else 0.0
+        logger.info(
+            f"{self.name}: {self.processed} processed, {self.failed} failed, "
+            f"{self.retries} retries ({rate:.1f}/s)."
+        )
@@ -5,20 +5,18 @@ import sys
 
 from loguru import logger
 
+from core.database import session_manager
 from library.comparison import Comparison
+from library.dependencies import get_history_service, get_lastfm_service, get_spotify_service, close_services
 from library.integrations import Integration
 from library.session_scrobbles import SessionScrobbles
 from models.schemas import Track, AppleMusicTrack, SpotifyTrack
 from services.apple_music_service import poll_apple_music
-from services.lastfm_service import LastFmService
-from services.spotify_service import SpotifyService
 from library.utils import internet
 
 bar = "=" * 110
 loop = True
 active_integration = Integration.APPLE_MUSIC
-lastfm = LastFmService()
-spotify = SpotifyService()
 session = SessionScrobbles()
 
 
@@ -40,7 +38,8 @@ async def log_current_song(current_song: Track) -> None:
         logger.info("No internet connection. Cannot get scrobbles for current track...")
         return
 
-    scrobbles = await lastfm.current_track_user_scrobbles(current_song)
+    history = await get_history_service()
+    scrobbles = await history.current_track_user_scrobbles(current_song)
     if scrobbles is False:
         return
 
@@ -60,13 +59,21 @@ async def run() -> None:
     """
     current_song = None
     poll_service = None
+    lastfm = await get_lastfm_service()
+
+    # optional: with a synced database, scrobble history is read locally instead of from Last.fm
+    try:
+        await session_manager.init_db()
+        logger.info("Database connection successful.")
+    except Exception as e:
+        logger.warning(f"Could not connect to database, scrobble history will come from Last.fm: {e}")
 
     if active_integration == Integration.APPLE_MUSIC:
         current_song: AppleMusicTrack | None
         poll_service = poll_apple_music
     elif active_integration == Integration.SPOTIFY:
         current_song: SpotifyTrack | None
-        poll_service = spotify.poll_spotify
+        poll_service = (await get_spotify_service()).poll_spotify
 
     while loop:
         poll = await poll_service()
@@ -131,7 +138,9 @@ async def stop() -> None:
     global loop
     new_line()
 
-    await session.process_pending_scrobbles(lastfm_service=lastfm)
+    await session.process_pending_scrobbles(lastfm_service=await get_lastfm_service())
+    await close_services()
+    await session_manager.close_db()
     new_line()
 
     print(session.get_session_summary())
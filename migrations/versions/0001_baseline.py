@@ -0,0 +1,219 @@
+"""Baseline: the schema before migrations existed
+
+Written out as it stood then, so each later revision is the only one that adds its objects.
+A database the app created before migrations existed is already at this revision:
+mark it with `alembic stamp 0001`, then `alembic upgrade head`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "album_tags",
+        sa.Column("album_name", sa.String(), nullable=False),
+        sa.Column("tag", sa.String(), nullable=False),
+        sa.Column("artist_name", sa.String(), nullable=False),
+        sa.Column("weight", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_album_tags_album_name", "album_tags", ["album_name"])
+    op.create_index("ix_album_tags_artist_name", "album_tags", ["artist_name"])
+    op.create_index("ix_album_tags_id", "album_tags", ["id"])
+    op.create_index("ix_album_tags_tag", "album_tags", ["tag"])
+
+    op.create_table(
+        "album_tracks",
+        sa.Column("album_name", sa.String(), nullable=False),
+        sa.Column("track_name", sa.String(), nullable=False),
+        sa.Column("artist_name", sa.String(), nullable=False),
+        sa.Column("order", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_album_tracks_album_name", "album_tracks", ["album_name"])
+    op.create_index("ix_album_tracks_artist_name", "album_tracks", ["artist_name"])
+    op.create_index("ix_album_tracks_id", "album_tracks", ["id"])
+    op.create_index("ix_album_tracks_track_name", "album_tracks", ["track_name"])
+
+    op.create_table(
+        "albums",
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("artist_name", sa.String(), nullable=False),
+        sa.Column("mbid", sa.String(), nullable=True),
+        sa.Column("url", sa.String(), nullable=True),
+        sa.Column("wiki", sa.String(), nullable=True),
+        sa.Column("cover_image", sa.String(), nullable=True),
+        sa.Column("user_playcount", sa.Integer(), nullable=True),
+        sa.Column("listener_count", sa.Integer(), nullable=True),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_albums_id", "albums", ["id"])
+    op.create_index("ix_albums_mbid", "albums", ["mbid"])
+
+    op.create_table(
+        "artist_tags",
+        sa.Column("artist_name", sa.String(), nullable=False),
+        sa.Column("tag", sa.String(), nullable=False),
+        sa.Column("weight", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_artist_tags_artist_name", "artist_tags", ["artist_name"])
+    op.create_index("ix_artist_tags_id", "artist_tags", ["id"])
+    op.create_index("ix_artist_tags_tag", "artist_tags", ["tag"])
+
+    op.create_table(
+        "artist_top_albums",
+        sa.Column("artist_name", sa.String(), nullable=False),
+        sa.Column("album_name", sa.String(), nullable=False),
+        sa.Column("weight", sa.Integer(), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_artist_top_albums_album_name", "artist_top_albums", ["album_name"])
+    op.create_index("ix_artist_top_albums_artist_name", "artist_top_albums", ["artist_name"])
+    op.create_index("ix_artist_top_albums_id", "artist_top_albums", ["id"])
+
+    op.create_table(
+        "artist_top_tracks",
+        sa.Column("artist_name", sa.String(), nullable=False),
+        sa.Column("track_name", sa.String(), nullable=False),
+        sa.Column("weight", sa.Integer(), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_artist_top_tracks_artist_name", "artist_top_tracks", ["artist_name"])
+    op.create_index("ix_artist_top_tracks_id", "artist_top_tracks", ["id"])
+    op.create_index("ix_artist_top_tracks_track_name", "artist_top_tracks", ["track_name"])
+
+    op.create_table(
+        "artists",
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("mbid", sa.String(), nullable=True),
+        sa.Column("url", sa.String(), nullable=True),
+        sa.Column("bio", sa.String(), nullable=True),
+        sa.Column("user_playcount", sa.Integer(), nullable=True),
+        sa.Column("listener_count", sa.Integer(), nullable=True),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_artists_id", "artists", ["id"])
+    op.create_index("ix_artists_mbid", "artists", ["mbid"])
+    op.create_index("ix_artists_name", "artists", ["name"], unique=True)
+
+    op.create_table(
+        "scrobbles",
+        sa.Column("track_name", sa.String(), nullable=False),
+        sa.Column("artist_name", sa.String(), nullable=False),
+        sa.Column("album_name", sa.String(), nullable=True),
+        sa.Column("scrobbled_at", sa.DateTime(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_scrobbles_artist_name", "scrobbles", ["artist_name"])
+    op.create_index("ix_scrobbles_id", "scrobbles", ["id"])
+    op.create_index("ix_scrobbles_track_name", "scrobbles", ["track_name"])
+
+    op.create_table(
+        "similar_artists",
+        sa.Column("artist_name", sa.String(), nullable=False),
+        sa.Column("similar_artist_name", sa.String(), nullable=False),
+        sa.Column("match", sa.Float(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_similar_artists_artist_name", "similar_artists", ["artist_name"])
+    op.create_index("ix_similar_artists_id", "similar_artists", ["id"])
+    op.create_index("ix_similar_artists_similar_artist_name", "similar_artists", ["similar_artist_name"])
+
+    op.create_table(
+        "similar_tracks",
+        sa.Column("track_name", sa.String(), nullable=False),
+        sa.Column("artist_name", sa.String(), nullable=False),
+        sa.Column("similar_track_name", sa.String(), nullable=False),
+        sa.Column("similar_track_artist_name", sa.String(), nullable=False),
+        sa.Column("match", sa.Float(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_similar_tracks_artist_name", "similar_tracks", ["artist_name"])
+    op.create_index("ix_similar_tracks_id", "similar_tracks", ["id"])
+    op.create_index("ix_similar_tracks_similar_track_artist_name", "similar_tracks", ["similar_track_artist_name"])
+    op.create_index("ix_similar_tracks_similar_track_name", "similar_tracks", ["similar_track_name"])
+    op.create_index("ix_similar_tracks_track_name", "similar_tracks", ["track_name"])
+
+    op.create_table(
+        "tracks",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("artist_name", sa.String(), nullable=False),
+        sa.Column("album_name", sa.String(), nullable=True),
+        sa.Column("mbid", sa.String(), nullable=True),
+        sa.Column("duration", sa.Integer(), nullable=True),
+        sa.Column("url", sa.String(), nullable=True),
+        sa.Column("wiki", sa.String(), nullable=True),
+        sa.Column("cover_image", sa.String(), nullable=True),
+        sa.Column("user_loved", sa.Boolean(), nullable=False),
+        sa.Column("user_playcount", sa.Integer(), nullable=True),
+        sa.Column("listener_count", sa.Integer(), nullable=True),
+        sa.Column("listener_playcount", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_tracks_artist_name", "tracks", ["artist_name"])
+    op.create_index("ix_tracks_id", "tracks", ["id"])
+    op.create_index("ix_tracks_mbid", "tracks", ["mbid"])
+    op.create_index("ix_tracks_title", "tracks", ["title"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_table("tracks")
+    op.drop_table("similar_tracks")
+    op.drop_table("similar_artists")
+    op.drop_table("scrobbles")
+    op.drop_table("artists")
+    op.drop_table("artist_top_tracks")
+    op.drop_table("artist_top_albums")
+    op.drop_table("artist_tags")
+    op.drop_table("albums")
+    op.drop_table("album_tracks")
+    op.drop_table("album_tags")
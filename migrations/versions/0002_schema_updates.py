@@ -0,0 +1,111 @@
+"""Catch up databases created before migrations existed
+
+Adds what came after the baseline but before migrations: the sync checkpoints, the scrobbles natural key,
+last_synced_at on the reference data, and the daily play count rollups.
+A database created before migrations may already have some of these, from the tables the app creates
+on startup or from scripts/schema_updates.sql, so each is only added when missing.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 10:05:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+REF_DATA_TABLES = ("artists", "albums", "tracks")
+
+# rollup table -> columns of its unique key, after day
+ROLLUP_TABLES = {
+    "daily_artist_plays": ("artist_name",),
+    "daily_album_plays": ("artist_name", "album_name"),
+    "daily_track_plays": ("artist_name", "track_name", "album_name"),
+}
+ROLLUP_UNIQUE_INDEXES = {
+    "daily_artist_plays": "uq_daily_artist_plays_day_artist",
+    "daily_album_plays": "uq_daily_album_plays_day_artist_album",
+    "daily_track_plays": "uq_daily_track_plays_day_artist_track_album",
+}
+
+
+def base_columns() -> list[sa.Column]:
+    """The columns every table gets from BaseTable."""
+    return [
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    ]
+
+
+def upgrade() -> None:
+    # checkpoints of scrobble syncs, so an interrupted backfill can resume.
+    op.create_table(
+        "sync_jobs",
+        sa.Column("job_type", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("time_from", sa.Integer(), nullable=True),
+        sa.Column("time_to", sa.Integer(), nullable=False),
+        sa.Column("cursor", sa.Integer(), nullable=True),
+        sa.Column("window_size", sa.Integer(), nullable=True),
+        sa.Column("window_cursors", sa.JSON(), nullable=False),
+        sa.Column("completed_windows", sa.JSON(), nullable=False),
+        sa.Column("fetched", sa.Integer(), nullable=False),
+        sa.Column("saved", sa.Integer(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        *base_columns(),
+        if_not_exists=True,
+    )
+    for column in ("id", "job_type", "status"):
+        op.create_index(f"ix_sync_jobs_{column}", "sync_jobs", [column], if_not_exists=True)
+
+    # natural key for scrobbles, required by the bulk insert's ON CONFLICT DO NOTHING.
+    # remove existing duplicates first, keeping the oldest row.
+    op.execute(
+        "delete from scrobbles s "
+        "using scrobbles d "
+        "where lower(s.artist_name) = lower(d.artist_name) "
+        "and lower(s.track_name) = lower(d.track_name) "
+        "and s.scrobbled_at = d.scrobbled_at "
+        "and s.id > d.id"
+    )
+    op.execute(
+        "create unique index if not exists uq_scrobbles_artist_track_scrobbled_at "
+        "on scrobbles (lower(artist_name), lower(track_name), scrobbled_at)"
+    )
+
+    # when reference data was last refreshed from Last.fm, for staleness-driven refreshes.
+    for table in REF_DATA_TABLES:
+        op.execute(f"alter table {table} add column if not exists last_synced_at timestamp without time zone")
+        op.execute(f"create index if not exists ix_{table}_last_synced_at on {table} (last_synced_at)")
+
+    # play counts per day, filled by scripts.rebuild_rollups.
+    for table, key in ROLLUP_TABLES.items():
+        op.create_table(
+            table,
+            sa.Column("day", sa.Date(), nullable=False),
+            *(sa.Column(column, sa.String(), nullable=False) for column in key),
+            sa.Column("play_count", sa.Integer(), nullable=False),
+            *base_columns(),
+            if_not_exists=True,
+        )
+        op.create_index(f"ix_{table}_id", table, ["id"], if_not_exists=True)
+        op.create_index(ROLLUP_UNIQUE_INDEXES[table], table, ["day", *key], unique=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for table in ROLLUP_TABLES:
+        op.drop_table(table)
+    for table in REF_DATA_TABLES:
+        op.drop_index(f"ix_{table}_last_synced_at", table_name=table)
+        op.drop_column(table, "last_synced_at")
+    op.drop_index("uq_scrobbles_artist_track_scrobbled_at", table_name="scrobbles")
+    op.drop_table("sync_jobs")
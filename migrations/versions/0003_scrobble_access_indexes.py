@@ -0,0 +1,44 @@
+"""Indexes for case-insensitive name lookups and time-ordered reads of scrobbles
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 10:10:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_scrobbles_scrobbled_at", "scrobbles", ["scrobbled_at"])
+    op.create_index(
+        "ix_scrobbles_lower_artist_scrobbled_at",
+        "scrobbles",
+        [sa.text("lower(artist_name)"), "scrobbled_at"],
+    )
+    op.create_index("ix_scrobbles_lower_track_name", "scrobbles", [sa.text("lower(track_name)")])
+    op.create_index("ix_scrobbles_lower_album_name", "scrobbles", [sa.text("lower(album_name)")])
+    op.create_index(
+        "ix_scrobbles_lower_artist_track_album",
+        "scrobbles",
+        [sa.text("lower(artist_name)"), sa.text("lower(track_name)"), sa.text("lower(album_name)")],
+        postgresql_include=["artist_name", "track_name", "album_name", "id"],
+    )
+    # gathers statistics on the indexed expressions, so the planner can estimate lookups by name
+    op.execute("analyze scrobbles")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_scrobbles_lower_artist_track_album", table_name="scrobbles")
+    op.drop_index("ix_scrobbles_lower_album_name", table_name="scrobbles")
+    op.drop_index("ix_scrobbles_lower_track_name", table_name="scrobbles")
+    op.drop_index("ix_scrobbles_lower_artist_scrobbled_at", table_name="scrobbles")
+    op.drop_index("ix_scrobbles_scrobbled_at", table_name="scrobbles")
@@ -0,0 +1,53 @@
+"""Stored time bucket columns on scrobbles, indexed for grouping
+
+Adding stored generated columns rewrites the scrobbles table once, which takes a while on large libraries.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 11:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# must match the Computed() expressions in models/db.py
+TIME_BUCKETS = {
+    "scrobbled_on": "date generated always as (scrobbled_at::date) stored",
+    "scrobbled_year": "integer generated always as (extract(year from scrobbled_at)::integer) stored",
+    "scrobbled_month": "integer generated always as (extract(month from scrobbled_at)::integer) stored",
+    "scrobbled_hour": "integer generated always as (extract(hour from scrobbled_at)::integer) stored",
+    "scrobbled_weekday": "integer generated always as (extract(isodow from scrobbled_at)::integer) stored",
+}
+
+
+def upgrade() -> None:
+    # one ALTER TABLE, so the table is rewritten once for all columns
+    op.execute(
+        "alter table scrobbles "
+        + ", ".join(f"add column {name} {definition}" for name, definition in TIME_BUCKETS.items())
+    )
+
+    op.create_index("ix_scrobbles_scrobbled_on", "scrobbles", ["scrobbled_on"])
+    op.create_index("ix_scrobbles_year_month", "scrobbles", ["scrobbled_year", "scrobbled_month"])
+    op.create_index(
+        "ix_scrobbles_year_weekday_hour",
+        "scrobbles",
+        ["scrobbled_year", "scrobbled_weekday", "scrobbled_hour"],
+    )
+    op.create_index("ix_scrobbles_artist_year", "scrobbles", ["artist_name", "scrobbled_year"])
+    op.execute("analyze scrobbles")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_scrobbles_artist_year", table_name="scrobbles")
+    op.drop_index("ix_scrobbles_year_weekday_hour", table_name="scrobbles")
+    op.drop_index("ix_scrobbles_year_month", table_name="scrobbles")
+    op.drop_index("ix_scrobbles_scrobbled_on", table_name="scrobbles")
+    op.execute("alter table scrobbles " + ", ".join(f"drop column {name}" for name in TIME_BUCKETS))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float
+from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, Float, JSON, Index, Computed, func
 from sqlalchemy.orm import declarative_base
 from datetime import datetime
 
@@ -19,9 +19,114 @@ class Scrobble(BaseTable):
     album_name = Column(String, nullable=True)
     scrobbled_at = Column(DateTime, default=datetime.now(), nullable=False)
 
+    # Time buckets of scrobbled_at (local time, like scrobbled_at itself), computed by the database,
+    # to group by without evaluating date() or extract() on every row.
+    scrobbled_on = Column(Date, Computed("scrobbled_at::date", persisted=True))
+    scrobbled_year = Column(Integer, Computed("extract(year from scrobbled_at)::integer", persisted=True))
+    scrobbled_month = Column(Integer, Computed("extract(month from scrobbled_at)::integer", persisted=True))
+    scrobbled_hour = Column(Integer, Computed("extract(hour from scrobbled_at)::integer", persisted=True))
+    scrobbled_weekday = Column(Integer, Computed("extract(isodow from scrobbled_at)::integer", persisted=True))  # 1 = Monday
+
     def __repr__(self):
         return f"<Scrobble(track_name='{self.track_name}', artist_name='{self.artist_name}')>"
 
+# Natural key of a scrobble. Case-insensitive, like the sync's dedupe always was,
+# so `INSERT ... ON CONFLICT DO NOTHING` can replace the lookup-then-insert round trip.
+Index(
+    "uq_scrobbles_artist_track_scrobbled_at",
+    func.lower(Scrobble.artist_name),
+    func.lower(Scrobble.track_name),
+    Scrobble.scrobbled_at,
+    unique=True,
+)
+
+# Indexes matching how ScrobbleRepository reads scrobbles: names are compared case-insensitively,
+# and scrobbles are listed newest first or over a time range.
+Index("ix_scrobbles_scrobbled_at", Scrobble.scrobbled_at)
+Index("ix_scrobbles_lower_artist_scrobbled_at", func.lower(Scrobble.artist_name), Scrobble.scrobbled_at)
+Index("ix_scrobbles_lower_track_name", func.lower(Scrobble.track_name))
+Index("ix_scrobbles_lower_album_name", func.lower(Scrobble.album_name))
+Index("ix_scrobbles_scrobbled_on", Scrobble.scrobbled_on)
+Index("ix_scrobbles_year_month", Scrobble.scrobbled_year, Scrobble.scrobbled_month)
+Index("ix_scrobbles_year_weekday_hour", Scrobble.scrobbled_year, Scrobble.scrobbled_weekday, Scrobble.scrobbled_hour)
+Index("ix_scrobbles_artist_year", Scrobble.artist_name, Scrobble.scrobbled_year)
+# Covers top tracks and albums by artist, so they are answered from the index alone.
+Index(
+    "ix_scrobbles_lower_artist_track_album",
+    func.lower(Scrobble.artist_name),
+    func.lower(Scrobble.track_name),
+    func.lower(Scrobble.album_name),
+    postgresql_include=["artist_name", "track_name", "album_name", "id"],
+)
+
+
+class SyncJob(BaseTable):
+    """
+    Checkpoint of a scrobble sync, so an interrupted backfill can resume where it stopped.
+    Timestamps are unix seconds, matching what the Last.fm API takes.
+    """
+    __tablename__ = "sync_jobs"
+
+    job_type = Column(String, index=True, nullable=False)
+    status = Column(String, index=True, nullable=False, default="running")
+    time_from = Column(Integer, nullable=True)
+    time_to = Column(Integer, nullable=False)
+    cursor = Column(Integer, nullable=True)  # time_to of the next page of a sequential sync
+    window_size = Column(Integer, nullable=True)  # seconds; only set for windowed (parallel) syncs
+    window_cursors = Column(JSON, nullable=False, default=dict)  # window start -> oldest timestamp reached
+    completed_windows = Column(JSON, nullable=False, default=list)  # [start, end] pairs
+    incremental = Column(Boolean, nullable=False, default=False)  # stops at the latest stored scrobble
+    fetched = Column(Integer, nullable=False, default=0)
+    saved = Column(Integer, nullable=False, default=0)
+    finished_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<SyncJob(id={self.id}, job_type='{self.job_type}', status='{self.status}')>"
+
+"""
+Rollup tables:
+Play counts per day, kept up to date as scrobbles are inserted, so listening stats over
+a year or any date range read a few thousand rows instead of scanning every scrobble.
+Names are stored exactly as scrobbled. A missing album is stored as '' so it can be part of the unique key.
+"""
+class DailyArtistPlays(BaseTable):
+    __tablename__ = "daily_artist_plays"
+
+    day = Column(Date, nullable=False)
+    artist_name = Column(String, nullable=False)
+    play_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("uq_daily_artist_plays_day_artist", "day", "artist_name", unique=True),
+    )
+
+
+class DailyAlbumPlays(BaseTable):
+    __tablename__ = "daily_album_plays"
+
+    day = Column(Date, nullable=False)
+    artist_name = Column(String, nullable=False)
+    album_name = Column(String, nullable=False, default="")
+    play_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("uq_daily_album_plays_day_artist_album", "day", "artist_name", "album_name", unique=True),
+    )
+
+
+class DailyTrackPlays(BaseTable):
+    __tablename__ = "daily_track_plays"
+
+    day = Column(Date, nullable=False)
+    artist_name = Column(String, nullable=False)
+    track_name = Column(String, nullable=False)
+    album_name = Column(String, nullable=False, default="")
+    play_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("uq_daily_track_plays_day_artist_track_album", "day", "artist_name", "track_name", "album_name", unique=True),
+    )
+
 """
 NOTE: The following tables are designed based on the Last.fm API responses and may not cover all possible fields.
 Also, Last.fm is `name` based... therefore we need to join on names which is not ideal.
@@ -48,6 +153,7 @@ class Track(BaseTable):
     user_playcount = Column(Integer, nullable=True)
     listener_count = Column(Integer, nullable=True)
     listener_playcount = Column(Integer, nullable=True)
+    last_synced_at = Column(DateTime, index=True, nullable=True)  # last refresh from Last.fm
     created_at = Column(DateTime, default=datetime.now(), nullable=False)
     updated_at = Column(DateTime, default=datetime.now(), onupdate=datetime.now(), nullable=False)
 
@@ -76,6 +182,7 @@ class Artist(BaseTable):
     bio = Column(String, nullable=True)
     user_playcount = Column(Integer, nullable=True)
     listener_count = Column(Integer, nullable=True)
+    last_synced_at = Column(DateTime, index=True, nullable=True)  # last refresh from Last.fm
 
     def __repr__(self):
         return f"<Artist(name='{self.name}')>"
@@ -128,6 +235,7 @@ class Album(BaseTable):
     cover_image = Column(String, nullable=True)
     user_playcount = Column(Integer, nullable=True)
     listener_count = Column(Integer, nullable=True)
+    last_synced_at = Column(DateTime, index=True, nullable=True)  # last refresh from Last.fm
 
     def __repr__(self):
         return f"<Album(title='{self.title}', artist_name='{self.artist_name}')>"
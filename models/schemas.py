@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, NamedTuple
 from datetime import datetime
 from enum import Enum
 
@@ -14,6 +14,14 @@ class Artist(BaseModel):
     url: HttpUrl = None
     playcount: str = None
     image_url: str = None
+    mbid: Optional[str] = None
+    bio: Optional[str] = None
+    user_playcount: Optional[int] = None
+    listener_count: Optional[int] = None
+    tags: Optional[list[Any]] = None
+    similar_artists: Optional[list[Any]] = None
+    top_tracks: Optional[list[Any]] = None
+    top_albums: Optional[list[Any]] = None
 
 
 class Album(BaseModel):
@@ -43,7 +51,7 @@ class Track(BaseModel):
     clean_name: Optional[str] = None
     clean_album: Optional[str] = None
     order: Optional[int] = None
-    time_to_scrobble: Optional[str] = None
+    time_to_scrobble: Optional[datetime] = None  # when it was played, for scrobbling it later
 
     class Config:
         extra = "allow"
@@ -177,7 +185,7 @@ class SimilarTrack(BaseModel):
     artist_name: str = None
     similar_track_name: str = None
     similar_track_artist_name: str = None
-    match: int = None
+    match: float = None
 
 
 class LastFmTrack(Track):
@@ -216,6 +224,37 @@ class SpotifyTrack(Track):
     pass
 
 
+class ScrobbleResult(BaseModel):
+    """Outcome of one track in a batch scrobble."""
+    track: Track
+    scrobble: Optional[LastFmTrack] = None  # set when Last.fm accepted it
+    ignored_code: Optional[int] = None
+    ignored_message: Optional[str] = None
+    error: Optional[str] = None  # the whole request failed
+
+    @property
+    def accepted(self) -> bool:
+        return self.scrobble is not None
+
+    @property
+    def retryable(self) -> bool:
+        # code 5: daily scrobble limit exceeded. Other ignored scrobbles would be ignored again.
+        return self.error is not None or self.ignored_code == 5
+
+
+class RecentTrackRow(NamedTuple):
+    """
+    One play from user.getRecentTracks, parsed straight from the JSON response.
+    A plain tuple rather than a model, since syncs push hundreds of thousands of these through.
+    """
+    track_name: str
+    artist_name: str
+    album_name: Optional[str]
+    timestamp: int
+    loved: Optional[bool] = None  # only with extended=1
+    image_url: Optional[str] = None
+
+
 class User(BaseModel):
     name: str
     url: Optional[HttpUrl] = None
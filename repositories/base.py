@@ -1,5 +1,5 @@
 from contextlib import asynccontextmanager
-from typing import Optional, Any
+from typing import Optional, Any, AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncSession
 from core.database import get_db
 
@@ -82,3 +82,13 @@ class BaseRepository:
         async with self._get_session() as session:
             result = await session.execute(query)
             return result
+
+    async def stream(self, query, batch_size: int = 1000) -> AsyncIterator[Any]:
+        """
+        Stream the rows of a query through a server-side cursor, fetching `batch_size` at a time,
+        so large result sets are never loaded into memory at once.
+        """
+        async with self._get_session() as session:
+            result = await session.stream(query.execution_options(yield_per=batch_size))
+            async for row in result:
+                yield row
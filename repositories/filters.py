@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import BaseModel
 from sqlalchemy import Select, select, func
@@ -19,8 +19,8 @@ class ScrobbleFilter(BaseModel):
     artist_name: str | None = None
     album_name: str | None = None
     scrobbled_at: datetime | None = None
-    scrobbled_after: str | None = None  # YYYY-MM-DD
-    scrobbled_before: str | None = None  # YYYY-MM-DD
+    scrobbled_after: date | None = None  # YYYY-MM-DD, inclusive
+    scrobbled_before: date | None = None  # YYYY-MM-DD, exclusive
 
 
 async def build_query(f: ScrobbleFilter | None) -> Select[tuple[Scrobble]]:
@@ -41,13 +41,12 @@ async def build_query(f: ScrobbleFilter | None) -> Select[tuple[Scrobble]]:
     if f.scrobbled_at:
         query = query.where(Scrobble.scrobbled_at == f.scrobbled_at)
 
+    # half-open [after, before) on the raw column, so the range is read from the scrobbled_at index
     if f.scrobbled_after:
-        after_date = datetime.strptime(f.scrobbled_after, "%Y-%m-%d")
-        query = query.where(Scrobble.scrobbled_at >= after_date)
+        query = query.where(Scrobble.scrobbled_at >= datetime.combine(f.scrobbled_after, datetime.min.time()))
 
     if f.scrobbled_before:
-        before_date = datetime.strptime(f.scrobbled_before, "%Y-%m-%d")
-        query = query.where(Scrobble.scrobbled_at <= before_date)
+        query = query.where(Scrobble.scrobbled_at < datetime.combine(f.scrobbled_before, datetime.min.time()))
 
     query = query.order_by(Scrobble.scrobbled_at.desc())
 
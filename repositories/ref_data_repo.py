@@ -51,74 +51,56 @@ class ReferenceDataRepository(BaseRepository):
         result = await self.execute(query)
         return result.scalar_one_or_none()
 
-    async def check_similar_artist(self, artist_name: str, similar_artist_name: str) -> Any:
-        query = (
-            select(SimilarArtist)
-            .where(SimilarArtist.artist_name == artist_name)
-            .where(SimilarArtist.similar_artist_name == similar_artist_name)
-        )
+    async def get_artist_tags(self, artist_name: str) -> dict[str, ArtistTag]:
+        """Get all tags stored for an artist, keyed by tag."""
+        query = select(ArtistTag).where(ArtistTag.artist_name == artist_name)
         result = await self.execute(query)
-        return result.scalar_one_or_none()
+        return {t.tag: t for t in result.scalars().all()}
 
-    async def check_artist_top_track(self, artist_name: str, track_name: str) -> Any:
-        query = (
-            select(ArtistTopTrack)
-            .where(ArtistTopTrack.artist_name == artist_name)
-            .where(ArtistTopTrack.track_name == track_name)
-        )
+    async def get_similar_artists(self, artist_name: str) -> dict[str, SimilarArtist]:
+        """Get all similar artists stored for an artist, keyed by similar artist name."""
+        query = select(SimilarArtist).where(SimilarArtist.artist_name == artist_name)
         result = await self.execute(query)
-        return result.scalar_one_or_none()
+        return {s.similar_artist_name: s for s in result.scalars().all()}
 
-    async def check_artist_top_album(self, artist_name: str, album_name: str) -> Any:
-        query = (
-            select(ArtistTopAlbum)
-            .where(ArtistTopAlbum.artist_name == artist_name)
-            .where(ArtistTopAlbum.album_name == album_name)
-        )
+    async def get_artist_top_tracks(self, artist_name: str) -> dict[str, ArtistTopTrack]:
+        """Get all top tracks stored for an artist, keyed by track name."""
+        query = select(ArtistTopTrack).where(ArtistTopTrack.artist_name == artist_name)
         result = await self.execute(query)
-        return result.scalar_one_or_none()
+        return {t.track_name: t for t in result.scalars().all()}
 
-    async def check_artist_tag(self, artist_name: str, tag: str) -> Any:
-        query = (
-            select(ArtistTag)
-            .where(ArtistTag.artist_name == artist_name)
-            .where(ArtistTag.tag == tag)
-        )
+    async def get_artist_top_albums(self, artist_name: str) -> dict[str, ArtistTopAlbum]:
+        """Get all top albums stored for an artist, keyed by album name."""
+        query = select(ArtistTopAlbum).where(ArtistTopAlbum.artist_name == artist_name)
         result = await self.execute(query)
-        return result.scalar_one_or_none()
+        return {a.album_name: a for a in result.scalars().all()}
 
-    async def check_album_tag(self, album_name: str, tag: str, artist_name: str) -> Any:
+    async def get_album_tags(self, album_name: str, artist_name: str) -> dict[str, AlbumTag]:
+        """Get all tags stored for an album, keyed by tag."""
         query = (
             select(AlbumTag)
             .where(AlbumTag.album_name == album_name)
-            .where(AlbumTag.tag == tag)
             .where(AlbumTag.artist_name == artist_name)
         )
         result = await self.execute(query)
-        return result.scalar_one_or_none()
+        return {t.tag: t for t in result.scalars().all()}
 
-    async def check_album_track(self, album_name: str, track_name: str) -> Any:
+    async def get_album_tracks(self, album_name: str, artist_name: str) -> dict[str, AlbumTrack]:
+        """Get all tracks stored for an album, keyed by track name."""
         query = (
             select(AlbumTrack)
             .where(AlbumTrack.album_name == album_name)
-            .where(AlbumTrack.track_name == track_name)
+            .where(AlbumTrack.artist_name == artist_name)
         )
         result = await self.execute(query)
-        return result.scalar_one_or_none()
+        return {t.track_name: t for t in result.scalars().all()}
 
-    async def check_similar_track(
-            self,
-            track_name: str,
-            artist_name: str,
-            similar_track_name: str,
-            similar_track_artist_name: str
-    ) -> Any:
+    async def get_similar_tracks(self, track_name: str, artist_name: str) -> dict[tuple[str, str], SimilarTrack]:
+        """Get all similar tracks stored for a track, keyed by (similar track name, similar track artist name)."""
         query = (
             select(SimilarTrack)
             .where(SimilarTrack.track_name == track_name)
             .where(SimilarTrack.artist_name == artist_name)
-            .where(SimilarTrack.similar_track_name == similar_track_name)
-            .where(SimilarTrack.similar_track_artist_name == similar_track_artist_name)
         )
         result = await self.execute(query)
-        return result.scalar_one_or_none()
+        return {(s.similar_track_name, s.similar_track_artist_name): s for s in result.scalars().all()}
@@ -0,0 +1,341 @@
+from collections import Counter
+from datetime import date, datetime
+from typing import Any, Optional
+
+from loguru import logger
+from sqlalchemy import select, func, desc, delete, extract, insert as sql_insert, Row, JSON, Integer, literal, true
+from sqlalchemy.dialects.postgresql import insert, aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.db import DailyAlbumPlays, DailyArtistPlays, DailyTrackPlays, Scrobble
+from repositories.base import BaseRepository
+
+# keeps a multi-row INSERT well under asyncpg's 32767 bind parameter limit
+INSERT_CHUNK_SIZE = 1000
+
+
+def _in_range(day_column, date_from: Optional[date], date_to: Optional[date]) -> list:
+    """Conditions for a half-open [date_from, date_to) range; either end may be open."""
+    conditions = []
+    if date_from is not None:
+        conditions.append(day_column >= date_from)
+    if date_to is not None:
+        conditions.append(day_column < date_to)
+    return conditions
+
+
+def _range_label(date_from: Optional[date], date_to: Optional[date]) -> str:
+    if date_from is None and date_to is None:
+        return "all time"
+    return f"[{date_from or '...'}, {date_to or '...'})"
+
+
+class RollupRepository(BaseRepository):
+    """
+    Repository for the daily play count rollups of the scrobbles table.
+
+    `add_plays` is called by `ScrobbleRepository` in the same transaction that inserts the
+    scrobbles, so the rollups never drift from the scrobbles they count. After editing
+    scrobbles by hand (e.g. `scripts/scrobble_updates.sql`), run `scripts.rebuild_rollups`.
+    """
+    def __init__(self, db: Optional[AsyncSession] = None):
+        super().__init__(db)
+
+    async def add_plays(self, rows: list[Row | dict[str, Any]]) -> None:
+        """
+        Count newly inserted scrobbles into the rollups. Rows have artist_name, track_name,
+        album_name and scrobbled_at. Runs in the repository's session and leaves the commit to the caller.
+        """
+        artists, albums, tracks = Counter(), Counter(), Counter()
+        for row in rows:
+            row = row if isinstance(row, dict) else row._mapping
+            day = row["scrobbled_at"].date()
+            album_name = row["album_name"] or ""
+            artists[(day, row["artist_name"])] += 1
+            albums[(day, row["artist_name"], album_name)] += 1
+            tracks[(day, row["artist_name"], row["track_name"], album_name)] += 1
+
+        now = datetime.now()
+        # Upsert in key order, so concurrent inserts lock shared rollup rows in the same order
+        # and wait for each other instead of deadlocking.
+        async with self._get_session() as session:
+            for model, keys, counts in (
+                (DailyArtistPlays, ("day", "artist_name"), artists),
+                (DailyAlbumPlays, ("day", "artist_name", "album_name"), albums),
+                (DailyTrackPlays, ("day", "artist_name", "track_name", "album_name"), tracks),
+            ):
+                values = [
+                    {**dict(zip(keys, key)), "play_count": count, "created_at": now, "updated_at": now}
+                    for key, count in sorted(counts.items())
+                ]
+                for i in range(0, len(values), INSERT_CHUNK_SIZE):
+                    query = insert(model).values(values[i:i + INSERT_CHUNK_SIZE])
+                    query = query.on_conflict_do_update(
+                        index_elements=list(keys),
+                        set_={
+                            "play_count": model.play_count + query.excluded.play_count,
+                            "updated_at": now,
+                        },
+                    )
+                    await session.execute(query)
+
+    async def rebuild(self, date_from: date = None, date_to: date = None) -> dict[str, int]:
+        """
+        Recount the rollups from the scrobbles table for [date_from, date_to), or for all time.
+        Returns the number of rollup rows written per table.
+        """
+        day = Scrobble.scrobbled_on
+        album_name = func.coalesce(Scrobble.album_name, "")
+        scrobble_range = _in_range(Scrobble.scrobbled_at, date_from, date_to)
+
+        sources = (
+            (DailyArtistPlays, [day, Scrobble.artist_name], ["day", "artist_name"]),
+            (DailyAlbumPlays, [day, Scrobble.artist_name, album_name], ["day", "artist_name", "album_name"]),
+            (DailyTrackPlays, [day, Scrobble.artist_name, Scrobble.track_name, album_name], ["day", "artist_name", "track_name", "album_name"]),
+        )
+
+        written = {}
+        async with self._get_session() as session:
+            for model, columns, names in sources:
+                await session.execute(delete(model).where(*_in_range(model.day, date_from, date_to)))
+                source = (
+                    select(*columns, func.count(Scrobble.id), func.localtimestamp(), func.localtimestamp())
+                    .where(*scrobble_range)
+                    .group_by(*columns)
+                )
+                result = await session.execute(
+                    sql_insert(model).from_select([*names, "play_count", "created_at", "updated_at"], source)
+                )
+                written[model.__tablename__] = result.rowcount
+            await session.commit()
+
+        logger.info(f"Rebuilt rollups in {_range_label(date_from, date_to)}: {written}")
+        return written
+
+    async def get_top_artists(self, date_from: date, date_to: date, limit: int = 10) -> list[Row[tuple[str, int]]]:
+        play_count = func.sum(DailyArtistPlays.play_count).label('play_count')
+        query = (
+            select(DailyArtistPlays.artist_name, play_count)
+            .where(*_in_range(DailyArtistPlays.day, date_from, date_to))
+            .group_by(DailyArtistPlays.artist_name)
+            .order_by(desc('play_count'))
+            .limit(limit)
+        )
+        result = await self.execute(query)
+        return list(result.all())
+
+    async def get_top_albums(self, date_from: date, date_to: date, limit: int = 10) -> list[Row[tuple[str, str, int]]]:
+        play_count = func.sum(DailyAlbumPlays.play_count).label('play_count')
+        query = (
+            select(
+                func.nullif(DailyAlbumPlays.album_name, "").label('album_name'),
+                DailyAlbumPlays.artist_name,
+                play_count,
+            )
+            .where(*_in_range(DailyAlbumPlays.day, date_from, date_to))
+            .group_by(DailyAlbumPlays.album_name, DailyAlbumPlays.artist_name)
+            .order_by(desc('play_count'))
+            .limit(limit)
+        )
+        result = await self.execute(query)
+        return list(result.all())
+
+    async def get_top_tracks(self, date_from: date, date_to: date, limit: int = 10) -> list[Row[tuple[str, str, str, int]]]:
+        play_count = func.sum(DailyTrackPlays.play_count).label('play_count')
+        query = (
+            select(
+                DailyTrackPlays.track_name,
+                DailyTrackPlays.artist_name,
+                func.nullif(DailyTrackPlays.album_name, "").label('album_name'),
+                play_count,
+            )
+            .where(*_in_range(DailyTrackPlays.day, date_from, date_to))
+            .group_by(DailyTrackPlays.track_name, DailyTrackPlays.artist_name, DailyTrackPlays.album_name)
+            .order_by(desc('play_count'))
+            .limit(limit)
+        )
+        result = await self.execute(query)
+        return list(result.all())
+
+    async def get_total_plays(self, date_from: date, date_to: date) -> int:
+        query = (
+            select(func.sum(DailyArtistPlays.play_count))
+            .where(*_in_range(DailyArtistPlays.day, date_from, date_to))
+        )
+        result = await self.execute(query)
+        return result.scalar() or 0
+
+    async def get_unique_artists(self, date_from: date, date_to: date) -> int:
+        query = (
+            select(func.count(func.distinct(DailyArtistPlays.artist_name)))
+            .where(*_in_range(DailyArtistPlays.day, date_from, date_to))
+        )
+        result = await self.execute(query)
+        return result.scalar() or 0
+
+    async def get_unique_tracks(self, date_from: date, date_to: date) -> int:
+        query = (
+            select(func.count(func.distinct(DailyTrackPlays.track_name)))
+            .where(*_in_range(DailyTrackPlays.day, date_from, date_to))
+        )
+        result = await self.execute(query)
+        return result.scalar() or 0
+
+    async def get_unique_albums(self, date_from: date, date_to: date) -> int:
+        query = (
+            select(func.count(func.distinct(func.nullif(DailyAlbumPlays.album_name, ""))))
+            .where(*_in_range(DailyAlbumPlays.day, date_from, date_to))
+        )
+        result = await self.execute(query)
+        return result.scalar() or 0
+
+    async def get_plays_by_month(self, date_from: date, date_to: date) -> list[Row[tuple[int, int]]]:
+        month = extract('month', DailyArtistPlays.day).label('month')
+        query = (
+            select(month, func.sum(DailyArtistPlays.play_count).label('count'))
+            .where(*_in_range(DailyArtistPlays.day, date_from, date_to))
+            .group_by(month)
+            .order_by(month)
+        )
+        result = await self.execute(query)
+        return list(result.all())
+
+    async def get_most_active_day(self, date_from: date, date_to: date) -> Optional[Row[tuple[date, int]]]:
+        query = (
+            select(DailyArtistPlays.day.label('date'), func.sum(DailyArtistPlays.play_count).label('count'))
+            .where(*_in_range(DailyArtistPlays.day, date_from, date_to))
+            .group_by(DailyArtistPlays.day)
+            .order_by(desc('count'))
+            .limit(1)
+        )
+        result = await self.execute(query)
+        return result.first()
+
+    async def get_yearly_summary(self) -> list[Row[tuple[int, int, int, int, int]]]:
+        """Total plays and unique artists, tracks and albums for every year with plays, newest first."""
+        def by_year(model, *columns):
+            year = extract('year', model.day).cast(Integer).label('year')
+            return select(year, *columns).group_by(year).subquery()
+
+        artists = by_year(
+            DailyArtistPlays,
+            func.sum(DailyArtistPlays.play_count).label('total'),
+            func.count(func.distinct(DailyArtistPlays.artist_name)).label('artists'),
+        )
+        tracks = by_year(DailyTrackPlays, func.count(func.distinct(DailyTrackPlays.track_name)).label('tracks'))
+        albums = by_year(DailyAlbumPlays, func.count(func.distinct(func.nullif(DailyAlbumPlays.album_name, ""))).label('albums'))
+
+        query = (
+            select(
+                artists.c.year,
+                artists.c.total,
+                artists.c.artists,
+                func.coalesce(tracks.c.tracks, 0).label('tracks'),
+                func.coalesce(albums.c.albums, 0).label('albums'),
+            )
+            .outerjoin(tracks, tracks.c.year == artists.c.year)
+            .outerjoin(albums, albums.c.year == artists.c.year)
+            .order_by(artists.c.year.desc())
+        )
+        result = await self.execute(query)
+        return list(result.all())
+
+    async def get_overview(self, date_from: date, date_to: date, limit: int = 10) -> dict[str, Any]:
+        """
+        Totals, distinct counts, top N, monthly breakdown, first scrobble and most active day
+        for [date_from, date_to), in one statement. Each rollup is grouped once in a CTE
+        and every figure is read from those, instead of one round trip per figure.
+        """
+        artists = (
+            select(DailyArtistPlays.artist_name, func.sum(DailyArtistPlays.play_count).label('play_count'))
+            .where(*_in_range(DailyArtistPlays.day, date_from, date_to))
+            .group_by(DailyArtistPlays.artist_name)
+            .cte('artists')
+        )
+        albums = (
+            select(
+                DailyAlbumPlays.album_name,
+                DailyAlbumPlays.artist_name,
+                func.sum(DailyAlbumPlays.play_count).label('play_count'),
+            )
+            .where(*_in_range(DailyAlbumPlays.day, date_from, date_to))
+            .group_by(DailyAlbumPlays.album_name, DailyAlbumPlays.artist_name)
+            .cte('albums')
+        )
+        tracks = (
+            select(
+                DailyTrackPlays.track_name,
+                DailyTrackPlays.artist_name,
+                DailyTrackPlays.album_name,
+                func.sum(DailyTrackPlays.play_count).label('play_count'),
+            )
+            .where(*_in_range(DailyTrackPlays.day, date_from, date_to))
+            .group_by(DailyTrackPlays.track_name, DailyTrackPlays.artist_name, DailyTrackPlays.album_name)
+            .cte('tracks')
+        )
+        days = (
+            select(DailyArtistPlays.day, func.sum(DailyArtistPlays.play_count).label('play_count'))
+            .where(*_in_range(DailyArtistPlays.day, date_from, date_to))
+            .group_by(DailyArtistPlays.day)
+            .cte('days')
+        )
+        first_scrobble = (
+            select(Scrobble.track_name, Scrobble.artist_name, Scrobble.album_name, Scrobble.scrobbled_at)
+            .where(*_in_range(Scrobble.scrobbled_at, date_from, date_to))
+            .order_by(Scrobble.scrobbled_at.asc())
+            .limit(1)
+            .cte('first_scrobble')
+        )
+
+        def top(cte, *columns):
+            ranked = select(*columns, cte.c.play_count).order_by(cte.c.play_count.desc()).limit(limit).subquery()
+            return (
+                select(func.json_agg(
+                    aggregate_order_by(func.json_build_array(*ranked.c), ranked.c.play_count.desc()), type_=JSON
+                ))
+                .select_from(ranked)
+                .scalar_subquery()
+            )
+
+        month = extract('month', days.c.day).cast(Integer).label('month')
+        months = select(month, func.sum(days.c.play_count).label('play_count')).group_by(month).subquery()
+        most_active_day = select(days).order_by(days.c.play_count.desc()).limit(1).subquery()
+
+        query = select(
+            select(func.sum(artists.c.play_count)).scalar_subquery().label('total_scrobbles'),
+            select(func.count()).select_from(artists).scalar_subquery().label('unique_artists'),
+            select(func.count(func.distinct(tracks.c.track_name))).scalar_subquery().label('unique_tracks'),
+            select(func.count(func.distinct(func.nullif(albums.c.album_name, "")))).scalar_subquery().label('unique_albums'),
+            top(artists, artists.c.artist_name).label('top_artists'),
+            top(tracks, tracks.c.track_name, tracks.c.artist_name, func.nullif(tracks.c.album_name, "")).label('top_tracks'),
+            top(albums, func.nullif(albums.c.album_name, ""), albums.c.artist_name).label('top_albums'),
+            select(func.json_agg(
+                aggregate_order_by(func.json_build_array(months.c.month, months.c.play_count), months.c.month), type_=JSON
+            )).scalar_subquery().label('monthly_breakdown'),
+            select(most_active_day.c.day).scalar_subquery().label('most_active_day'),
+            select(most_active_day.c.play_count).scalar_subquery().label('most_active_day_count'),
+            first_scrobble.c.track_name,
+            first_scrobble.c.artist_name,
+            first_scrobble.c.album_name,
+            first_scrobble.c.scrobbled_at,
+        ).select_from(select(literal(1)).subquery().outerjoin(first_scrobble, true()))
+
+        row = (await self.execute(query)).one()
+
+        return {
+            'total_scrobbles': row.total_scrobbles or 0,
+            'unique_artists': row.unique_artists,
+            'unique_tracks': row.unique_tracks,
+            'unique_albums': row.unique_albums,
+            'top_artists': [tuple(r) for r in row.top_artists or []],
+            'top_tracks': [tuple(r) for r in row.top_tracks or []],
+            'top_albums': [tuple(r) for r in row.top_albums or []],
+            'monthly_breakdown': [tuple(r) for r in row.monthly_breakdown or []],
+            'first_scrobble': Scrobble(
+                track_name=row.track_name,
+                artist_name=row.artist_name,
+                album_name=row.album_name,
+                scrobbled_at=row.scrobbled_at,
+            ) if row.scrobbled_at else None,
+            'most_active_day': (row.most_active_day, row.most_active_day_count) if row.most_active_day else None,
+        }
@@ -1,8 +1,11 @@
-from datetime import datetime
-from typing import Any, Optional
-
-from pylast import PlayedTrack
-from sqlalchemy import select, func, desc, extract, tuple_
+import asyncio
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Optional, AsyncIterator
+
+from loguru import logger
+from sqlalchemy import select, func, desc, text, Row, and_, or_, distinct, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.db import (
@@ -14,6 +17,19 @@ from models.db import (
 from models.schemas import LastFmTrack
 from repositories.base import BaseRepository
 from repositories.filters import ScrobbleFilter, build_query, to_lower, like_lower
+from repositories.rollup_repo import RollupRepository
+
+# keeps a multi-row INSERT well under asyncpg's 32767 bind parameter limit
+INSERT_CHUNK_SIZE = 1000
+
+# Concurrent inserts (parallel sync windows sharing a day, the TUI scrobbling today's plays)
+# can still deadlock on the rollup rows, in which case the whole insert is retried.
+DEADLOCK_DETECTED = "40P01"
+DEADLOCK_RETRIES = 3
+
+
+def _is_deadlock(e: DBAPIError) -> bool:
+    return getattr(e.orig, "sqlstate", None) == DEADLOCK_DETECTED
 
 
 class ScrobbleRepository(BaseRepository):
@@ -31,76 +47,262 @@ class ScrobbleRepository(BaseRepository):
         result = await self.execute(query)
         return result.scalars().all()
 
-    async def add_scrobble(self, lastfm_track: LastFmTrack):
-        db_scrobble = Scrobble(
-            artist_name=lastfm_track.artist,
-            album_name=lastfm_track.album,
-            track_name=lastfm_track.name,
-            scrobbled_at=lastfm_track.scrobbled_at
+    async def add_scrobble(self, lastfm_track: LastFmTrack) -> int:
+        return await self.insert_scrobbles([{
+            "artist_name": lastfm_track.artist,
+            "album_name": lastfm_track.album,
+            "track_name": lastfm_track.name,
+            "scrobbled_at": lastfm_track.scrobbled_at,
+        }])
+
+    async def insert_scrobbles(self, rows: list[dict[str, Any]]) -> int:
+        """
+        Insert scrobble rows, skipping any that are already stored (by artist, track, and scrobbled_at).
+        Rows are dicts with track_name, artist_name, album_name, and scrobbled_at.
+        The daily rollups are updated in the same transaction, which is retried if it deadlocks.
+
+        Returns:
+            Number of rows actually inserted
+        """
+        if not rows:
+            return 0
+
+        now = datetime.now()
+        # Insert in natural key order, and only then count the new rows into the rollups, so that
+        # concurrent inserts take their row locks in the same order and wait instead of deadlocking.
+        values = sorted(
+            ({**row, "created_at": now, "updated_at": now} for row in rows),
+            key=lambda v: (v["artist_name"].lower(), v["track_name"].lower(), v["scrobbled_at"]),
         )
-        await self.add_and_commit(db_scrobble)
 
-    async def get_artists_from_scrobbles(self) -> Any:
+        async def insert_all(session: AsyncSession) -> int:
+            new_rows = []
+            for i in range(0, len(values), INSERT_CHUNK_SIZE):
+                query = (
+                    insert(Scrobble)
+                    .values(values[i:i + INSERT_CHUNK_SIZE])
+                    .on_conflict_do_nothing()
+                    .returning(Scrobble.track_name, Scrobble.artist_name, Scrobble.album_name, Scrobble.scrobbled_at)
+                )
+                result = await session.execute(query)
+                new_rows.extend(result.all())
+            await RollupRepository(session).add_plays(new_rows)
+            return len(new_rows)
+
+        return await self._commit_retrying_deadlocks(insert_all)
+
+    async def _commit_retrying_deadlocks(self, write: Callable[[AsyncSession], Awaitable[int]]) -> int:
+        """Run `write` and commit, rolling back and running it again if Postgres picks it as a deadlock victim."""
+        async with self._get_session() as session:
+            for attempt in range(1, DEADLOCK_RETRIES + 1):
+                try:
+                    result = await write(session)
+                    await session.commit()
+                    return result
+                except DBAPIError as e:
+                    await session.rollback()
+                    if not _is_deadlock(e) or attempt == DEADLOCK_RETRIES:
+                        raise
+                    logger.warning(f"Deadlock inserting scrobbles, retrying ({attempt}/{DEADLOCK_RETRIES - 1})...")
+                    await asyncio.sleep(0.1 * attempt)
+
+    async def copy_scrobbles(self, rows: list[dict[str, Any]]) -> int:
+        """
+        Bulk load scrobble rows through COPY into a temporary staging table,
+        then move them into `scrobbles` skipping any already stored.
+        Much faster than `insert_scrobbles` for very large first-time loads.
+        The daily rollups are updated in the same transaction.
+
+        Returns:
+            Number of rows actually inserted
+        """
+        if not rows:
+            return 0
+
+        async def copy_all(session: AsyncSession) -> int:
+            await session.execute(text(
+                "CREATE TEMP TABLE scrobbles_staging "
+                "(track_name varchar, artist_name varchar, album_name varchar, scrobbled_at timestamp) "
+                "ON COMMIT DROP"
+            ))
+
+            connection = await session.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                "scrobbles_staging",
+                records=[
+                    (r["track_name"], r["artist_name"], r["album_name"], r["scrobbled_at"])
+                    for r in rows
+                ],
+                columns=["track_name", "artist_name", "album_name", "scrobbled_at"],
+            )
+
+            result = await session.execute(text(
+                "INSERT INTO scrobbles (track_name, artist_name, album_name, scrobbled_at, created_at, updated_at) "
+                "SELECT track_name, artist_name, album_name, scrobbled_at, LOCALTIMESTAMP, LOCALTIMESTAMP "
+                "FROM scrobbles_staging "
+                "ORDER BY lower(artist_name), lower(track_name), scrobbled_at "
+                "ON CONFLICT DO NOTHING "
+                "RETURNING track_name, artist_name, album_name, scrobbled_at"
+            ))
+            new_rows = result.all()
+            await RollupRepository(session).add_plays(new_rows)
+            return len(new_rows)
+
+        return await self._commit_retrying_deadlocks(copy_all)
+
+    async def get_latest_scrobble_id(self) -> Optional[int]:
+        """The id of the most recently stored scrobble, which changes whenever scrobbles are added."""
+        result = await self.execute(select(func.max(Scrobble.id)))
+        return result.scalar()
+
+    async def get_latest_scrobbled_at(self) -> Optional[datetime]:
+        """Get the timestamp of the most recent scrobble stored, or None if there are none."""
+        query = select(func.max(Scrobble.scrobbled_at))
+        result = await self.execute(query)
+        return result.scalar()
+
+    async def get_daily_counts(self, time_from: datetime, time_to: datetime) -> list[Row[tuple[Any, int, int, int]]]:
+        """Distinct tracks, artists and albums played per day in [time_from, time_to), newest day first."""
+        day = Scrobble.scrobbled_on.label('date')
         query = (
-            select(Scrobble.artist_name)
-            .distinct()
-            .order_by(Scrobble.artist_name)
+            select(
+                day,
+                func.count(distinct(tuple_(Scrobble.artist_name, Scrobble.track_name))).label('track_count'),
+                func.count(distinct(Scrobble.artist_name)).label('artist_count'),
+                func.count(distinct(tuple_(Scrobble.artist_name, Scrobble.album_name))).label('album_count'),
+            )
+            .where(Scrobble.scrobbled_at >= time_from, Scrobble.scrobbled_at < time_to)
+            .group_by(day)
+            .order_by(day.desc())
         )
         result = await self.execute(query)
-        return result.scalars().all()
+        return list(result.all())
 
-    async def get_albums_from_scrobbles(self) -> Any:
+    async def get_daily_plays(self, time_from: datetime) -> list[Row[tuple[Any, str, str, Optional[str]]]]:
+        """Distinct (date, artist, track, album) played since `time_from`, to merge with plays not stored yet."""
+        day = Scrobble.scrobbled_on.label('date')
         query = (
-            select(Scrobble.album_name, Scrobble.artist_name)
+            select(day, Scrobble.artist_name, Scrobble.track_name, Scrobble.album_name)
+            .where(Scrobble.scrobbled_at >= time_from)
             .distinct()
-            .order_by(Scrobble.album_name)
         )
         result = await self.execute(query)
+        return list(result.all())
+
+    @staticmethod
+    def _artists_query(only_missing: bool = False):
+        query = select(Scrobble.artist_name)
+        if only_missing:
+            query = (
+                query
+                .outerjoin(Artist, Scrobble.artist_name == Artist.name)
+                .where(Artist.name.is_(None))
+            )
+        return query.distinct().order_by(Scrobble.artist_name)
+
+    @staticmethod
+    def _albums_query(only_missing: bool = False):
+        query = select(Scrobble.album_name, Scrobble.artist_name)
+        if only_missing:
+            query = (
+                query
+                .outerjoin(Album, Scrobble.album_name == Album.title)
+                .outerjoin(Artist, Scrobble.artist_name == Artist.name)
+                .where(Album.title.is_(None))
+            )
+        return query.distinct().order_by(Scrobble.album_name)
+
+    @staticmethod
+    def _tracks_query(only_missing: bool = False):
+        query = select(Scrobble.track_name, Scrobble.artist_name)
+        if only_missing:
+            query = (
+                query
+                .outerjoin(Track, Scrobble.track_name == Track.title)
+                .outerjoin(Artist, Scrobble.artist_name == Artist.name)
+                .where(Track.title.is_(None))
+            )
+        return query.distinct().order_by(Scrobble.track_name)
+
+    async def get_artists_from_scrobbles(self) -> Any:
+        result = await self.execute(self._artists_query())
+        return result.scalars().all()
+
+    async def get_albums_from_scrobbles(self) -> Any:
+        result = await self.execute(self._albums_query())
         return result.all()
 
     async def get_tracks_from_scrobbles(self) -> Any:
-        query = (
-            select(Scrobble.track_name, Scrobble.artist_name)
-            .distinct()
-            .order_by(Scrobble.track_name)
-        )
-        result = await self.execute(query)
+        result = await self.execute(self._tracks_query())
         return result.all()
 
     async def get_artists_with_no_ref_data(self) -> Any:
+        result = await self.execute(self._artists_query(only_missing=True))
+        return result.scalars().all()
+
+    async def get_albums_with_no_ref_data(self) -> Any:
+        result = await self.execute(self._albums_query(only_missing=True))
+        return result.all()
+
+    async def get_tracks_with_no_ref_data(self) -> Any:
+        result = await self.execute(self._tracks_query(only_missing=True))
+        return result.all()
+
+    async def stream_artists(self, only_missing: bool = True) -> AsyncIterator[str]:
+        async for row in self.stream(self._artists_query(only_missing)):
+            yield row[0]
+
+    async def stream_albums(self, only_missing: bool = True) -> AsyncIterator[Row[tuple[str, str]]]:
+        async for row in self.stream(self._albums_query(only_missing)):
+            yield row
+
+    async def stream_tracks(self, only_missing: bool = True) -> AsyncIterator[Row[tuple[str, str]]]:
+        async for row in self.stream(self._tracks_query(only_missing)):
+            yield row
+
+    async def stream_stale_artists(self, synced_before: datetime, limit: int) -> AsyncIterator[str]:
+        """
+        Artists with no reference data, or reference data last synced before `synced_before`,
+        most scrobbled first, up to `limit`.
+        """
         query = (
             select(Scrobble.artist_name)
             .outerjoin(Artist, Scrobble.artist_name == Artist.name)
-            .where(Artist.name.is_(None))
-            .distinct()
-            .order_by(Scrobble.artist_name)
+            .where(or_(Artist.last_synced_at.is_(None), Artist.last_synced_at < synced_before))
+            .group_by(Scrobble.artist_name)
+            .order_by(func.count().desc())
+            .limit(limit)
         )
-        result = await self.execute(query)
-        return result.scalars().all()
+        async for row in self.stream(query):
+            yield row[0]
 
-    async def get_albums_with_no_ref_data(self) -> Any:
+    async def stream_stale_albums(self, synced_before: datetime, limit: int) -> AsyncIterator[Row[tuple[str, str]]]:
+        """Albums with missing or stale reference data, most scrobbled first, up to `limit`."""
         query = (
             select(Scrobble.album_name, Scrobble.artist_name)
-            .outerjoin(Album, Scrobble.album_name == Album.title)
-            .outerjoin(Artist, Scrobble.artist_name == Artist.name)
-            .where(Album.title.is_(None))
-            .distinct()
-            .order_by(Scrobble.album_name)
+            .outerjoin(Album, and_(Scrobble.album_name == Album.title, Scrobble.artist_name == Album.artist_name))
+            .where(Scrobble.album_name.is_not(None))
+            .where(or_(Album.last_synced_at.is_(None), Album.last_synced_at < synced_before))
+            .group_by(Scrobble.album_name, Scrobble.artist_name)
+            .order_by(func.count().desc())
+            .limit(limit)
         )
-        result = await self.execute(query)
-        return result.all()
+        async for row in self.stream(query):
+            yield row
 
-    async def get_tracks_with_no_ref_data(self) -> Any:
+    async def stream_stale_tracks(self, synced_before: datetime, limit: int) -> AsyncIterator[Row[tuple[str, str]]]:
+        """Tracks with missing or stale reference data, most scrobbled first, up to `limit`."""
         query = (
             select(Scrobble.track_name, Scrobble.artist_name)
-            .outerjoin(Track, Scrobble.track_name == Track.title)
-            .outerjoin(Artist, Scrobble.artist_name == Artist.name)
-            .where(Track.title.is_(None))
-            .distinct()
-            .order_by(Scrobble.track_name)
+            .outerjoin(Track, and_(Scrobble.track_name == Track.title, Scrobble.artist_name == Track.artist_name))
+            .where(or_(Track.last_synced_at.is_(None), Track.last_synced_at < synced_before))
+            .group_by(Scrobble.track_name, Scrobble.artist_name)
+            .order_by(func.count().desc())
+            .limit(limit)
         )
-        result = await self.execute(query)
-        return result.all()
+        async for row in self.stream(query):
+            yield row
 
     async def get_top_tracks_by_artist(self, artist_name: str, limit: int = None) -> Any:
         query = (
@@ -134,59 +336,16 @@ class ScrobbleRepository(BaseRepository):
     async def get_artist_counts_by_year(self, artist_name: str) -> Any:
         query = (
             select(
-                func.extract('year', Scrobble.scrobbled_at).label('year'),
+                Scrobble.scrobbled_year.label('year'),
                 func.count(Scrobble.id).label('play_count')
             )
             .where(Scrobble.artist_name == artist_name)
-            .group_by('year')
-            .order_by('year')
+            .group_by(Scrobble.scrobbled_year)
+            .order_by(Scrobble.scrobbled_year)
         )
         result = await self.execute(query)
         return result.all()
 
-    async def get_scrobbles_batch(self, track_data: list[PlayedTrack]) -> list[Scrobble]:
-        """
-        Efficiently check for existing scrobbles in a sync batch.
-
-        Args:
-            track_data: List of PlayedTrack objects from Last.fm API
-
-        Returns:
-            List of Scrobble objects that already exist in the database
-        """
-        if not track_data:
-            return []
-
-        lookup_keys = set()
-
-        for t in track_data:
-            track_name = t.track.title
-            artist_name = t.track.artist.name if t.track.artist else "Unknown Artist"
-            timestamp = int(t.timestamp)
-            scrobbled_at = datetime.fromtimestamp(timestamp)
-
-            lookup_keys.add((
-                track_name.lower(),
-                artist_name.lower(),
-                scrobbled_at,
-            ))
-
-        if not lookup_keys:
-            return []
-
-        query = (
-            select(Scrobble)
-            .where(
-                tuple_(
-                    func.lower(Scrobble.track_name),
-                    func.lower(Scrobble.artist_name),
-                    Scrobble.scrobbled_at,
-                ).in_(lookup_keys)
-            )
-        )
-        result = await self.execute(query)
-        return result.scalars().all()
-
     async def get_scrobbles_like_track(self, track_name: str, artist_name: str) -> Any:
         # If we passed in "Song Name", ideally we would get results like
         # "Song Name", "Song Name (Remastered)", "Song Name - Single Version", etc.
@@ -199,133 +358,100 @@ class ScrobbleRepository(BaseRepository):
         result = await self.execute(query)
         return result.scalars().all()
 
-    async def get_top_artists_by_year(self, year: int, limit: int = 10) -> list[tuple[str, int]]:
+    async def get_track_scrobbles(self, track_names: list[str], artist_name: str) -> list[Scrobble]:
+        """Scrobbles of a track under any of `track_names`, e.g. with and without "(Remastered)", newest first."""
         query = (
-            select(
-                Scrobble.artist_name,
-                func.count(Scrobble.id).label('play_count')
-            )
-            .where(extract('year', Scrobble.scrobbled_at) == year)
-            .group_by(Scrobble.artist_name)
-            .order_by(desc('play_count'))
-            .limit(limit)
+            select(Scrobble)
+            .where(to_lower(Scrobble.track_name).in_([name.lower() for name in track_names]))
+            .where(to_lower(Scrobble.artist_name) == to_lower(artist_name))
+            .order_by(Scrobble.scrobbled_at.desc())
         )
         result = await self.execute(query)
-        return result.all()
+        return list(result.scalars().all())
+
+    @staticmethod
+    def _year_range(year: int) -> tuple[date, date]:
+        return date(year, 1, 1), date(year + 1, 1, 1)
+
+    @staticmethod
+    def _month_range(year: int, month: int) -> tuple[date, date]:
+        return date(year, month, 1), date(year + month // 12, month % 12 + 1, 1)
+
+    # Top N and totals over a date range are read from the daily rollups, see RollupRepository.
+
+    async def get_top_artists_between(self, date_from: date, date_to: date, limit: int = 10) -> list[tuple[str, int]]:
+        return await RollupRepository(self._db).get_top_artists(date_from, date_to, limit)
+
+    async def get_top_tracks_between(self, date_from: date, date_to: date, limit: int = 10) -> list[tuple[str, str, str, int]]:
+        return await RollupRepository(self._db).get_top_tracks(date_from, date_to, limit)
+
+    async def get_top_albums_between(self, date_from: date, date_to: date, limit: int = 10) -> list[tuple[str, str, int]]:
+        return await RollupRepository(self._db).get_top_albums(date_from, date_to, limit)
+
+    async def get_top_artists_by_year(self, year: int, limit: int = 10) -> list[tuple[str, int]]:
+        return await self.get_top_artists_between(*self._year_range(year), limit)
 
     async def get_top_tracks_by_year(self, year: int, limit: int = 10) -> list[tuple[str, str, str, int]]:
-        query = (
-            select(
-                Scrobble.track_name,
-                Scrobble.artist_name,
-                Scrobble.album_name,
-                func.count(Scrobble.id).label('play_count')
-            )
-            .where(extract('year', Scrobble.scrobbled_at) == year)
-            .group_by(Scrobble.track_name, Scrobble.artist_name, Scrobble.album_name)
-            .order_by(desc('play_count'))
-            .limit(limit)
-        )
-        result = await self.execute(query)
-        return result.all()
+        return await self.get_top_tracks_between(*self._year_range(year), limit)
 
     async def get_top_albums_by_year(self, year: int, limit: int = 10) -> list[tuple[str, str, int]]:
-        query = (
-            select(
-                Scrobble.album_name,
-                Scrobble.artist_name,
-                func.count(Scrobble.id).label('play_count')
-            )
-            .where(extract('year', Scrobble.scrobbled_at) == year)
-            .group_by(Scrobble.album_name, Scrobble.artist_name)
-            .order_by(desc('play_count'))
-            .limit(limit)
-        )
-        result = await self.execute(query)
-        return result.all()
+        return await self.get_top_albums_between(*self._year_range(year), limit)
+
+    async def get_top_artists_by_month(self, year: int, month: int, limit: int = 10) -> list[tuple[str, int]]:
+        return await self.get_top_artists_between(*self._month_range(year, month), limit)
+
+    async def get_top_tracks_by_month(self, year: int, month: int, limit: int = 10) -> list[tuple[str, str, str, int]]:
+        return await self.get_top_tracks_between(*self._month_range(year, month), limit)
+
+    async def get_top_albums_by_month(self, year: int, month: int, limit: int = 10) -> list[tuple[str, str, int]]:
+        return await self.get_top_albums_between(*self._month_range(year, month), limit)
 
     async def get_total_scrobbles_by_year(self, year: int) -> int:
-        query = (
-            select(func.count(Scrobble.id))
-            .where(extract('year', Scrobble.scrobbled_at) == year)
-        )
-        result = await self.execute(query)
-        return result.scalar() or 0
+        return await RollupRepository(self._db).get_total_plays(*self._year_range(year))
 
     async def get_unique_artists_by_year(self, year: int) -> int:
-        query = (
-            select(func.count(func.distinct(Scrobble.artist_name)))
-            .where(extract('year', Scrobble.scrobbled_at) == year)
-        )
-        result = await self.execute(query)
-        return result.scalar() or 0
+        return await RollupRepository(self._db).get_unique_artists(*self._year_range(year))
 
     async def get_unique_tracks_by_year(self, year: int) -> int:
-        query = (
-            select(func.count(func.distinct(Scrobble.track_name)))
-            .where(extract('year', Scrobble.scrobbled_at) == year)
-        )
-        result = await self.execute(query)
-        return result.scalar() or 0
+        return await RollupRepository(self._db).get_unique_tracks(*self._year_range(year))
 
     async def get_unique_albums_by_year(self, year: int) -> int:
-        query = (
-            select(func.count(func.distinct(Scrobble.album_name)))
-            .where(extract('year', Scrobble.scrobbled_at) == year)
-        )
-        result = await self.execute(query)
-        return result.scalar() or 0
+        return await RollupRepository(self._db).get_unique_albums(*self._year_range(year))
 
     async def get_scrobbles_by_month(self, year: int) -> list[tuple[int, int]]:
-        query = (
-            select(
-                extract('month', Scrobble.scrobbled_at).label('month'),
-                func.count(Scrobble.id).label('count')
-            )
-            .where(extract('year', Scrobble.scrobbled_at) == year)
-            .group_by('month')
-            .order_by('month')
-        )
-        result = await self.execute(query)
-        return result.all()
+        return await RollupRepository(self._db).get_plays_by_month(*self._year_range(year))
 
     async def get_first_scrobble_by_year(self, year: int) -> Optional[Scrobble]:
+        date_from, date_to = self._year_range(year)
         query = (
             select(Scrobble)
-            .where(extract('year', Scrobble.scrobbled_at) == year)
+            .where(Scrobble.scrobbled_at >= date_from, Scrobble.scrobbled_at < date_to)
             .order_by(Scrobble.scrobbled_at.asc())
             .limit(1)
         )
         result = await self.execute(query)
         return result.scalar_one_or_none()
 
-    async def get_most_active_day_by_year(self, year: int) -> Optional[tuple[str, int]]:
+    async def get_plays_by_weekday_and_hour(self, year: int) -> list[Row[tuple[int, int, int]]]:
+        """Scrobbles in a year per (weekday, hour), weekday 1 being Monday, to chart when the listening happens."""
         query = (
-            select(
-                func.date(Scrobble.scrobbled_at).label('date'),
-                func.count(Scrobble.id).label('count')
-            )
-            .where(extract('year', Scrobble.scrobbled_at) == year)
-            .group_by('date')
-            .order_by(desc('count'))
-            .limit(1)
+            select(Scrobble.scrobbled_weekday, Scrobble.scrobbled_hour, func.count().label('count'))
+            .where(Scrobble.scrobbled_year == year)
+            .group_by(Scrobble.scrobbled_weekday, Scrobble.scrobbled_hour)
+            .order_by(Scrobble.scrobbled_weekday, Scrobble.scrobbled_hour)
         )
         result = await self.execute(query)
-        return result.first()
+        return list(result.all())
+
+    async def get_most_active_day_by_year(self, year: int) -> Optional[tuple[str, int]]:
+        return await RollupRepository(self._db).get_most_active_day(*self._year_range(year))
+
+    async def get_yearly_summary(self) -> list[Row[tuple[int, int, int, int, int]]]:
+        """Total scrobbles and unique artists, tracks and albums for every year, newest first, in a single query."""
+        return await RollupRepository(self._db).get_yearly_summary()
 
     async def get_year_overview(self, year: int) -> dict[str, Any]:
-        """Get comprehensive overview of listening stats for a year."""
-        return {
-            'year': year,
-            'total_scrobbles': await self.get_total_scrobbles_by_year(year),
-            'unique_artists': await self.get_unique_artists_by_year(year),
-            'unique_tracks': await self.get_unique_tracks_by_year(year),
-            'unique_albums': await self.get_unique_albums_by_year(year),
-            'top_artists': await self.get_top_artists_by_year(year, limit=10),
-            'top_tracks': await self.get_top_tracks_by_year(year, limit=10),
-            'top_albums': await self.get_top_albums_by_year(year, limit=10),
-            'monthly_breakdown': await self.get_scrobbles_by_month(year),
-            'first_scrobble': await self.get_first_scrobble_by_year(year),
-            'most_active_day': await self.get_most_active_day_by_year(year)
-        }
+        """Get comprehensive overview of listening stats for a year, in a single query."""
+        overview = await RollupRepository(self._db).get_overview(*self._year_range(year), limit=10)
+        return {'year': year, **overview}
 
@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Optional
+
+from sqlalchemy import select, update, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.db import SyncJob
+from repositories.base import BaseRepository
+
+
+class SyncJobType(str, Enum):
+    SCROBBLES = "scrobbles"
+
+
+class SyncJobStatus(str, Enum):
+    RUNNING = "running"
+    COMPLETE = "complete"
+    FAILED = "failed"
+
+
+class SyncStateRepository(BaseRepository):
+    """
+    Repository for persisting sync job checkpoints.
+    """
+    def __init__(self, db: Optional[AsyncSession] = None):
+        super().__init__(db)
+
+    async def create_job(
+            self,
+            job_type: SyncJobType,
+            time_from: int | None,
+            time_to: int,
+            window_size: int | None = None,
+            incremental: bool = False,
+    ) -> SyncJob:
+        job = SyncJob(
+            job_type=job_type.value,
+            status=SyncJobStatus.RUNNING.value,
+            time_from=time_from,
+            time_to=time_to,
+            window_size=window_size,
+            window_cursors={},
+            completed_windows=[],
+            incremental=incremental,
+            fetched=0,
+            saved=0,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+        await self.add_and_commit(job)
+        return job
+
+    async def claim_resumable_job(self, job_type: SyncJobType, stale_after: timedelta) -> Optional[SyncJob]:
+        """
+        Claim the most recent job of this type that did not run to completion, if it failed
+        or was interrupted, and mark it running again.
+
+        A job still marked running counts as interrupted once its checkpoint (updated_at)
+        is older than `stale_after`, e.g. after the process was killed. A job another process
+        is still running keeps checkpointing, so it is never claimed. The claim is a single
+        UPDATE, so two processes resuming at once cannot both get the same job.
+        """
+        now = datetime.now()
+        latest_unfinished = (
+            select(SyncJob.id)
+            .where(SyncJob.job_type == job_type.value)
+            .where(SyncJob.status != SyncJobStatus.COMPLETE.value)
+            .order_by(SyncJob.id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        query = (
+            update(SyncJob)
+            .where(SyncJob.id == latest_unfinished)
+            .where(or_(
+                SyncJob.status == SyncJobStatus.FAILED.value,
+                SyncJob.updated_at < now - stale_after,
+            ))
+            .values(status=SyncJobStatus.RUNNING.value, updated_at=now)
+            .returning(SyncJob)
+            .execution_options(synchronize_session=False)
+        )
+        async with self._get_session() as session:
+            result = await session.execute(query)
+            job = result.scalar_one_or_none()
+            await session.commit()
+        return job
+
+    async def save_progress(self, job: SyncJob) -> None:
+        """Write the in-memory progress of a job back to its row."""
+        query = (
+            update(SyncJob)
+            .where(SyncJob.id == job.id)
+            .values(
+                status=job.status,
+                cursor=job.cursor,
+                window_cursors=dict(job.window_cursors),
+                completed_windows=list(job.completed_windows),
+                fetched=job.fetched,
+                saved=job.saved,
+                finished_at=job.finished_at,
+                updated_at=datetime.now(),
+            )
+        )
+        async with self._get_session() as session:
+            await session.execute(query)
+            await session.commit()
@@ -110,5 +110,5 @@ async def state():
         "lastfm_album": app_state.lastfm_album,
         "scrobble_enabled": app_state.scrobble_enabled,
         "active_integration": app_state.active_integration.normalized_name(),
-        "user": app_state.user,
+        "user": await app_state.get_user(),
     }
@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends
 
 from library.dependencies import get_sync_service
+from library.executor import executor_stats
+from services.lastfm_service import rate_limiter, response_cache, album_memo
 from services.sync_service import SyncService
 
 sync_router = APIRouter()
@@ -10,12 +12,18 @@ sync_router = APIRouter()
 async def sync_scrobbles(
         time_from: str = None,
         time_to: str = None,
+        workers: int = 1,
+        resume: bool = False,
+        incremental: bool = False,
         sync_service: SyncService = Depends(get_sync_service)
 ):
     data = await sync_service.sync_scrobbles(
         time_from=time_from,
         time_to=time_to,
-        clean=True
+        clean=True,
+        workers=workers,
+        resume=resume,
+        incremental=incremental,
     )
 
     return {"data": data}
@@ -24,9 +32,11 @@ async def sync_scrobbles(
 @sync_router.get('/sync/artists/')
 async def sync_artists(
         only_missing: bool = True,
+        workers: int = None,
+        stale: bool = False,
         sync_service: SyncService = Depends(get_sync_service)
 ):
-    data = await sync_service.sync_artists(only_missing)
+    data = await sync_service.sync_artists(only_missing, workers, stale)
 
     return {"data": data}
 
@@ -34,9 +44,11 @@ async def sync_artists(
 @sync_router.get('/sync/albums/')
 async def sync_albums(
         only_missing: bool = True,
+        workers: int = None,
+        stale: bool = False,
         sync_service: SyncService = Depends(get_sync_service)
 ):
-    data = await sync_service.sync_albums(only_missing)
+    data = await sync_service.sync_albums(only_missing, workers, stale)
 
     return {"data": data}
 
@@ -44,8 +56,30 @@ async def sync_albums(
 @sync_router.get('/sync/tracks/')
 async def sync_tracks(
         only_missing: bool = True,
+        workers: int = None,
+        stale: bool = False,
         sync_service: SyncService = Depends(get_sync_service)
 ):
-    data = await sync_service.sync_tracks(only_missing)
+    data = await sync_service.sync_tracks(only_missing, workers, stale)
 
     return {"data": data}
+
+
+@sync_router.get('/sync/rate-limit/')
+async def rate_limit_stats():
+    return {"data": rate_limiter.stats()}
+
+
+@sync_router.get('/sync/cache/')
+async def response_cache_stats():
+    return {"data": await response_cache.stats() | {"memo": album_memo.stats()}}
+
+
+@sync_router.get('/sync/cache/unresolved/')
+async def unresolved_lookups(limit: int = 20, method: str = None):
+    return {"data": await response_cache.unresolved_report(limit=limit, method=method)}
+
+
+@sync_router.get('/sync/executors/')
+async def executors_stats():
+    return {"data": executor_stats()}
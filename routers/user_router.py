@@ -1,23 +1,36 @@
 import time
+from typing import AsyncIterator
 
 from fastapi import APIRouter, Query, Depends
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 
 from library.state import get_app_state
-from library.dependencies import get_lastfm_service, get_spotify_service
-from services.lastfm_service import LastFmService, get_lastfm_user
+from library.dependencies import get_lastfm_service, get_spotify_service, get_history_service
+from services.history_service import HistoryService
+from services.lastfm_service import LastFmService
 from services.apple_music_service import get_macos_information
 from services.spotify_service import SpotifyService
 
 user_router = APIRouter()
 
+
+def ndjson(items: AsyncIterator[BaseModel]) -> StreamingResponse:
+    """Stream models as newline-delimited JSON, one line per item as soon as its page arrives."""
+    async def lines():
+        async for item in items:
+            yield item.model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
 @user_router.get("/user/")
-async def user():
-    return {"user": await get_lastfm_user()}
+async def user(lastfm: LastFmService = Depends(get_lastfm_service)):
+    return {"user": await lastfm.get_user()}
 
 
 @user_router.get("/user/accounts/lastfm")
-async def user_lastfm():
-    return {"user": await get_lastfm_user()}
+async def user_lastfm(lastfm: LastFmService = Depends(get_lastfm_service)):
+    return {"user": await lastfm.get_user()}
 
 
 @user_router.get("/user/accounts/apple/")
@@ -36,18 +49,39 @@ async def recent_tracks(lastfm: LastFmService = Depends(get_lastfm_service)):
 
 
 @user_router.get("/user/loved-tracks/")
-async def loved_tracks(lastfm: LastFmService = Depends(get_lastfm_service)):
-    return {"loved_tracks": await lastfm.get_user_loved_tracks()}
+async def loved_tracks(
+        stream: bool = Query(False, description="Stream the tracks as newline-delimited JSON"),
+        page_size: int = Query(50, ge=1, le=1000),
+        max_items: int = Query(50, ge=1),
+        lastfm: LastFmService = Depends(get_lastfm_service),
+):
+    if stream:
+        return ndjson(lastfm.iter_user_loved_tracks(page_size, max_items))
+    return {"loved_tracks": await lastfm.get_user_loved_tracks(max_items)}
 
 
 @user_router.get("/user/top-artists/")
-async def top_artists(lastfm: LastFmService = Depends(get_lastfm_service)):
-    return {"top_artists": await lastfm.get_user_top_artists()}
+async def top_artists(
+        stream: bool = Query(False, description="Stream the artists as newline-delimited JSON"),
+        page_size: int = Query(50, ge=1, le=1000),
+        max_items: int = Query(10, ge=1),
+        lastfm: LastFmService = Depends(get_lastfm_service),
+):
+    if stream:
+        return ndjson(lastfm.iter_user_top_artists(page_size, max_items))
+    return {"top_artists": await lastfm.get_user_top_artists(max_items)}
 
 
 @user_router.get("/user/top-albums/")
-async def top_artists(lastfm: LastFmService = Depends(get_lastfm_service)):
-    return {"top_albums": await lastfm.get_user_top_albums()}
+async def top_albums(
+        stream: bool = Query(False, description="Stream the albums as newline-delimited JSON"),
+        page_size: int = Query(50, ge=1, le=1000),
+        max_items: int = Query(10, ge=1),
+        lastfm: LastFmService = Depends(get_lastfm_service),
+):
+    if stream:
+        return ndjson(lastfm.iter_user_top_albums(page_size, max_items))
+    return {"top_albums": await lastfm.get_user_top_albums(max_items)}
 
 
 @user_router.get("/user/playcount/")
@@ -56,10 +90,10 @@ async def playcount(lastfm: LastFmService = Depends(get_lastfm_service)):
 
 
 @user_router.get("/user/current-track-scrobbles/")
-async def get_track_scrobbles(lastfm: LastFmService = Depends(get_lastfm_service)):
+async def get_track_scrobbles(history: HistoryService = Depends(get_history_service)):
     app_state = await get_app_state()
 
-    result = await lastfm.current_track_user_scrobbles(app_state.current_song) if app_state.current_song else None
+    result = await history.current_track_user_scrobbles(app_state.current_song) if app_state.current_song else None
 
     return {"scrobbles": result}
 
@@ -68,6 +102,7 @@ async def get_track_scrobbles(lastfm: LastFmService = Depends(get_lastfm_service
 async def get_weekly_album_charts(
         from_date: str | None = Query(None, description="Start date for the weekly album charts"),
         to_date: str | None = Query(None, description="End date for the weekly album charts"),
+        enrich: bool = Query(True, description="Fetch each album's details, not just its name and playcount"),
         lastfm: LastFmService = Depends(get_lastfm_service)
 ):
     """
@@ -78,7 +113,7 @@ async def get_weekly_album_charts(
         to_date = int(time.time())
         from_date = to_date - (7 * 86400)
 
-    results = await lastfm.user_weekly_album_charts(from_date, to_date)
+    results = await lastfm.user_weekly_album_charts(from_date, to_date, enrich=enrich)
 
     return {"data": results}
 
@@ -91,5 +126,5 @@ async def get_weekly_chart_dates(lastfm: LastFmService = Depends(get_lastfm_serv
 
 
 @user_router.get("/user/30-day-stats/")
-async def overview_stats(lastfm: LastFmService = Depends(get_lastfm_service)):
-    return {"data": await lastfm.get_user_30_day_stats()}
+async def overview_stats(history: HistoryService = Depends(get_history_service)):
+    return {"data": await history.get_user_30_day_stats()}
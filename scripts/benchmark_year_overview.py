@@ -0,0 +1,145 @@
+"""
+usage: python -m scripts.benchmark_year_overview
+larger: python -m scripts.benchmark_year_overview --scrobbles 2000000 --runs 20
+
+Compares `ScrobbleRepository.get_year_overview`, which reads every figure in one statement,
+with reading the same figures one query at a time as it used to.
+
+The synthetic scrobbles are written to a separate `bench` schema of DATABASE_URL,
+so your own scrobbles are never touched. The schema is dropped afterwards unless --keep is passed,
+and reused as is when it already has data.
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from core import config
+from models.db import Base
+from repositories.scrobble_repo import ScrobbleRepository
+
+SCHEMA = "bench"
+LOAD_CHUNK_SIZE = 50_000
+
+
+def synthetic_scrobbles(count: int, years: int, artists: int) -> list[dict]:
+    """Scrobbles spread over the last `years` years, with a few artists played far more than the rest."""
+    rng = random.Random(42)
+    start = datetime(datetime.now().year - years + 1, 1, 1)
+    span = int((datetime.now() - start).total_seconds())
+    weights = [1 / (rank + 1) for rank in range(artists)]
+    artist_ids = rng.choices(range(artists), weights=weights, k=count)
+
+    rows = []
+    for artist_id in artist_ids:
+        album_id = rng.randrange(5)
+        rows.append({
+            "track_name": f"Track {album_id}-{rng.randrange(12)}",
+            "artist_name": f"Artist {artist_id}",
+            "album_name": f"Album {artist_id}-{album_id}" if album_id else None,
+            "scrobbled_at": start + timedelta(seconds=rng.randrange(span)),
+        })
+    return rows
+
+
+async def sequential_overview(repo: ScrobbleRepository, year: int) -> dict:
+    """The year overview as one query per figure, awaited one after another."""
+    return {
+        'year': year,
+        'total_scrobbles': await repo.get_total_scrobbles_by_year(year),
+        'unique_artists': await repo.get_unique_artists_by_year(year),
+        'unique_tracks': await repo.get_unique_tracks_by_year(year),
+        'unique_albums': await repo.get_unique_albums_by_year(year),
+        'top_artists': await repo.get_top_artists_by_year(year, limit=10),
+        'top_tracks': await repo.get_top_tracks_by_year(year, limit=10),
+        'top_albums': await repo.get_top_albums_by_year(year, limit=10),
+        'monthly_breakdown': await repo.get_scrobbles_by_month(year),
+        'first_scrobble': await repo.get_first_scrobble_by_year(year),
+        'most_active_day': await repo.get_most_active_day_by_year(year),
+    }
+
+
+async def time_runs(func, runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+async def main(scrobbles: int, years: int, artists: int, runs: int, keep: bool):
+    if config.DATABASE_URL is None:
+        raise ValueError('DATABASE_URL environment variable is not set')
+
+    engine = create_async_engine(
+        config.DATABASE_URL,
+        connect_args={"server_settings": {"search_path": SCHEMA}},
+    )
+    session_factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}"))
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with session_factory() as session:
+            stored = (await session.execute(text("SELECT count(*) FROM scrobbles"))).scalar()
+
+        if not stored:
+            logger.info(f"Loading {scrobbles:,} synthetic scrobbles into the {SCHEMA} schema...")
+            rows = synthetic_scrobbles(scrobbles, years, artists)
+            for i in range(0, len(rows), LOAD_CHUNK_SIZE):
+                async with session_factory() as session:
+                    await ScrobbleRepository(session).copy_scrobbles(rows[i:i + LOAD_CHUNK_SIZE])
+            async with engine.begin() as conn:
+                await conn.execute(text("ANALYZE"))
+        else:
+            logger.info(f"Reusing {stored:,} scrobbles already in the {SCHEMA} schema")
+
+        year = datetime.now().year - 1
+        async with session_factory() as session:
+            repo = ScrobbleRepository(session)
+
+            single = await repo.get_year_overview(year)
+            sequential = await sequential_overview(repo, year)
+            sequential['monthly_breakdown'] = [tuple(r) for r in sequential['monthly_breakdown']]
+            for key in ('total_scrobbles', 'unique_artists', 'unique_tracks', 'unique_albums', 'monthly_breakdown'):
+                if single[key] != sequential[key]:
+                    logger.warning(f"{key} differs: {single[key]} != {sequential[key]}")
+
+            results = {
+                "single statement": await time_runs(lambda: repo.get_year_overview(year), runs),
+                "one query per figure": await time_runs(lambda: sequential_overview(repo, year), runs),
+            }
+
+        print(f"\nYear overview for {year}, {single['total_scrobbles']:,} scrobbles that year, {runs} runs")
+        print(f"{'method':<24}{'median ms':>12}{'mean ms':>12}{'min ms':>12}{'max ms':>12}")
+        for name, timings in results.items():
+            print(
+                f"{name:<24}{statistics.median(timings):>12.1f}{statistics.mean(timings):>12.1f}"
+                f"{min(timings):>12.1f}{max(timings):>12.1f}"
+            )
+    finally:
+        if not keep:
+            async with engine.begin() as conn:
+                await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the year overview queries on synthetic scrobbles")
+    parser.add_argument("--scrobbles", type=int, default=500_000, help="Number of synthetic scrobbles to load")
+    parser.add_argument("--years", type=int, default=3, help="Years of history to spread them over")
+    parser.add_argument("--artists", type=int, default=2_000, help="Number of distinct artists")
+    parser.add_argument("--runs", type=int, default=10, help="Timed runs per method")
+    parser.add_argument("--keep", action="store_true", help="Keep the bench schema for the next run")
+
+    args = parser.parse_args()
+    asyncio.run(main(args.scrobbles, args.years, args.artists, args.runs, args.keep))
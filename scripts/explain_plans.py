@@ -0,0 +1,143 @@
+"""
+usage: python -m scripts.explain_plans --label before
+with timings: python -m scripts.explain_plans --label after --analyze
+
+Captures the query plan of every statement each ScrobbleRepository method runs,
+using your most scrobbled artist, their top track and top album, and the latest year as arguments.
+Plans are written to explain_plans/<label>.txt, one section per method.
+
+To see what the indexes from the migrations change:
+    alembic downgrade 0002
+    python -m scripts.explain_plans --label before
+    alembic upgrade head
+    python -m scripts.explain_plans --label after
+    diff explain_plans/before.txt explain_plans/after.txt
+
+Methods reading columns a later revision adds, like the time buckets, are listed as failed in the earlier capture.
+"""
+import argparse
+import asyncio
+import os
+from datetime import date, datetime, timedelta
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+
+from core.database import session_manager
+from repositories.filters import ScrobbleFilter
+from repositories.scrobble_repo import ScrobbleRepository
+
+OUTPUT_DIR = "explain_plans"
+
+
+async def sample_arguments(repo: ScrobbleRepository) -> dict:
+    latest = await repo.get_latest_scrobbled_at()
+    if latest is None:
+        raise ValueError("No scrobbles stored yet, run scripts.sync_scrobbles first")
+
+    artist_name = (await repo.get_top_artists_between(None, None, limit=1))[0].artist_name
+    top_track = (await repo.get_top_tracks_by_artist(artist_name, limit=1))[0]
+    top_album = (await repo.get_top_albums_by_artist(artist_name, limit=1))[0]
+    return {
+        "artist_name": artist_name,
+        "track_name": top_track.track_name,
+        "album_name": top_album.album_name or "",
+        "year": latest.year,
+        "latest": latest,
+    }
+
+
+def repository_calls(repo: ScrobbleRepository, args: dict) -> dict:
+    """Each method to explain, as a zero-argument callable returning its awaitable."""
+    artist, track, album, year, latest = args["artist_name"], args["track_name"], args["album_name"], args["year"], args["latest"]
+    month_ago = latest - timedelta(days=30)
+
+    return {
+        "get_scrobbles(artist_name)": lambda: repo.get_scrobbles(ScrobbleFilter(artist_name=artist)),
+        "get_scrobbles(track_name)": lambda: repo.get_scrobbles(ScrobbleFilter(track_name=track)),
+        "get_scrobbles(album_name)": lambda: repo.get_scrobbles(ScrobbleFilter(album_name=album)),
+        "get_scrobbles(scrobbled_after, scrobbled_before)": lambda: repo.get_scrobbles(ScrobbleFilter(
+            scrobbled_after=month_ago.strftime("%Y-%m-%d"),
+            scrobbled_before=latest.strftime("%Y-%m-%d"),
+        )),
+        "get_latest_scrobble_id": lambda: repo.get_latest_scrobble_id(),
+        "get_latest_scrobbled_at": lambda: repo.get_latest_scrobbled_at(),
+        "get_daily_counts": lambda: repo.get_daily_counts(month_ago, latest),
+        "get_daily_plays": lambda: repo.get_daily_plays(month_ago),
+        "get_top_tracks_by_artist": lambda: repo.get_top_tracks_by_artist(artist, limit=10),
+        "get_top_albums_by_artist": lambda: repo.get_top_albums_by_artist(artist, limit=10),
+        "get_artist_counts_by_year": lambda: repo.get_artist_counts_by_year(artist),
+        "get_scrobbles_like_track": lambda: repo.get_scrobbles_like_track(track, artist),
+        "get_track_scrobbles": lambda: repo.get_track_scrobbles([track], artist),
+        "get_artists_with_no_ref_data": lambda: repo.get_artists_with_no_ref_data(),
+        "get_top_artists_by_month": lambda: repo.get_top_artists_by_month(year, latest.month),
+        "get_first_scrobble_by_year": lambda: repo.get_first_scrobble_by_year(year),
+        "get_plays_by_weekday_and_hour": lambda: repo.get_plays_by_weekday_and_hour(year),
+        "get_year_overview": lambda: repo.get_year_overview(year),
+        "get_yearly_summary": lambda: repo.get_yearly_summary(),
+    }
+
+
+async def main(label: str, analyze: bool):
+    await session_manager.init_db()
+    engine = session_manager.engine
+    captured: list[tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith("EXPLAIN"):
+            captured.append((statement, parameters))
+
+    explain = "EXPLAIN (ANALYZE, BUFFERS) " if analyze else "EXPLAIN "
+    sections = []
+
+    try:
+        async with session_manager.session_factory() as session:
+            repo = ScrobbleRepository(session)
+            args = await sample_arguments(repo)
+            logger.info(f"Explaining with {args}")
+
+            event.listen(engine.sync_engine, "before_cursor_execute", capture)
+            try:
+                for name, call in repository_calls(repo, args).items():
+                    captured.clear()
+                    try:
+                        await call()
+                    except DBAPIError as e:
+                        await session.rollback()
+                        error = str(e.orig).splitlines()[0]
+                        sections.append(f"== {name}\nfailed: {error}")
+                        logger.warning(f"{name}: failed, {error}")
+                        continue
+                    statements = list(captured)
+
+                    plans = []
+                    connection = await session.connection()
+                    for statement, parameters in statements:
+                        result = await connection.exec_driver_sql(explain + statement, parameters)
+                        plans.append("\n".join(row[0] for row in result))
+
+                    sections.append(f"== {name}\n" + "\n\n".join(plans))
+                    scans = "seq scan" if any("Seq Scan" in plan for plan in plans) else "index"
+                    logger.info(f"{name}: {len(statements)} statement(s), {scans}")
+            finally:
+                event.remove(engine.sync_engine, "before_cursor_execute", capture)
+            await session.rollback()
+    finally:
+        await session_manager.close_db()
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    path = os.path.join(OUTPUT_DIR, f"{label}.txt")
+    with open(path, "w") as f:
+        f.write(f"-- {label}, captured {datetime.now():%Y-%m-%d %H:%M}\n\n")
+        f.write("\n\n".join(sections) + "\n")
+    logger.info(f"Plans written to {path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Capture EXPLAIN plans for the ScrobbleRepository queries")
+    parser.add_argument("--label", type=str, default=date.today().isoformat(), help="Name of the output file")
+    parser.add_argument("--analyze", action="store_true", help="Run the queries and include actual timings")
+
+    args = parser.parse_args()
+    asyncio.run(main(args.label, args.analyze))
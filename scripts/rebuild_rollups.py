@@ -0,0 +1,40 @@
+"""
+usage: python -m scripts.rebuild_rollups
+one year: python -m scripts.rebuild_rollups --date_from 2024-01-01 --date_to 2025-01-01
+
+Recounts the daily play count rollups (daily_artist_plays, daily_album_plays, daily_track_plays)
+from the scrobbles table. Stats such as the year in review are read from these rollups.
+
+Scrobbles inserted by the sync, the TUI, and manual scrobbles keep the rollups up to date,
+so this is only needed once after upgrading, and after editing scrobbles by hand,
+e.g. with `scripts/scrobble_updates.sql`.
+"""
+import argparse
+import asyncio
+from datetime import datetime
+
+from loguru import logger
+
+from core.database import session_manager
+from repositories.rollup_repo import RollupRepository
+
+
+async def main(date_from: str = None, date_to: str = None):
+    await session_manager.init_db()
+    try:
+        result = await RollupRepository().rebuild(
+            date_from=datetime.strptime(date_from, "%Y-%m-%d").date() if date_from else None,
+            date_to=datetime.strptime(date_to, "%Y-%m-%d").date() if date_to else None,
+        )
+        logger.info(f"Rollup rebuild complete: {result}")
+    finally:
+        await session_manager.close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the daily play count rollups from the scrobbles table")
+    parser.add_argument("--date_from", type=str, help="First day to rebuild (YYYY-MM-DD), inclusive")
+    parser.add_argument("--date_to", type=str, help="Day to stop before (YYYY-MM-DD), exclusive")
+
+    args = parser.parse_args()
+    asyncio.run(main(args.date_from, args.date_to))
@@ -5,21 +5,21 @@ Simple script to test/debug the LastFmService
 """
 import asyncio
 
-from pylast import Artist, Album, Track
-
 from services.lastfm_service import LastFmService
 
 
 async def main():
     lastfm_service = LastFmService()
 
-    artist: Artist = lastfm_service.network.get_artist("NOFX")
+    try:
+        artist = await lastfm_service.get_artist("NOFX")
 
-    album: Album = lastfm_service.network.get_album("NOFX", "Punk in Drublic")
+        album = await lastfm_service.get_album("Punk in Drublic", "NOFX")
 
-    track: Track = lastfm_service.network.get_track("NOFX", "Linoleum")
+        track = await lastfm_service.get_track("Linoleum", "NOFX")
+    finally:
+        await lastfm_service.close()
 
 
 if __name__ == "__main__":
     asyncio.run(main())
-
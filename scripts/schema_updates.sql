@@ -0,0 +1,25 @@
+/**
+  A running log of schema changes for databases created before the change.
+  New databases get these from `Base.metadata.create_all` on startup.
+  Superseded by the Alembic migrations in `migrations/` (`alembic upgrade head`), which include everything below.
+ */
+
+-- natural key for scrobbles, required by the bulk insert's ON CONFLICT DO NOTHING.
+-- remove existing duplicates first, keeping the oldest row.
+delete from scrobbles s
+using scrobbles d
+where lower(s.artist_name) = lower(d.artist_name)
+and lower(s.track_name) = lower(d.track_name)
+and s.scrobbled_at = d.scrobbled_at
+and s.id > d.id;
+
+create unique index if not exists uq_scrobbles_artist_track_scrobbled_at
+on scrobbles (lower(artist_name), lower(track_name), scrobbled_at);
+
+-- when reference data was last refreshed from Last.fm, for staleness-driven refreshes.
+alter table artists add column if not exists last_synced_at timestamp without time zone;
+alter table albums add column if not exists last_synced_at timestamp without time zone;
+alter table tracks add column if not exists last_synced_at timestamp without time zone;
+create index if not exists ix_artists_last_synced_at on artists (last_synced_at);
+create index if not exists ix_albums_last_synced_at on albums (last_synced_at);
+create index if not exists ix_tracks_last_synced_at on tracks (last_synced_at);
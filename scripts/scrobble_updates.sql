@@ -2,6 +2,7 @@
   A running log of sql statements to clean up various album names,
   ensuring data integrity when viewed in the TUI app.
   Yes, this is a bit obsessive.
+  Afterwards, run `python -m scripts.rebuild_rollups` so the play count rollups match.
  */
 
 update scrobbles
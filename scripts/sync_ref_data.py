@@ -1,36 +1,55 @@
 """
 usage: python -m scripts.sync_ref_data
+with inputs: python -m scripts.sync_ref_data --all --workers 8
+refresh stale data: python -m scripts.sync_ref_data --stale
 
 Gets the distinct tracks, artists, and albums from the user
 scrobble history, and updates applicable database reference tables
 with data from Last.fm's API.
 
-"""
+Entities are streamed from the database to a pool of concurrent workers,
+so the sync is bound by LASTFM_REQUESTS_PER_SECOND rather than request latency.
+Progress, failures, and retries are logged as it runs.
+
+With --stale, entities with no reference data or data older than REF_DATA_TTL_DAYS
+are refreshed, most scrobbled first and at most REF_DATA_MAX_PER_RUN of each kind,
+so a scheduled run keeps the data you actually listen to fresh within a fixed API budget.
 
+"""
+import argparse
 import asyncio
 
+from loguru import logger
+
+from core import config
 from core.database import session_manager
+from library.dependencies import close_services
 from services.sync_service import SyncService
 
 
-async def main():
+async def main(only_missing: bool = True, workers: int = None, stale: bool = False):
     await session_manager.init_db()
-    async with session_manager.session_factory() as db:
-        try:
-            sync_service = SyncService(db=db)
-            await sync_service.sync_all_ref_data()
+    try:
+        sync_service = SyncService()
+        result = await sync_service.sync_all_ref_data(only_missing=only_missing, workers=workers, stale=stale)
+        logger.info(f"Reference data sync complete: {result}")
 
-            # Alternatively, sync individual entities:
+        # Alternatively, sync individual entities:
 
-            # await sync_service.sync_artists()
-            # await sync_service.sync_albums()
-            # await sync_service.sync_tracks()
+        # await sync_service.sync_artists()
+        # await sync_service.sync_albums()
+        # await sync_service.sync_tracks()
 
-        finally:
-            await db.close()
-            await session_manager.close_db()
+    finally:
+        await close_services()
+        await session_manager.close_db()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Sync reference data from Last.fm")
+    parser.add_argument("--all", action="store_true", help="Refresh every entity instead of only those missing reference data")
+    parser.add_argument("--stale", action="store_true", help="Refresh missing or stale entities, most scrobbled first")
+    parser.add_argument("--workers", type=int, default=config.SYNC_WORKERS, help="Number of concurrent workers")
 
+    args = parser.parse_args()
+    asyncio.run(main(not args.all, args.workers, args.stale))
@@ -1,40 +1,68 @@
 """
 usage: python -m scripts.sync_scrobbles
+full history: python -m scripts.sync_scrobbles --full
 with inputs: python -m scripts.sync_scrobbles --time_from 2025-08-29 --time_to 2025-09-01
+in parallel: python -m scripts.sync_scrobbles --workers 4
+after an interruption: python -m scripts.sync_scrobbles --resume
 
 This script will fetch user recent tracks backwards and save them to the database.
 
+Without a date range it runs incrementally: only plays newer than the latest stored
+scrobble are fetched, so a scheduled (e.g. nightly) run costs one or two API calls.
+Use --full to page through the entire history instead.
+
 Be mindful of API usage.
 For 120k total scrobbles, this script will make 600 API calls to fetch all the data.
-120000/200 = 600 API calls, or about 10 minutes.
+120000/200 = 600 API calls, or about 10 minutes when run with a single worker.
+With several workers the range is split into time windows fetched concurrently,
+so the sync is bound by LASTFM_REQUESTS_PER_SECOND instead of request latency.
+
+Progress is checkpointed in the `sync_jobs` table, so `--resume` continues the last
+unfinished sync instead of starting over from now.
 """
 import argparse
 import asyncio
 
 from loguru import logger
 
+from core import config
 from core.database import session_manager
+from library.dependencies import close_services
 from services.sync_service import SyncService
 
 
-async def main(time_from: str = None, time_to: str = None):
+async def main(
+        time_from: str = None,
+        time_to: str = None,
+        workers: int = 1,
+        resume: bool = False,
+        incremental: bool = False,
+):
     await session_manager.init_db()
-
-    sync_service = SyncService()
-    result = await sync_service.sync_scrobbles(
-        time_from=time_from,
-        time_to=time_to,
-    )
-    logger.info(f"Sync complete. {result["new_scrobbles"]} new scrobbles added.")
-
-    await session_manager.close_db()
+    try:
+        sync_service = SyncService()
+        result = await sync_service.sync_scrobbles(
+            time_from=time_from,
+            time_to=time_to,
+            workers=workers,
+            resume=resume,
+            incremental=incremental,
+        )
+        logger.info(f"Sync complete. {result["new_scrobbles"]} new scrobbles added.")
+    finally:
+        await close_services()
+        await session_manager.close_db()
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Sync scrobbles from Last.fm")
     parser.add_argument("--time_from", type=str, help="Start date in YYYY-MM-DD format")
     parser.add_argument("--time_to", type=str, help="End date in YYYY-MM-DD format")
+    parser.add_argument("--workers", type=int, default=config.SYNC_WORKERS, help="Number of concurrent fetch workers")
+    parser.add_argument("--resume", action="store_true", help="Continue the last unfinished sync")
+    parser.add_argument("--full", action="store_true", help="Sync the entire history instead of only new scrobbles")
 
     args = parser.parse_args()
-    asyncio.run(main(args.time_from, args.time_to))
+    incremental = not (args.full or args.time_from or args.time_to)
+    asyncio.run(main(args.time_from, args.time_to, args.workers, args.resume, incremental))
 
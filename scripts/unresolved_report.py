@@ -0,0 +1,42 @@
+"""
+usage: python -m scripts.unresolved_report
+only albums: python -m scripts.unresolved_report --method album.getInfo --limit 50
+forget them: python -m scripts.unresolved_report --clear
+
+Lists the artists, albums, and tracks Last.fm could not find, from the negative cache
+in the response cache file, most frequently skipped first. These are usually misspelled
+tags in the music library, worth fixing at the source.
+
+Entries expire after LASTFM_CACHE_TTL_UNRESOLVED, after which they are looked up again.
+"""
+import argparse
+import asyncio
+from datetime import datetime
+
+from services.lastfm_service import response_cache
+
+
+async def main(limit: int = 20, method: str = None):
+    rows = await response_cache.unresolved_report(limit=limit, method=method)
+    if not rows:
+        print("No unresolved lookups.")
+        return
+
+    for row in rows:
+        params = ", ".join(f"{k}={v}" for k, v in row["params"].items())
+        expires = datetime.fromtimestamp(row["expires_at"]).strftime("%Y-%m-%d")
+        print(f"{row['skipped']:>6} skipped  {row['method']:<16} {params}  (error {row['reason']}: {row['message']}, until {expires})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report lookups Last.fm could not resolve")
+    parser.add_argument("--limit", type=int, default=20, help="Number of entries to show")
+    parser.add_argument("--method", type=str, help="Only this API method, e.g. album.getInfo")
+    parser.add_argument("--clear", action="store_true", help="Forget every unresolved lookup")
+
+    args = parser.parse_args()
+    if args.clear:
+        response_cache.clear_unresolved()
+        print("Cleared unresolved lookups.")
+    else:
+        asyncio.run(main(args.limit, args.method))
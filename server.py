@@ -8,6 +8,7 @@ from loguru import logger
 from core import config
 from routers.router import router
 from core.database import session_manager
+from library.dependencies import close_services
 
 
 @asynccontextmanager
@@ -24,6 +25,8 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    await close_services()
+
     if db_connected:
         await session_manager.close_db()
         logger.info("Database connection closed.")
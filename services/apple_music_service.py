@@ -4,6 +4,8 @@ import base64
 from applescript import AppleScript, AEType, kae, ScriptError
 from loguru import logger
 
+from core import config
+from library.executor import BoundedExecutor
 from library.integrations import PlaybackAction
 from library.utils import clean_up_title
 from models.schemas import AppleMusicTrack, MacOS
@@ -12,6 +14,9 @@ from models.schemas import AppleMusicTrack, MacOS
 Apple Music related methods
 """
 
+# AppleScript calls block, so they get their own threads rather than sharing the default executor.
+applescript_executor = BoundedExecutor("apple_music", config.APPLE_MUSIC_EXECUTOR_WORKERS)
+
 
 async def handle_applescript_error(e: ScriptError) -> None:
     if e.number == -1728:
@@ -39,7 +44,7 @@ async def poll_apple_music() -> AppleMusicTrack | None:
     """
     try:
         result = await asyncio.wait_for(
-            asyncio.to_thread(AppleScript(script).run),
+            applescript_executor.run(AppleScript(script).run),
             timeout=3  # seconds
         )
         track = result[0]
@@ -93,7 +98,7 @@ async def playback_control(action: PlaybackAction) -> bool:
     end tell
     """
     try:
-        result = AppleScript(script).run()
+        result = await applescript_executor.run(AppleScript(script).run)
         return result
     except ScriptError as e:
         await handle_applescript_error(e)
@@ -117,7 +122,7 @@ async def set_volume(volume: int) -> bool:
     end tell
     """
     try:
-        result = AppleScript(script).run()
+        result = await applescript_executor.run(AppleScript(script).run)
         return result
     except ScriptError as e:
         await handle_applescript_error(e)
@@ -139,7 +144,7 @@ async def get_volume() -> int:
     end tell
     """
     try:
-        result = AppleScript(script).run()
+        result = await applescript_executor.run(AppleScript(script).run)
         return result
     except ScriptError as e:
         await handle_applescript_error(e)
@@ -160,7 +165,7 @@ async def get_current_track_artwork_data() -> str | None:
     end tell
     """
     try:
-        result = AppleScript(script).run()
+        result = await applescript_executor.run(AppleScript(script).run)
         artwork_data = result[0]
 
         if artwork_data:
@@ -192,7 +197,7 @@ async def get_macos_information() -> MacOS | None:
     """
 
     try:
-        result = AppleScript(script).run()
+        result = await applescript_executor.run(AppleScript(script).run)
 
         return MacOS(
             user_name=result[0],
@@ -1,18 +1,30 @@
-import asyncio
+from typing import Any, Callable
+
+from library.executor import BoundedExecutor, Lane
 
 
 class BaseAsyncClient:
-    """Base class for asynchronous clients interacting with synchronous libraries."""
-    def __init__(self):
-        pass
+    """
+    Base class for asynchronous clients interacting with synchronous libraries.
+    Each client gets its own bounded thread pool, created on first use, so one busy
+    service cannot starve the blocking calls of another.
+    """
+    def __init__(self, name: str = None, workers: int = 4):
+        self.executor_name = name or type(self).__name__
+        self.executor_workers = workers
+        self.executor: BoundedExecutor | None = None
 
-    async def _run_sync(self, func, *args, **kwargs):
+    async def _run_sync(self, func: Callable[..., Any], *args, lane: Lane = None, **kwargs) -> Any:
         """
-        Helper method to run synchronous calls in a thread pool.
+        Helper method to run synchronous calls in the client's thread pool.
         This prevents blocking the async event loop.
+        Calls run in the lane of the current task (see `library.executor.background`) unless `lane` is given.
         """
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: func(*args, **kwargs))
+        if self.executor is None:
+            self.executor = BoundedExecutor(self.executor_name, self.executor_workers)
+        return await self.executor.run(func, *args, lane=lane, **kwargs)
+
+    async def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
@@ -0,0 +1,161 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from loguru import logger
+
+from core.database import session_manager
+from models.schemas import LastFmTrack, RecentTrackRow, Track
+from repositories.scrobble_repo import ScrobbleRepository
+from services.lastfm_service import daily_stats
+
+# Scrobbles carry the time the play started and can reach Last.fm a while later,
+# so each top-up fetches this far back again.
+TOP_UP_OVERLAP = 3600
+
+# When the database was last synced longer ago than this, the plays since then are too many
+# to page through on every song change, so the current track's scrobbles come from Last.fm instead.
+MAX_UNSYNCED_AGE = timedelta(days=7)
+
+
+class HistoryService:
+    """
+    Answers questions about the user's listening history from the local scrobbles table
+    when the database is connected, fetching from Last.fm only the plays made since the
+    last sync. Without a database, or before the first sync, everything comes from Last.fm.
+    """
+    def __init__(self):
+        self.scrobble_repo = ScrobbleRepository()
+        # plays fetched from Last.fm since the latest stored scrobble, kept so that
+        # each call only has to fetch the plays made since the previous one
+        self._unsynced_rows: dict[tuple[int, str, str], RecentTrackRow] = {}
+        self._unsynced_from: int | None = None
+        self._unsynced_until: int | None = None
+        self._unsynced_lock = asyncio.Lock()
+
+    @staticmethod
+    def db_connected() -> bool:
+        return session_manager.session_factory is not None
+
+    async def _get_synced_until(self, time_from: datetime) -> datetime | None:
+        """The latest stored scrobble, if the database has any plays since `time_from`."""
+        if not self.db_connected():
+            return None
+
+        try:
+            latest = await self.scrobble_repo.get_latest_scrobbled_at()
+        except Exception as e:
+            logger.warning(f"Could not read scrobbles from the database, using Last.fm instead: {e}")
+            return None
+
+        if latest is None or latest < time_from:
+            return None
+        return latest
+
+    async def _get_unsynced_rows(self, synced_until: datetime) -> list[RecentTrackRow]:
+        """Plays made since the latest stored scrobble, newest first."""
+        from library.dependencies import get_lastfm_service
+
+        lastfm_service = await get_lastfm_service()
+        time_from = int(synced_until.timestamp()) + 1
+
+        async with self._unsynced_lock:
+            if self._unsynced_from != time_from:
+                # a sync ran since the last call, so start over from the new latest scrobble
+                self._unsynced_rows = {}
+                self._unsynced_from = time_from
+                self._unsynced_until = None
+
+            start = time_from if self._unsynced_until is None else max(time_from, self._unsynced_until - TOP_UP_OVERLAP)
+            now = int(time.time())
+            rows = await lastfm_service.get_recent_track_rows_between(start, now)
+            for row in rows:
+                self._unsynced_rows[(row.timestamp, row.artist_name.lower(), row.track_name.lower())] = row
+            self._unsynced_until = now
+
+            return sorted(self._unsynced_rows.values(), key=lambda r: r.timestamp, reverse=True)
+
+    async def get_user_30_day_stats(self) -> dict[str, dict[str, int]]:
+        from library.dependencies import get_lastfm_service
+
+        lastfm_service = await get_lastfm_service()
+        now = datetime.now()
+        thirty_days_ago = now - timedelta(days=30)
+
+        synced_until = await self._get_synced_until(thirty_days_ago)
+        if synced_until is None:
+            return await lastfm_service.get_user_30_day_stats()
+
+        # Days before the last synced one are complete in the database. The last synced day
+        # and anything after it mix stored plays with plays from Last.fm, so those are
+        # counted from the individual plays instead.
+        tail_start = datetime.combine(synced_until.date(), datetime.min.time())
+
+        stored_counts = await self.scrobble_repo.get_daily_counts(thirty_days_ago, tail_start)
+        stored_plays = await self.scrobble_repo.get_daily_plays(tail_start)
+        new_rows = await self._get_unsynced_rows(synced_until)
+
+        tail = daily_stats([
+            *((datetime.fromtimestamp(row.timestamp).date(), row.artist_name, row.track_name, row.album_name) for row in new_rows),
+            *((row.date, row.artist_name, row.track_name, row.album_name) for row in stored_plays),
+        ])
+        tail = dict(sorted(tail.items(), reverse=True))
+
+        return tail | {
+            row.date.strftime('%Y-%m-%d'): {
+                "track_count": row.track_count,
+                "artist_count": row.artist_count,
+                "album_count": row.album_count,
+            }
+            for row in stored_counts
+        }
+
+    async def current_track_user_scrobbles(self, current_song: Track) -> bool | list[LastFmTrack]:
+        """
+        The user's scrobbles of the current song, newest first, under its name or its clean name
+        (e.g. without "(Remastered 2021)"), like `LastFmService.current_track_user_scrobbles`.
+        Stored scrobbles come from the database, and only plays since the last sync from Last.fm,
+        as long as the last sync is within `MAX_UNSYNCED_AGE`.
+        """
+        from library.dependencies import get_lastfm_service
+
+        synced_until = await self._get_synced_until(datetime.now() - MAX_UNSYNCED_AGE)
+        if synced_until is None:
+            lastfm_service = await get_lastfm_service()
+            return await lastfm_service.current_track_user_scrobbles(current_song)
+
+        names = [current_song.name]
+        if current_song.has_clean_name:
+            names.append(current_song.clean_name)
+        lower_names = {name.lower() for name in names}
+        artist = current_song.artist.lower()
+
+        try:
+            unsynced = await self._get_unsynced_rows(synced_until)
+        except Exception as e:
+            logger.error(f"Failed to get recent scrobbles for {current_song.display_name}: {e}")
+            return False
+
+        tracks = [
+            LastFmTrack(
+                name=row.track_name,
+                artist=row.artist_name,
+                album=row.album_name,
+                scrobbled_at=datetime.fromtimestamp(row.timestamp),
+            )
+            for row in unsynced
+            if row.track_name.lower() in lower_names and row.artist_name.lower() == artist
+        ]
+
+        scrobbles = await self.scrobble_repo.get_track_scrobbles(names, current_song.artist)
+        tracks.extend(
+            LastFmTrack(
+                name=s.track_name,
+                artist=s.artist_name,
+                album=s.album_name,
+                scrobbled_at=s.scrobbled_at,
+            )
+            for s in scrobbles
+        )
+
+        return tracks
@@ -1,30 +1,44 @@
+import asyncio
+import hashlib
+import importlib.util
 import time
 from collections import defaultdict
-from datetime import datetime, timedelta
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, Iterable
 
 import httpx
-import pylast
-import requests
+import orjson
 from loguru import logger
 
 from core import config
-from library.utils import clean_up_title, lastfm_friendly
-from models.schemas import LastFmUser, LastFmTrack, TopItem, Artist, Album, Track, SimilarTrack
+from library.memo import AsyncMemo
+from library.rate_limiter import RateLimiter
+from library.response_cache import ResponseCache, Unresolved
+from library.utils import clean_up_title
+from models.schemas import (
+    LastFmUser, LastFmTrack, TopItem, Artist, Album, Track, SimilarTrack, RecentTrackRow, ScrobbleResult
+)
 from services.base_async_client import BaseAsyncClient
 
 LASTFM_API_URL = config.LASTFM_API_URL
 LASTFM_API_KEY = config.LASTFM_API_KEY
 LASTFM_API_SECRET = config.LASTFM_API_SECRET
 LASTFM_USERNAME = config.LASTFM_USERNAME
-LASTFM_PASSWORD_HASH = pylast.md5(config.LASTFM_PASSWORD)
 
+# Every Last.fm request in the process waits its turn here.
+rate_limiter = RateLimiter(config.LASTFM_REQUESTS_PER_SECOND, config.LASTFM_REQUEST_BURST)
 
-user_params = {
-    'method': 'user.getInfo',
-    'user': LASTFM_USERNAME,
-    'api_key': LASTFM_API_KEY,
-    'format': 'json'
-}
+# Entity info barely changes, so it is cached on disk and shared across processes.
+response_cache = ResponseCache(
+    path=config.LASTFM_CACHE_PATH,
+    max_entries=config.LASTFM_CACHE_MAX_ENTRIES,
+    enabled=config.LASTFM_CACHE_ENABLED,
+)
+
+# Consecutive tracks usually share an album, so album lookups are also kept in memory for a few minutes.
+album_memo = AsyncMemo("album", ttl=config.LASTFM_MEMO_TTL, max_entries=config.LASTFM_MEMO_MAX_ENTRIES)
 
 
 def format_user_response(user_info: dict) -> LastFmUser:
@@ -53,161 +67,390 @@ def format_user_response(user_info: dict) -> LastFmUser:
     )
 
 
-# https://www.last.fm/api/show/user.getInfo
-# Manual API call
-async def get_lastfm_user() -> LastFmUser:
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(LASTFM_API_URL, params=user_params)
-            response.raise_for_status()
-            user_info = response.json()['user']
-    except httpx.TimeoutException:
-        raise Exception("Last.fm API request timed out")
-    except httpx.HTTPError as e:
-        raise Exception(f"Last.fm API error: {str(e)}")
-    except Exception as e:
-        raise Exception(f"Error fetching user info: {str(e)}")
+class LastFmApiError(Exception):
+    """Error payload returned by the Last.fm API, e.g. code 6 for an invalid parameter / not found."""
+    def __init__(self, code: int, message: str):
+        super().__init__(f"Last.fm API error {code}: {message}")
+        self.code = code
+        self.message = message
+
+
+# operation failed, service offline, temporarily unavailable, rate limit exceeded
+TRANSIENT_ERROR_CODES = {8, 11, 16, 29}
+# invalid parameters, which is what Last.fm returns for an unknown artist, album or track
+NOT_FOUND = 6
+
+# most scrobbles track.scrobble takes in one request
+SCROBBLE_BATCH_SIZE = 50
+
+
+class RequestCounter:
+    def __init__(self):
+        self.count = 0
+        self.methods: list[str] = []
+
 
-    return format_user_response(user_info)
+# Counts the JSON API requests made within `count_requests`, per task.
+_request_counter: ContextVar[RequestCounter | None] = ContextVar("lastfm_request_counter", default=None)
 
 
-def get_lastfm_account_details() -> LastFmUser:
-    """Deprecated: Use async version `get_lastfm_user` instead."""
+@contextmanager
+def count_requests(label: str, expected: int):
+    """
+    Count the Last.fm requests made inside the block and warn when there are more than
+    `expected`, so a fetcher that regresses to one request per field gets noticed.
+    With `LASTFM_STRICT_REQUEST_COUNTS`, as in the tests, it raises an AssertionError instead.
+    """
+    counter = RequestCounter()
+    token = _request_counter.set(counter)
     try:
-        response = requests.get(LASTFM_API_URL, params=user_params)
-        user_info = response.json()['user']
-    except requests.RequestException as e:
-        raise Exception(f"Last.fm API error: {str(e)}")
+        yield counter
+    finally:
+        _request_counter.reset(token)
+
+    if counter.count > expected:
+        message = f"Fetching {label} took {counter.count} Last.fm requests ({', '.join(counter.methods)}), expected at most {expected}."
+        if config.LASTFM_STRICT_REQUEST_COUNTS:
+            raise AssertionError(message)
+        logger.warning(message)
+
+
+def is_transient_error(e: Exception) -> bool:
+    """Whether a failed Last.fm call is worth retrying."""
+    if isinstance(e, httpx.TransportError):
+        return True
+    if isinstance(e, httpx.HTTPStatusError):
+        return e.response.status_code >= 500
+    if isinstance(e, LastFmApiError):
+        return int(e.code) in TRANSIENT_ERROR_CODES
+    return False
+
+
+def as_list(value) -> list:
+    """The JSON API returns a single item as an object rather than a list, and no items as nothing."""
+    if value is None:
+        return []
+    return [value] if isinstance(value, dict) else value
+
+
+def largest_image(images: list[dict] | None) -> str | None:
+    """Image lists are ordered small to large; some sizes may be empty."""
+    return next((i['#text'] for i in reversed(images or []) if i.get('#text')), None)
+
+
+def sized_image(images: list[dict] | None, size: str) -> str | None:
+    return next((i['#text'] for i in images or [] if i.get('size') == size and i.get('#text')), None)
+
+
+def parse_recent_tracks(payload: dict) -> list[RecentTrackRow]:
+    """
+    Parse a user.getRecentTracks JSON response into rows in one pass.
+    Skips the now playing track, which has no timestamp yet.
+    """
+    rows = []
+    for t in as_list(payload['recenttracks'].get('track')):
+        date = t.get('date')
+        if not date:
+            continue
+
+        artist = t['artist']
+        loved = t.get('loved')
+
+        rows.append(RecentTrackRow(
+            track_name=t['name'],
+            # extended responses name the artist in `name`, regular ones in `#text`
+            artist_name=artist.get('name') or artist.get('#text'),
+            album_name=t['album']['#text'] or None,
+            timestamp=int(date['uts']),
+            loved=loved == '1' if loved is not None else None,
+            image_url=largest_image(t.get('image')),
+        ))
+
+    return rows
+
+
+def daily_stats(plays: Iterable[tuple[date, str, str, str | None]]) -> dict[str, dict[str, int]]:
+    """Count the distinct tracks, artists and albums per day from (date, artist, track, album) plays."""
+    stats = defaultdict(lambda: {"tracks": set(), "artists": set(), "albums": set()})
+    for day, artist_name, track_name, album_name in plays:
+        day_stats = stats[day.strftime('%Y-%m-%d')]
+        day_stats["tracks"].add((artist_name, track_name))
+        day_stats["artists"].add(artist_name)
+        day_stats["albums"].add((artist_name, album_name))
+
+    return {
+        day: {
+            "track_count": len(s["tracks"]),
+            "artist_count": len(s["artists"]),
+            "album_count": len(s["albums"]),
+        }
+        for day, s in stats.items()
+    }
+
+
+def md5(text: str) -> str:
+    return hashlib.md5(text.encode('utf-8')).hexdigest()
+
+
+def sign(params: dict[str, str]) -> str:
+    """Last.fm request signature: the md5 of the sorted name/value pairs followed by the API secret."""
+    return md5("".join(f"{k}{params[k]}" for k in sorted(params)) + LASTFM_API_SECRET)
+
 
-    return format_user_response(user_info)
+def use_http2() -> bool:
+    if not config.LASTFM_HTTP2:
+        return False
+    if importlib.util.find_spec('h2') is None:
+        logger.warning("LASTFM_HTTP2 is set but the `h2` package is not installed. Using HTTP/1.1.")
+        return False
+    return True
 
 
 """
-LastFM API related methods using pylast library
+LastFM API related methods
 """
 class LastFmService(BaseAsyncClient):
     """
-    Service for interacting with the Last.fm API using pylast.
-    Pylast makes synchronous calls, so requests are run in a thread pool to avoid blocking.
+    Service for interacting with the Last.fm API.
+    Every request goes through one long-lived async http client, so connections are kept
+    alive between calls, and is paced by the process-wide rate limiter.
+    Call `close` when done with the service.
     """
     def __init__(self):
         super().__init__()
-        self.network = pylast.LastFMNetwork(
-            api_key=LASTFM_API_KEY,
-            api_secret=LASTFM_API_SECRET,
-            username=LASTFM_USERNAME,
-            password_hash=LASTFM_PASSWORD_HASH
-        )
-        self.user: pylast.User = self.network.get_user(LASTFM_USERNAME)
-        logger.info(f"Last.fm user {LASTFM_USERNAME} successfully authenticated.")
+        self.http: httpx.AsyncClient | None = None
+        self.session_key: str | None = None
+        self._session_lock = asyncio.Lock()
+
+    def _get_http(self) -> httpx.AsyncClient:
+        if self.http is None:
+            self.http = httpx.AsyncClient(
+                http2=use_http2(),
+                limits=httpx.Limits(
+                    max_connections=config.LASTFM_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=config.LASTFM_HTTP_MAX_KEEPALIVE,
+                ),
+                timeout=httpx.Timeout(config.LASTFM_HTTP_TIMEOUT, connect=config.LASTFM_HTTP_CONNECT_TIMEOUT),
+            )
+        return self.http
+
+    async def close(self) -> None:
+        if self.http is not None:
+            await self.http.aclose()
+            self.http = None
+        # write the cache hits that are still batched in memory
+        await response_cache.flush()
+        await super().close()
+
+    async def _request(self, method: str, params: dict, signed: bool = False) -> dict:
+        params = {
+            'method': method,
+            'api_key': LASTFM_API_KEY,
+            **{k: str(v) for k, v in params.items() if v is not None},
+        }
+        if signed:
+            params['api_sig'] = sign(params)
+        params['format'] = 'json'
+
+        counter = _request_counter.get()
+        if counter is not None:
+            counter.count += 1
+            counter.methods.append(method)
+
+        await rate_limiter.acquire()
+        http = self._get_http()
+        if signed:
+            response = await http.post(LASTFM_API_URL, data=params)
+        else:
+            response = await http.get(LASTFM_API_URL, params=params)
+
+        try:
+            payload = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # e.g. an HTML error page from a proxy
+            response.raise_for_status()
+            raise
+
+        if 'error' in payload:
+            raise LastFmApiError(payload['error'], payload.get('message', ''))
+        response.raise_for_status()
+
+        return payload
+
+    async def _api_get(self, method: str, params: dict) -> dict:
+        """Call an unsigned Last.fm API method and return the decoded JSON payload."""
+        return await self._request(method, params)
+
+    async def _api_post(self, method: str, params: dict) -> dict:
+        """Call a signed Last.fm API method on behalf of the user, e.g. track.scrobble."""
+        session_key = await self._get_session_key()
+        return await self._request(method, {**params, 'sk': session_key}, signed=True)
+
+    async def _api_pages(self, method: str, params: dict, root: str, item: str) -> AsyncIterator[list[dict]]:
+        """Yield the items of each page of a paginated list, up to the last page."""
+        page = 1
+        while True:
+            body = (await self._api_get(method, {**params, 'page': page}))[root]
+            yield as_list(body.get(item))
+
+            if page >= int(body.get('@attr', {}).get('totalPages', 1)):
+                break
+            page += 1
+
+    async def _api_items(
+            self,
+            method: str,
+            params: dict,
+            root: str,
+            item: str,
+            page_size: int = 50,
+            max_items: int = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Yield the items of a paginated list one by one as each page arrives,
+        stopping after `max_items` without fetching further pages.
+        """
+        if max_items is not None:
+            page_size = min(page_size, max_items)
+
+        count = 0
+        async for page in self._api_pages(method, {**params, 'limit': page_size}, root, item):
+            for entry in page:
+                yield entry
+                count += 1
+                if max_items is not None and count >= max_items:
+                    return
+
+    async def _get_session_key(self) -> str:
+        async with self._session_lock:
+            if self.session_key is None:
+                password_hash = md5(config.LASTFM_PASSWORD)
+                payload = await self._request('auth.getMobileSession', {
+                    'username': LASTFM_USERNAME,
+                    'authToken': md5(LASTFM_USERNAME + password_hash),
+                }, signed=True)
+                self.session_key = payload['session']['key']
+                logger.info(f"Last.fm user {LASTFM_USERNAME} successfully authenticated.")
+        return self.session_key
+
+    async def get_user(self) -> LastFmUser:
+        payload = await self._api_get('user.getInfo', {'user': LASTFM_USERNAME})
+        return format_user_response(payload['user'])
+
+    async def get_recent_track_rows(
+            self,
+            time_to: int = None,
+            time_from: int = None,
+            limit: int = 200,
+            page: int = 1,
+            extended: bool = False,
+    ) -> list[RecentTrackRow]:
+        """
+        Fetch one page of the user's scrobbles, newest first, as compact rows.
+        With `extended`, loved status comes with the same request.
+        """
+        payload = await self._api_get('user.getRecentTracks', {
+            'user': LASTFM_USERNAME,
+            'limit': limit,
+            'page': page,
+            'from': time_from,
+            'to': time_to,
+            'extended': 1 if extended else None,
+        })
+        return parse_recent_tracks(payload)
+
+    async def get_recent_track_rows_between(self, time_from: int, time_to: int) -> list[RecentTrackRow]:
+        """Every scrobble in [time_from, time_to], newest first, fetched page by page."""
+        rows = []
+        page = 1
+        while True:
+            page_rows = await self.get_recent_track_rows(time_from=time_from, time_to=time_to, page=page)
+            rows.extend(page_rows)
+            if len(page_rows) < 200:
+                break
+            page += 1
+        return rows
 
     async def get_user_playcount(self) -> str:
-        playcount = await self._run_sync(self.user.get_playcount)
-        return format(int(playcount), ',')
+        user = await self.get_user()
+        return user.playcount
 
     async def get_user_recent_tracks(self) -> list[LastFmTrack]:
-        recent_tracks = await self._run_sync(
-            self.user.get_recent_tracks,
-            limit=20
-        )
-        tracks = []
-        for track in recent_tracks:
-            try:
-                # Note: Using `lambda t=track:` to capture the current track reference properly in the loop
-                timestamp = await self._run_sync(lambda t=track: int(t.timestamp))
-                scrobbled_at = datetime.fromtimestamp(timestamp)
-
-                album_name = await self._run_sync(lambda t=track: t.album)
-                artist_name = await self._run_sync(lambda t=track: t.track.artist.name)
-                track_title = await self._run_sync(lambda t=track: t.track.title)
-
-                lft = LastFmTrack(
-                    name=track_title,
-                    artist=artist_name,
-                    album=album_name,
-                    scrobbled_at=scrobbled_at
-                )
-                tracks.append(lft)
-            except Exception as e:
-                logger.error(f"Failed to process track: {e}")
-                continue
-
-        return tracks
+        rows = await self.get_recent_track_rows(limit=20)
+        return [
+            LastFmTrack(
+                name=row.track_name,
+                artist=row.artist_name,
+                album=row.album_name,
+                scrobbled_at=datetime.fromtimestamp(row.timestamp)
+            )
+            for row in rows
+        ]
 
-    async def get_user_played_tracks_by_time_to(self, time_to: int, limit: int = 20) -> list[pylast.PlayedTrack]:
-        return await self._run_sync(
-            self.user.get_recent_tracks,
-            limit=limit,
-            time_to=time_to
+    async def iter_user_loved_tracks(self, page_size: int = 50, max_items: int = None) -> AsyncIterator[LastFmTrack]:
+        items = self._api_items(
+            'user.getLovedTracks', {'user': LASTFM_USERNAME}, 'lovedtracks', 'track', page_size, max_items
         )
-
-    async def get_user_loved_tracks(self) -> list[LastFmTrack]:
-        # TODO update to use async calls
-        loved_tracks = self.user.get_loved_tracks()
-        tracks = []
-        for track in loved_tracks:
-            loved_at = datetime.fromtimestamp(int(track.timestamp))
-            t = LastFmTrack(
-                name=track.track.title,
-                artist=track.track.artist.name,
+        async for track in items:
+            loved_at = datetime.fromtimestamp(int(track['date']['uts']))
+            yield LastFmTrack(
+                name=track['name'],
+                artist=track['artist']['name'],
                 loved_at=loved_at.strftime(config.DATETIME_FORMAT)
             )
-            tracks.append(t)
 
-        return tracks
-
-    async def get_user_top_artists(self) -> list[TopItem]:
-        # TODO update to use async calls
-        top_artists = self.user.get_top_artists(limit=10)
-        artists = []
-        for artist in top_artists:
-            details = artist.item
+    async def iter_user_top_artists(self, page_size: int = 50, max_items: int = None) -> AsyncIterator[TopItem]:
+        items = self._api_items(
+            'user.getTopArtists', {'user': LASTFM_USERNAME}, 'topartists', 'artist', page_size, max_items
+        )
+        async for artist in items:
             model = Artist(
-                name=details.name,
-                playcount=details.get_playcount(),
-                url=details.get_url()
+                name=artist['name'],
+                playcount=artist['playcount'],
+                url=artist['url']
             )
-            top_item = TopItem(
-                name=artist.item.name,
-                weight=artist.weight,
+            yield TopItem(
+                name=artist['name'],
+                weight=int(artist['playcount']),
                 details=model
             )
-            artists.append(top_item)
 
-        return artists
-
-    async def get_user_top_albums(self) -> list[TopItem]:
-        # TODO update to use async calls
-        top_albums = self.user.get_top_albums(limit=10)
-        albums = []
-        for album in top_albums:
-            details = album.item
+    async def iter_user_top_albums(self, page_size: int = 50, max_items: int = None) -> AsyncIterator[TopItem]:
+        items = self._api_items(
+            'user.getTopAlbums', {'user': LASTFM_USERNAME}, 'topalbums', 'album', page_size, max_items
+        )
+        async for album in items:
             model = Album(
-                title=details.title,
-                artist_name=details.artist.name,
-                cover_image=details.get_cover_image(size=pylast.SIZE_LARGE),
-                url=details.get_url()
+                title=album['name'],
+                artist_name=album['artist']['name'],
+                cover_image=sized_image(album.get('image'), 'large'),
+                url=album['url']
             )
-            top_item = TopItem(
-                name=album.item.title,
-                weight=album.weight,
+            yield TopItem(
+                name=album['name'],
+                weight=int(album['playcount']),
                 details=model
             )
-            albums.append(top_item)
 
-        return albums
+    async def get_user_loved_tracks(self, max_items: int = 50) -> list[LastFmTrack]:
+        return [t async for t in self.iter_user_loved_tracks(max_items=max_items)]
+
+    async def get_user_top_artists(self, max_items: int = 10) -> list[TopItem]:
+        return [a async for a in self.iter_user_top_artists(max_items=max_items)]
+
+    async def get_user_top_albums(self, max_items: int = 10) -> list[TopItem]:
+        return [a async for a in self.iter_user_top_albums(max_items=max_items)]
 
     async def update_now_playing(self, current_song: Track) -> bool:
         try:
-            await self._run_sync(
-                self.network.update_now_playing,
-                artist=current_song.artist,
-                title=current_song.clean_name,
-                album=current_song.clean_album
-            )
+            await self._api_post('track.updateNowPlaying', {
+                'artist': current_song.artist,
+                'track': current_song.clean_name,
+                'album': current_song.clean_album,
+            })
             logger.info("Updated Last.fm now playing")
             return True
-        except pylast.PyLastError as e:
+        except (LastFmApiError, httpx.HTTPError) as e:
             logger.error(f"Failed to update Last.fm now playing: {e}")
             return False
 
@@ -218,13 +461,12 @@ class LastFmService(BaseAsyncClient):
         timestamp = int(scrobbled_at.timestamp()) if scrobbled_at else int(time.time())
 
         try:
-            await self._run_sync(
-                self.network.scrobble,
-                artist=artist,
-                title=title,
-                timestamp=timestamp,
-                album=album
-            )
+            await self._api_post('track.scrobble', {
+                'artist': artist,
+                'track': title,
+                'timestamp': timestamp,
+                'album': album,
+            })
             logger.info(f"Scrobbled to LastFm: {track.display_name}")
             return LastFmTrack(
                 name=title,
@@ -234,42 +476,102 @@ class LastFmService(BaseAsyncClient):
                 clean_album=album,
                 scrobbled_at=datetime.fromtimestamp(int(timestamp)),
             )
-        except pylast.PyLastError as e:
+        except (LastFmApiError, httpx.HTTPError) as e:
             logger.error(f"Failed to scrobble to Last.fm: {e}")
             return None
 
-    async def get_album_image_url(self, album: pylast.Album) -> str | None:
-        # TODO update to use async calls
+    async def scrobble_many(self, plays: list[tuple[Track, datetime | None]]) -> list[ScrobbleResult]:
         """
-        Retrieves the cover image URL for a given album.
+        Scrobble (track, played at) pairs in batches of up to 50 per request.
+        Plays without a time are scrobbled as a second apart, the last one now, so they keep their order
+        and don't share a timestamp. Returns one result per play, in order,
+        telling whether Last.fm accepted or ignored it, or why its batch failed.
+        """
+        now = int(time.time())
+        undated_after = sum(scrobbled_at is None for _, scrobbled_at in plays)
+        timed = []
+        for track, scrobbled_at in plays:
+            if scrobbled_at is None:
+                undated_after -= 1
+                timed.append((track, now - undated_after))
+            else:
+                timed.append((track, int(scrobbled_at.timestamp())))
 
-        Attempts to fetch the album's cover image using the provided album object.
-        If the initial attempt fails, it tries to clean the album title and fetch
-        the cover image again.
+        results = []
+        for start in range(0, len(timed), SCROBBLE_BATCH_SIZE):
+            results.extend(await self._scrobble_batch(timed[start:start + SCROBBLE_BATCH_SIZE]))
 
-        Parameters:
-        album (pylast.Album): The album object for which the cover image URL is to be retrieved.
+        accepted = sum(r.accepted for r in results)
+        logger.info(f"Scrobbled {accepted} of {len(plays)} tracks to Last.fm.")
+        return results
 
-        Returns:
-        str | None: The URL of the album's cover image if available, otherwise None.
-        """
-        image_url = None
+    async def _scrobble_batch(self, plays: list[tuple[Track, int]]) -> list[ScrobbleResult]:
+        """Scrobble one batch of (track, unix timestamp) pairs."""
+        params = {}
+        for i, (track, timestamp) in enumerate(plays):
+            params |= {
+                f'artist[{i}]': track.artist,
+                f'track[{i}]': track.clean_name,
+                f'timestamp[{i}]': timestamp,
+                f'album[{i}]': track.clean_album,
+            }
 
         try:
-            image_url = await self._run_sync(album.get_cover_image, size=pylast.SIZE_MEGA)
-        except pylast.PyLastError as e:
-            logger.error(f"Failed to get album image_url: {e}")
+            payload = await self._api_post('track.scrobble', params)
+        except (LastFmApiError, httpx.HTTPError) as e:
+            logger.error(f"Failed to scrobble {len(plays)} tracks to Last.fm: {e}")
+            return [ScrobbleResult(track=track, error=str(e)) for track, _ in plays]
+
+        # entries come back in the order they were sent
+        entries = as_list(payload['scrobbles'].get('scrobble'))
+        results = []
+        for (track, timestamp), entry in zip(plays, entries):
+            ignored = entry.get('ignoredMessage', {})
+            code = int(ignored.get('code', 0))
+            if code:
+                logger.warning(f"Last.fm ignored scrobble of {track.display_name}: {ignored.get('#text') or code}")
+                results.append(ScrobbleResult(track=track, ignored_code=code, ignored_message=ignored.get('#text')))
+                continue
 
-        if image_url is None:
-            clean_title = clean_up_title(album.title)
-            clean_album = await self._run_sync(self.network.get_album, title=clean_title, artist=album.artist.name)
+            results.append(ScrobbleResult(
+                track=track,
+                scrobble=LastFmTrack(
+                    name=track.clean_name,
+                    clean_name=track.clean_name,
+                    artist=track.artist,
+                    album=track.clean_album,
+                    clean_album=track.clean_album,
+                    scrobbled_at=datetime.fromtimestamp(timestamp),
+                ),
+            ))
+
+        return results
+
+    @response_cache.cached("album.getImage", ttl=config.LASTFM_CACHE_TTL_ALBUM_IMAGE)
+    async def get_album_image_url(self, title: str, artist: str) -> str | None:
+        """
+        Retrieves the cover image URL for an album.
+        If the album has no image, tries again with the cleaned up album title.
+        """
+        for album_title in dict.fromkeys([title, clean_up_title(title)]):
             try:
-                image_url = await self._run_sync(clean_album.get_cover_image, size=pylast.SIZE_MEGA)
-            except pylast.PyLastError as e:
+                album = await self.get_album(album_title, artist)
+            except (LastFmApiError, httpx.HTTPError) as e:
                 logger.error(f"Failed to get album image_url: {e}")
+                continue
 
-        return image_url
+            if album and album.cover_image:
+                return album.cover_image
 
+        return None
+
+    @album_memo
+    @response_cache.cached(
+        "album.getInfo",
+        ttl=config.LASTFM_CACHE_TTL_ALBUM,
+        negative_ttl=config.LASTFM_CACHE_TTL_UNRESOLVED,
+        entity=("title", "artist"),
+    )
     async def get_album(
             self,
             title: str,
@@ -277,205 +579,290 @@ class LastFmService(BaseAsyncClient):
             with_tracks: bool = False,
             with_tags: bool = False
     ) -> Album | None:
-        def _fetch_album_info():
-            album = self.network.get_album(
-                title=lastfm_friendly(title),
-                artist=lastfm_friendly(artist)
-            )
+        """One album.getInfo request, plus album.getTopTags for weighted tags with `with_tags`."""
+        with count_requests(f"album {artist} - {title}", expected=1 + with_tags):
             try:
-                return {
-                    'album': album,
-                    'title': album.get_title(True),
-                    'mbid': album.get_mbid() or None,
-                    'artist_name': album.get_artist().get_name(True),
-                    'url': album.get_url(),
-                    'playcount': int(album.get_playcount()),
-                    'user_playcount': int(album.get_userplaycount()),
-                    'listener_count': int(album.get_listener_count()),
-                    'wiki': album.get_wiki_summary()
-                }
-            except pylast.WSError as e:
+                info = (await self._api_get('album.getInfo', {
+                    'album': title,
+                    'artist': artist,
+                    'autocorrect': 1,
+                    'username': LASTFM_USERNAME,
+                }))['album']
+            except LastFmApiError as e:
+                if e.code != NOT_FOUND:
+                    raise
                 logger.error(f"Failed to get album: {title} by {artist}: {e}")
-                return None
-
-        album_data = await self._run_sync(_fetch_album_info)
-
-        if not album_data:
-            return None
-
-        tracks = None
-        if with_tracks:
-            def _fetch_tracks():
-                tracks_list = []
-                album_tracks = album_data['album'].get_tracks()
-                for order, t in enumerate(album_tracks, start=1):
-                    tracks_list.append({
-                        'title': t.title,
-                        'duration': t.get_duration()
-                    })
-                return tracks_list
-
-            tracks_data = await self._run_sync(_fetch_tracks)
-            tracks = []
-            for order, track_data in enumerate(tracks_data, start=1):
-                obj = Track(
-                    name=track_data['title'],
-                    clean_name=clean_up_title(track_data['title']),
-                    artist=album_data['artist_name'],
-                    album=album_data['title'],
-                    clean_album=clean_up_title(album_data['title']),
-                    order=order,
-                    duration=track_data['duration']
-                )
-                tracks.append(obj)
-
-        tags = None
-        if with_tags:
-            def _fetch_tags():
-                tags_list = []
-                album_tags = album_data['album'].get_top_tags()
-                for tag in album_tags:
-                    tags_list.append({
-                        'tag_name': tag.item.name,
-                        'weight': int(tag.weight)
-                    })
-                return tags_list
-
-            tags = await self._run_sync(_fetch_tags)
+                raise Unresolved(e.code, e.message)
+
+            album_title = info['name']
+            artist_name = info['artist']
+
+            tracks = None
+            if with_tracks:
+                tracks = []
+                for order, t in enumerate(as_list(info.get('tracks', {}).get('track')), start=1):
+                    obj = Track(
+                        name=t['name'],
+                        clean_name=clean_up_title(t['name']),
+                        artist=artist_name,
+                        album=album_title,
+                        clean_album=clean_up_title(album_title),
+                        order=order,
+                        # album tracks list durations in seconds, elsewhere they are milliseconds
+                        duration=int(t['duration'] or 0) * 1000
+                    )
+                    tracks.append(obj)
+
+            tags = None
+            if with_tags:
+                payload = await self._api_get('album.getTopTags', {
+                    'album': album_title,
+                    'artist': artist_name,
+                })
+                tags = [
+                    {'tag_name': t['name'], 'weight': int(t['count'])}
+                    for t in as_list(payload['toptags'].get('tag'))
+                ]
 
         return Album(
-            title=album_data['title'],
-            artist_name=album_data['artist_name'],
-            url=album_data['url'],
+            title=album_title,
+            artist_name=artist_name,
+            url=info.get('url'),
+            cover_image=largest_image(info.get('image')),
             tracks=tracks,
             tags=tags,
-            mbid=album_data['mbid'],
-            playcount=album_data['playcount'],
-            user_playcount=album_data['user_playcount'],
-            listener_count=album_data['listener_count'],
-            wiki=album_data['wiki'],
+            mbid=info.get('mbid') or None,
+            playcount=int(info.get('playcount', 0)),
+            user_playcount=int(info.get('userplaycount', 0)),
+            listener_count=int(info.get('listeners', 0)),
+            wiki=info.get('wiki', {}).get('summary'),
         )
 
+    @response_cache.cached(
+        "artist.getInfo",
+        ttl=config.LASTFM_CACHE_TTL_ARTIST,
+        negative_ttl=config.LASTFM_CACHE_TTL_UNRESOLVED,
+        entity=("artist_name",),
+    )
+    async def get_artist(self, artist_name: str, with_details: bool = False) -> Artist | None:
+        """
+        Get an artist's info with one artist.getInfo request. With `with_details`, also fetch its
+        top tags, similar artists, and top tracks and albums (as dicts, ranked by weight).
+        """
+        with count_requests(f"artist {artist_name}", expected=5 if with_details else 1):
+            try:
+                info = (await self._api_get('artist.getInfo', {
+                    'artist': artist_name,
+                    'autocorrect': 1,
+                    'username': LASTFM_USERNAME,
+                }))['artist']
+            except LastFmApiError as e:
+                if e.code != NOT_FOUND:
+                    raise
+                logger.error(f"Failed to get artist: {artist_name}: {e}")
+                raise Unresolved(e.code, e.message)
+
+            stats = info.get('stats', {})
+            model = Artist(
+                name=artist_name,
+                mbid=info.get('mbid') or None,
+                url=info.get('url'),
+                bio=info.get('bio', {}).get('summary'),
+                playcount=stats.get('playcount'),
+                user_playcount=int(stats.get('userplaycount', 0)),
+                listener_count=int(stats.get('listeners', 0)),
+            )
+
+            if with_details:
+                params = {'artist': info['name']}
+                top_tags, similar, top_tracks, top_albums = await asyncio.gather(
+                    self._api_get('artist.getTopTags', params),
+                    self._api_get('artist.getSimilar', {**params, 'limit': 20}),
+                    self._api_get('artist.getTopTracks', {**params, 'limit': 20}),
+                    self._api_get('artist.getTopAlbums', {**params, 'limit': 20}),
+                )
+
+                model.tags = [
+                    {'tag_name': t['name'], 'weight': int(t['count'])}
+                    for t in as_list(top_tags['toptags'].get('tag'))
+                ]
+                model.similar_artists = [
+                    {'artist_name': a['name'], 'match': float(a['match'])}
+                    for a in as_list(similar['similarartists'].get('artist'))
+                ]
+                tracks = sorted(as_list(top_tracks['toptracks'].get('track')), key=lambda x: int(x['playcount']), reverse=True)
+                model.top_tracks = [
+                    {'track_name': t['name'], 'weight': int(t['playcount']), 'rank': rank}
+                    for rank, t in enumerate(tracks, start=1)
+                ]
+                albums = sorted(as_list(top_albums['topalbums'].get('album')), key=lambda x: int(x['playcount']), reverse=True)
+                model.top_albums = [
+                    {'album_name': a['name'], 'weight': int(a['playcount']), 'rank': rank}
+                    for rank, a in enumerate(albums, start=1)
+                ]
+
+        return model
+
+    @response_cache.cached(
+        "track.getInfo",
+        ttl=config.LASTFM_CACHE_TTL_TRACK,
+        negative_ttl=config.LASTFM_CACHE_TTL_UNRESOLVED,
+        entity=("track_name", "artist_name"),
+    )
     async def get_track(
             self,
             track_name: str,
             artist_name: str,
             with_similar: bool = False,
     ) -> LastFmTrack | None:
-        # TODO update to use async calls
-        track = self.network.get_track(
-            artist=lastfm_friendly(artist_name),
-            title=lastfm_friendly(track_name)
-        )
-
-        try:
-            title = track.get_title(True)
-        except pylast.WSError as e:
-            logger.error(f"Failed to get track: {track_name} by {artist_name}: {e}")
-            return None
-
-        similar_tracks = None
-        if with_similar:
-            similar_tracks = []
-            for s in track.get_similar(limit=20):
-                s_track = s.item
-                st = SimilarTrack(
-                    track_name=title,
-                    artist_name=artist_name,
-                    similar_track_name=s_track.title,
-                    similar_track_artist_name=s_track.artist.name,
-                    match=s.match
-                )
-                similar_tracks.append(st)
+        """One track.getInfo request, plus track.getSimilar with `with_similar`."""
+        with count_requests(f"track {artist_name} - {track_name}", expected=1 + with_similar):
+            try:
+                info = (await self._api_get('track.getInfo', {
+                    'track': track_name,
+                    'artist': artist_name,
+                    'autocorrect': 1,
+                    'username': LASTFM_USERNAME,
+                }))['track']
+            except LastFmApiError as e:
+                if e.code != NOT_FOUND:
+                    raise
+                logger.error(f"Failed to get track: {track_name} by {artist_name}: {e}")
+                raise Unresolved(e.code, e.message)
+
+            title = info['name']
+            album = info.get('album') or {}
+
+            similar_tracks = None
+            if with_similar:
+                payload = await self._api_get('track.getSimilar', {
+                    'track': title,
+                    'artist': info['artist']['name'],
+                    'limit': 20,
+                })
+                similar_tracks = [
+                    SimilarTrack(
+                        track_name=title,
+                        artist_name=artist_name,
+                        similar_track_name=s['name'],
+                        similar_track_artist_name=s['artist']['name'],
+                        match=float(s['match'])
+                    )
+                    for s in as_list(payload['similartracks'].get('track'))
+                ]
 
         return LastFmTrack(
             name=title,
-            artist=track.get_artist().get_name(True),
-            album=track.get_album().get_title(True) if track.get_album() else None,
-            duration=int(track.get_duration()) if track.get_duration() else None,
-            url=track.get_url(),
-            mbid=track.get_mbid(),
-            listener_playcount=int(track.get_playcount()),
-            user_playcount=int(track.get_userplaycount()),
-            listener_count=int(track.get_listener_count()),
+            artist=info['artist']['name'],
+            album=album.get('title'),
+            duration=int(info.get('duration') or 0),
+            url=info.get('url'),
+            mbid=info.get('mbid') or None,
+            wiki=info.get('wiki', {}).get('summary'),
+            cover_image=largest_image(album.get('image')),
+            user_loved=info.get('userloved') == '1',
+            listener_playcount=int(info.get('playcount', 0)),
+            user_playcount=int(info.get('userplaycount', 0)),
+            listener_count=int(info.get('listeners', 0)),
             similar_tracks=similar_tracks,
         )
 
+
     async def current_track_user_scrobbles(self, current_song: Track) -> bool | list[LastFmTrack]:
-        # TODO update to use async calls
         try:
             tracks = []
 
             # make multiple calls for "Cool Song", "Cool Song (Remastered 2021)", etc...
-            track_scrobbles = self.user.get_track_scrobbles(current_song.artist, current_song.name)
+            names = [current_song.name]
             if current_song.has_clean_name:
-                clean_track_scrobbles = self.user.get_track_scrobbles(current_song.artist, current_song.clean_name)
-                track_scrobbles.extend(clean_track_scrobbles)
-
-            for t in track_scrobbles:
-                timestamp = int(t.timestamp)
-                timestamp = datetime.fromtimestamp(timestamp).strftime(config.DATETIME_FORMAT)
-                track = LastFmTrack(
-                    name=t.track.title,
-                    artist=t.track.artist.name,
-                    album=t.album,
-                    scrobbled_at=timestamp
+                names.append(current_song.clean_name)
+
+            for name in names:
+                pages = self._api_pages(
+                    'user.getTrackScrobbles',
+                    {'user': LASTFM_USERNAME, 'artist': current_song.artist, 'track': name, 'limit': 200},
+                    root='trackscrobbles',
+                    item='track',
                 )
-                tracks.append(track)
+                async for page in pages:
+                    for t in page:
+                        if 'date' not in t:
+                            continue
+                        timestamp = int(t['date']['uts'])
+                        timestamp = datetime.fromtimestamp(timestamp).strftime(config.DATETIME_FORMAT)
+                        track = LastFmTrack(
+                            name=t['name'],
+                            artist=t['artist']['#text'],
+                            album=t['album']['#text'],
+                            scrobbled_at=timestamp
+                        )
+                        tracks.append(track)
 
             return tracks
 
-        except pylast.PyLastError as e:
+        except (LastFmApiError, httpx.HTTPError) as e:
             logger.error(f"Failed to get user scrobbles for {current_song.display_name}")
             logger.error(f"Error: {e}")
             return False
 
-    async def user_weekly_chart_dates(self):
-        # TODO update to use async calls
-        return self.user.get_weekly_chart_dates()
+    async def user_weekly_chart_dates(self) -> list[tuple[str, str]]:
+        payload = await self._api_get('user.getWeeklyChartList', {'user': LASTFM_USERNAME})
+        return [(c['from'], c['to']) for c in as_list(payload['weeklychartlist'].get('chart'))]
+
+    async def user_weekly_album_charts(self, from_date: str, to_date: str, enrich: bool = True) -> list[Album]:
+        """
+        The user's album chart for a week, in chart order.
 
-    async def user_weekly_album_charts(self, from_date: str, to_date: str):
-        # TODO update to use async calls
-        weekly_albums = self.user.get_weekly_album_charts(from_date, to_date)
+        With `enrich`, each album's details are fetched concurrently, once per distinct album.
+        An album whose lookup fails is returned as it appears in the chart.
+        """
+        payload = await self._api_get('user.getWeeklyAlbumChart', {
+            'user': LASTFM_USERNAME,
+            'from': from_date,
+            'to': to_date,
+        })
+
+        chart = [
+            Album(
+                title=album['name'],
+                artist_name=album['artist']['#text'],
+                mbid=album.get('mbid') or None,
+                url=album.get('url'),
+                playcount=int(album['playcount']),
+            )
+            for album in as_list(payload['weeklyalbumchart'].get('album'))
+        ]
+        if not enrich:
+            return chart
 
-        results = []
-        for album, playcount in weekly_albums:
-            album_name = album.title
-            artist_name = album.artist.name
+        # the same album can chart twice under different casing, so look it up once
+        lookups: dict[tuple[str, str], asyncio.Task] = {}
+        for row in chart:
+            key = (row.artist_name.casefold(), row.title.casefold())
+            if key not in lookups:
+                lookups[key] = asyncio.create_task(self.get_album(row.title, row.artist_name))
 
-            last_fm_album = await self.get_album(album_name, artist_name)
-            last_fm_album.playcount = playcount
-            results.append(last_fm_album)
+        await asyncio.gather(*lookups.values(), return_exceptions=True)
+
+        results = []
+        for row in chart:
+            task = lookups[(row.artist_name.casefold(), row.title.casefold())]
+            error = task.exception()
+            album = None if error else task.result()
+            if album is None:
+                logger.warning(f"Could not get details for {row.title} by {row.artist_name}: {error or 'not found'}")
+                results.append(row)
+            else:
+                results.append(album.model_copy(update={'playcount': row.playcount}))
 
         return results
 
     async def get_user_30_day_stats(self):
-        # TODO update to use async calls
         thirty_days_ago = int((datetime.now() - timedelta(days=30)).timestamp())
         now = int(datetime.now().timestamp())
 
-        recent_tracks = self.user.get_recent_tracks(limit=None, time_from=thirty_days_ago, time_to=now)
-        daily_stats = defaultdict(lambda: {"tracks": set(), "artists": set(), "albums": set()})
-
-        for track in recent_tracks:
-            date = datetime.fromtimestamp(int(track.timestamp)).strftime('%Y-%m-%d')
-            track_identifier = (track.track.artist.name, track.track.title)
-            artist_identifier = track.track.artist.name
-            album_identifier = (track.track.artist.name, track.album)
-
-            daily_stats[date]["tracks"].add(track_identifier)
-            daily_stats[date]["artists"].add(artist_identifier)
-            daily_stats[date]["albums"].add(album_identifier)
-
-        daily_counts = {
-            date: {
-                "track_count": len(stats["tracks"]),
-                "artist_count": len(stats["artists"]),
-                "album_count": len(stats["albums"]),
-            }
-            for date, stats in daily_stats.items()
-        }
-
-        return daily_counts
-
-
+        rows = await self.get_recent_track_rows_between(thirty_days_ago, now)
+        return daily_stats(
+            (datetime.fromtimestamp(row.timestamp).date(), row.artist_name, row.track_name, row.album_name)
+            for row in rows
+        )
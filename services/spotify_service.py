@@ -7,6 +7,7 @@ from core import config
 from library.integrations import PlaybackAction
 from library.utils import clean_up_title
 from models.schemas import SpotifyUser, SpotifyTrack, Artist
+from services.base_async_client import BaseAsyncClient
 
 scope = [
     'user-read-playback-state',
@@ -17,8 +18,10 @@ scope = [
 ]
 
 
-class SpotifyService:
+class SpotifyService(BaseAsyncClient):
+    """spotipy is blocking, so every call runs on the service's own thread pool."""
     def __init__(self):
+        super().__init__("spotify", config.SPOTIFY_EXECUTOR_WORKERS)
         auth = SpotifyOAuth(
             client_id=config.SPOTIFY_CLIENT_ID,
             client_secret=config.SPOTIFY_CLIENT_SECRET,
@@ -30,7 +33,7 @@ class SpotifyService:
 
 
     async def get_spotify_account_information(self) -> SpotifyUser | None:
-        result: dict = self.spotify.current_user()
+        result: dict = await self._run_sync(self.spotify.current_user)
         if result:
             url = result['external_urls']['spotify']
             return SpotifyUser(
@@ -45,7 +48,7 @@ class SpotifyService:
 
     async def poll_spotify(self) -> SpotifyTrack | None:
         try:
-            result = self.spotify.current_user_playing_track()
+            result = await self._run_sync(self.spotify.current_user_playing_track)
         except spotipy.SpotifyException as e:
             logger.warning(f'Poll Spotify failed: {e}')
             return None
@@ -79,21 +82,21 @@ class SpotifyService:
 
         match action:
             case PlaybackAction.PAUSE:
-                return self.spotify.pause_playback()
+                return await self._run_sync(self.spotify.pause_playback)
             case PlaybackAction.NEXT:
-                return self.spotify.next_track()
+                return await self._run_sync(self.spotify.next_track)
             case PlaybackAction.PREVIOUS:
-                return self.spotify.previous_track()
+                return await self._run_sync(self.spotify.previous_track)
             case PlaybackAction.SEEK:
-                return self.spotify.seek_track(position_ms=position_ms)
+                return await self._run_sync(self.spotify.seek_track, position_ms=position_ms)
             case _:
                 raise ValueError(f"Invalid playback action: {action}")
 
 
     async def get_artist_from_name(self, artist_name: str) -> Artist:
-        spotify_artist = self.spotify.search(q=artist_name, type='artist')
+        spotify_artist = await self._run_sync(self.spotify.search, q=artist_name, type='artist')
         artist_id = spotify_artist['artists']['items'][0]['id']
-        result = self.spotify.artist(artist_id)
+        result = await self._run_sync(self.spotify.artist, artist_id)
         artist = Artist(
             id=result['id'],
             name=result['name'],
@@ -1,14 +1,19 @@
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from loguru import logger
-from pylast import TopItem
 from sqlalchemy import Row
 
 import models.db as db_models
+from core import config
 from repositories.ref_data_repo import ReferenceDataRepository
 from repositories.scrobble_repo import ScrobbleRepository
-from library.utils import lastfm_friendly, clean_up_title
+from repositories.sync_state_repo import SyncStateRepository, SyncJobType, SyncJobStatus
+from library.utils import clean_up_title
+from library.executor import background
+from library.worker_pool import WorkerPool
+from models.schemas import RecentTrackRow
+from services.lastfm_service import rate_limiter, response_cache, is_transient_error
 
 
 class SyncService:
@@ -19,122 +24,388 @@ class SyncService:
     def __init__(self):
         self.scrobble_repo = ScrobbleRepository()
         self.ref_data_repo = ReferenceDataRepository()
+        self.sync_state_repo = SyncStateRepository()
+        self._checkpoint_lock = asyncio.Lock()
+
+    async def sync_scrobbles(
+            self,
+            time_from: str = None,
+            time_to: str = None,
+            clean: bool = True,
+            workers: int = 1,
+            resume: bool = False,
+            incremental: bool = False,
+    ) -> dict[str, int]:
+        """
+        Fetch the user's scrobbles from Last.fm and save any new ones to the database.
+
+        With `workers` > 1 the [time_from, time_to] range is split into windows of
+        `SYNC_WINDOW_DAYS` that are fetched concurrently, sharing the process-wide request-rate budget.
+
+        Progress is checkpointed in `sync_jobs`. With `resume`, the most recent job that failed
+        or was interrupted is continued from its checkpoint instead of starting a new sync,
+        in the job's own mode (the other arguments except `clean` and `workers` are ignored).
+
+        With `incremental`, only plays newer than the latest stored scrobble (and than `time_from`) are fetched,
+        and the sync stops once a page reaches that scrobble.
+        """
+        job = None
+        bulk_load = False
+
+        if resume:
+            job = await self.sync_state_repo.claim_resumable_job(
+                SyncJobType.SCROBBLES,
+                stale_after=timedelta(minutes=config.SYNC_JOB_STALE_MINUTES),
+            )
+            if job:
+                logger.info(f"Resuming sync job {job.id} ({job.fetched} scrobbles fetched so far).")
+            else:
+                logger.info("No failed or interrupted sync to resume. Starting a new one.")
+
+        if job is None:
+            time_from = int(datetime.strptime(time_from, "%Y-%m-%d").timestamp()) if time_from else None
+            time_to = int(datetime.strptime(time_to, "%Y-%m-%d").timestamp()) if time_to else None
+            if not time_to:
+                time_to = int(datetime.now().timestamp())
+
+            if incremental:
+                latest = await self.scrobble_repo.get_latest_scrobbled_at()
+                if latest:
+                    # a range starting after the latest stored scrobble still starts where it says
+                    time_from = max(time_from or 0, int(latest.timestamp()))
+                    workers = 1
+                    logger.info(f"Incremental sync of scrobbles since {latest}.")
+                else:
+                    incremental = False
+                    logger.info("No scrobbles stored yet. Running a full sync instead.")
+
+            window_size = None
+            if workers > 1:
+                window_size = config.SYNC_WINDOW_DAYS * 86400
+                if not time_from:
+                    # full history: nothing can be older than the account itself
+                    from library.dependencies import get_lastfm_service
+                    lastfm_service = await get_lastfm_service()
+                    user = await lastfm_service.get_user()
+                    time_from = int(user.registered.timestamp())
+                # first-time load into an empty table: stage whole windows through COPY
+                bulk_load = await self.scrobble_repo.get_latest_scrobbled_at() is None
+
+            job = await self.sync_state_repo.create_job(
+                job_type=SyncJobType.SCROBBLES,
+                time_from=time_from,
+                time_to=time_to,
+                window_size=window_size,
+                incremental=incremental,
+            )
 
-    async def sync_scrobbles(self, time_from: str = None, time_to: str = None, clean: bool = True) -> dict[str, int]:
+        try:
+            if job.window_size:
+                result = await self._sync_scrobbles_parallel(job, clean, workers, bulk_load)
+            else:
+                result = await self._sync_scrobbles_sequential(job, clean)
+        except BaseException:
+            # includes Ctrl-C and cancellation, so an interrupted job can be resumed right away
+            job.status = SyncJobStatus.FAILED.value
+            await self._save_checkpoint(job)
+            raise
+
+        job.status = SyncJobStatus.COMPLETE.value
+        job.finished_at = datetime.now()
+        await self._save_checkpoint(job)
+
+        logger.info(f"Done. Total fetched: {result['fetched_scrobbles']}. Total saved: {result['new_scrobbles']}.")
+        logger.info(f"Last.fm request stats: {rate_limiter.stats()}")
+        logger.info(f"Last.fm response cache stats: {await response_cache.stats()}")
+        return result
+
+    async def _sync_scrobbles_sequential(self, job: db_models.SyncJob, clean: bool) -> dict[str, int]:
+        """
+        Page backwards from the job's cursor. A full page leaves its oldest second for the next page,
+        which then gets every play in that second, so no play is fetched twice, even after resuming.
+        Returns what this run fetched and saved; the job's totals include earlier runs.
+        """
         from library.dependencies import get_lastfm_service
 
         lastfm_service = await get_lastfm_service()
+        page_size = 200
         fetched = 0
         saved = 0
-        time_from = int(datetime.strptime(time_from, "%Y-%m-%d").timestamp()) if time_from else None
-        time_to = int(datetime.strptime(time_to, "%Y-%m-%d").timestamp()) if time_to else None
-        if not time_to:
-            time_to = int(datetime.now().timestamp())
+        time_from = job.time_from
+        time_to = job.cursor or job.time_to
 
         while True:
             if time_from and time_to and time_from >= time_to:
                 logger.info("Reached the specified time_from limit. Stopping sync.")
                 break
 
-            batch_scrobbles = []
-            tracks = await lastfm_service.get_user_played_tracks_by_time_to(time_to, 200)
+            tracks = await lastfm_service.get_recent_track_rows(time_to=time_to, time_from=time_from, limit=page_size)
 
             if not tracks:
                 logger.info("No more tracks to fetch. Sync complete.")
                 break
 
-            fetched += len(tracks)
+            page, next_time_to = self._split_page(tracks, page_size)
+            fetched += len(page)
             logger.info(f"Fetched {fetched} scrobbles...")
 
-            # Query once for all existing scrobbles in this batch
-            existing_scrobbles = await self.scrobble_repo.get_scrobbles_batch(tracks)
-            existing_set = {(s.track_name.lower(), s.artist_name.lower(), s.scrobbled_at) for s in existing_scrobbles}
+            page_saved = await self._save_scrobbles_page(page, clean)
+            saved += page_saved
 
-            for t in tracks:
-                track_name = clean_up_title(t.track.title) if clean else t.track.title
-                artist_name = t.track.artist.name if t.track.artist else "Unknown Artist"
-                album_name = clean_up_title(t.album) if clean and t.album else t.album
-                scrobbled_at = datetime.fromtimestamp(int(t.timestamp))
+            oldest = tracks[-1].timestamp
+            job.cursor = next_time_to
+            job.fetched += len(page)
+            job.saved += page_saved
+            await self._save_checkpoint(job)
 
-                # O(1) lookup in set
-                if (track_name.lower(), artist_name.lower(), scrobbled_at) in existing_set:
-                    logger.info(f"Scrobble already exists in DB: {artist_name} - {track_name} at {scrobbled_at}. Skipping.")
-                    continue
+            # time_from is the latest scrobble stored when an incremental sync started
+            if job.incremental and time_from and oldest <= time_from:
+                logger.info("Reached scrobbles already in the database. Sync complete.")
+                break
 
-                logger.info(f"Adding scrobble to DB: {artist_name} - {track_name} at {scrobbled_at}.")
-                scrobble = db_models.Scrobble(
-                    track_name=track_name,
-                    artist_name=artist_name,
-                    album_name=album_name,
-                    scrobbled_at=scrobbled_at,
-                    created_at=datetime.now()
+            if len(tracks) < page_size:
+                logger.info("Fetched the last page. Sync complete.")
+                break
+
+            time_to = next_time_to
+
+        return {
+            "fetched_scrobbles": fetched,
+            "new_scrobbles": saved
+        }
+
+    async def _sync_scrobbles_parallel(
+            self,
+            job: db_models.SyncJob,
+            clean: bool,
+            workers: int,
+            bulk_load: bool = False,
+    ) -> dict[str, int]:
+        windows = [
+            (start, min(start + job.window_size, job.time_to))
+            for start in range(job.time_from, job.time_to, job.window_size)
+        ]
+        last_window = windows[-1] if windows else None
+        completed = {tuple(w) for w in job.completed_windows}
+        pending = [w for w in windows if w not in completed]
+        logger.info(f"Syncing {len(pending)} of {len(windows)} windows with {workers} workers...")
+
+        semaphore = asyncio.Semaphore(workers)
+
+        async def run_window(window: tuple[int, int]) -> tuple[int, int]:
+            async with semaphore:
+                return await self._sync_scrobble_window(
+                    job=job,
+                    window_from=window[0],
+                    window_to=window[1],
+                    clean=clean,
+                    include_end=window == last_window,
+                    bulk_load=bulk_load,
                 )
-                batch_scrobbles.append(scrobble)
 
-            if len(batch_scrobbles) > 0:
-                await self.scrobble_repo.add_and_commit(batch_scrobbles)
-                saved += len(batch_scrobbles)
-                logger.info(f"Saved {len(batch_scrobbles)} new scrobbles to the database.")
-            else:
-                logger.info("No new scrobbles to save from this batch.")
+        tasks = [asyncio.create_task(run_window(w)) for w in pending]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # stop the other windows so the failed job is not written to after the fact
+            for task in tasks:
+                task.cancel()
+            raise
 
-            # update time_to to the oldest timestamp from this batch
-            time_to = int(tracks[-1].timestamp)
-            await asyncio.sleep(0.5)
+        fetched = sum(r[0] for r in results)
+        saved = sum(r[1] for r in results)
 
-        logger.info(f"Done. Total fetched: {fetched}. Total saved: {saved}.")
         return {
             "fetched_scrobbles": fetched,
             "new_scrobbles": saved
         }
 
-    async def sync_all_ref_data(self) -> None:
-        await self.sync_artists()
-        await self.sync_albums()
-        await self.sync_tracks()
-        logger.info("All data sync complete.")
+    async def _sync_scrobble_window(
+            self,
+            job: db_models.SyncJob,
+            window_from: int,
+            window_to: int,
+            clean: bool,
+            include_end: bool = False,
+            bulk_load: bool = False,
+    ) -> tuple[int, int]:
+        """
+        Page backwards through one window, keeping only scrobbles in [window_from, window_to)
+        (or [window_from, window_to] for the newest window) so that windows never overlap.
+
+        With `bulk_load`, pages are buffered and the whole window is written with one COPY
+        when it completes. Only completed windows are checkpointed in that mode.
+        Returns (fetched, saved) for this window.
+        """
+        from library.dependencies import get_lastfm_service
 
-    async def sync_artists(self, only_missing: bool = True) -> dict[str, int]:
-        if only_missing:
-            artists = await self.scrobble_repo.get_artists_with_no_ref_data()
-        else:
-            artists = await self.scrobble_repo.get_artists_from_scrobbles()
+        lastfm_service = await get_lastfm_service()
+        page_size = 200
+        fetched = 0
+        saved = 0
+        window_key = str(window_from)
+        cursor = job.window_cursors.get(window_key, window_to + 1)
+        buffered_rows = []
+
+        def in_window(ts: int) -> bool:
+            return window_from <= ts < window_to or (include_end and ts == window_to)
+
+        while cursor > window_from:
+            tracks = await lastfm_service.get_recent_track_rows(
+                time_to=cursor,
+                time_from=window_from - 1,
+                limit=page_size,
+            )
+            if not tracks:
+                break
 
-        logger.info("Starting all artist data sync...")
-        for artist_name in artists:
-            await self.sync_artist(artist_name)
-            await asyncio.sleep(1) # to respect Last.fm's API
+            page, next_cursor = self._split_page(tracks, page_size)
+            page = [t for t in page if in_window(t.timestamp)]
 
-        logger.info("Artist data sync complete.")
-        return {"synced_artists": len(artists)}
+            fetched += len(page)
+            if bulk_load:
+                buffered_rows.extend(self._to_scrobble_rows(page, clean))
+            else:
+                page_saved = await self._save_scrobbles_page(page, clean)
+                saved += page_saved
+                job.fetched += len(page)
+                job.saved += page_saved
 
-    async def sync_albums(self, only_missing: bool = True) -> dict[str, int]:
-        if only_missing:
-            albums = await self.scrobble_repo.get_albums_with_no_ref_data()
-        else:
-            albums = await self.scrobble_repo.get_albums_from_scrobbles()
+            if len(tracks) < page_size:
+                break
+            cursor = next_cursor
+
+            if not bulk_load:
+                job.window_cursors = {**job.window_cursors, window_key: cursor}
+                await self._save_checkpoint(job)
 
-        logger.info("Starting all albums data sync...")
-        for album in albums:
-            await self.sync_album(album)
-            await asyncio.sleep(1)
+        if bulk_load:
+            saved = await self.scrobble_repo.copy_scrobbles(buffered_rows)
+            job.fetched += fetched
+            job.saved += saved
 
-        logger.info("Album data sync complete.")
-        return {"synced_albums": len(albums)}
+        job.window_cursors = {k: v for k, v in job.window_cursors.items() if k != window_key}
+        job.completed_windows = [*job.completed_windows, [window_from, window_to]]
+        await self._save_checkpoint(job)
 
-    async def sync_tracks(self, only_missing: bool = True) -> dict[str, int]:
-        if only_missing:
-            tracks = await self.scrobble_repo.get_tracks_with_no_ref_data()
+        logger.info(
+            f"Window {datetime.fromtimestamp(window_from):%Y-%m-%d} - {datetime.fromtimestamp(window_to):%Y-%m-%d}: "
+            f"fetched {fetched}, saved {saved}."
+        )
+        return fetched, saved
+
+    @staticmethod
+    def _split_page(tracks: list[RecentTrackRow], page_size: int) -> tuple[list[RecentTrackRow], int]:
+        """
+        The plays of a page (newest first) to keep, and the exclusive time_to of the next page.
+
+        A full page may end partway through its oldest second, so that second is left for the next page,
+        which gets all of it. A full page within a single second cannot be split, so the rest of that second is skipped.
+        """
+        oldest = tracks[-1].timestamp
+        if len(tracks) < page_size or tracks[0].timestamp == oldest:
+            return tracks, oldest
+        return [t for t in tracks if t.timestamp > oldest], oldest + 1
+
+    async def _save_checkpoint(self, job: db_models.SyncJob) -> None:
+        # windows finish concurrently, so serialize writes to keep the newest snapshot last
+        async with self._checkpoint_lock:
+            await self.sync_state_repo.save_progress(job)
+
+    async def _save_scrobbles_page(self, tracks: list[RecentTrackRow], clean: bool) -> int:
+        """Save the scrobbles of one API page that are not in the database yet. Returns the number saved."""
+        if not tracks:
+            return 0
+
+        rows = self._to_scrobble_rows(tracks, clean)
+        saved = await self.scrobble_repo.insert_scrobbles(rows)
+
+        if saved > 0:
+            logger.info(f"Saved {saved} new scrobbles to the database. {len(rows) - saved} already existed.")
         else:
-            tracks = await self.scrobble_repo.get_tracks_from_scrobbles()
+            logger.info("No new scrobbles to save from this batch.")
+
+        return saved
+
+    @staticmethod
+    def _to_scrobble_rows(tracks: list[RecentTrackRow], clean: bool) -> list[dict]:
+        rows = []
+        for t in tracks:
+            rows.append({
+                "track_name": clean_up_title(t.track_name) if clean else t.track_name,
+                "artist_name": t.artist_name or "Unknown Artist",
+                "album_name": clean_up_title(t.album_name) if clean and t.album_name else t.album_name,
+                "scrobbled_at": datetime.fromtimestamp(t.timestamp),
+            })
+        return rows
+
+    async def sync_all_ref_data(
+            self,
+            only_missing: bool = True,
+            workers: int = None,
+            stale: bool = False,
+    ) -> dict[str, int]:
+        result = {
+            **await self.sync_artists(only_missing, workers, stale),
+            **await self.sync_albums(only_missing, workers, stale),
+            **await self.sync_tracks(only_missing, workers, stale),
+        }
+        logger.info("All data sync complete.")
+        logger.info(f"Last.fm request stats: {rate_limiter.stats()}")
+        logger.info(f"Last.fm response cache stats: {await response_cache.stats()}")
+        return result
+
+    async def sync_artists(self, only_missing: bool = True, workers: int = None, stale: bool = False) -> dict[str, int]:
+        """
+        With `stale`, only artists that have no reference data or were last synced more than
+        `REF_DATA_TTL_DAYS` ago are synced, most scrobbled first, at most `REF_DATA_MAX_PER_RUN`.
+        """
+        if stale:
+            artists = self.scrobble_repo.stream_stale_artists(*self._staleness_limits())
+        else:
+            artists = self.scrobble_repo.stream_artists(only_missing)
 
-        logger.info("Starting all tracks data sync...")
-        for track in tracks:
-            await self.sync_track(track)
-            await asyncio.sleep(1)
+        stats = await self._run_ref_data_pool("Artist data sync", self.sync_artist, artists, workers)
+        return {"synced_artists": stats["processed"] - stats["failed"], "failed_artists": stats["failed"]}
 
-        logger.info("Track data sync complete.")
-        return {"synced_tracks": len(tracks)}
+    async def sync_albums(self, only_missing: bool = True, workers: int = None, stale: bool = False) -> dict[str, int]:
+        if stale:
+            albums = self.scrobble_repo.stream_stale_albums(*self._staleness_limits())
+        else:
+            albums = self.scrobble_repo.stream_albums(only_missing)
+
+        stats = await self._run_ref_data_pool("Album data sync", self.sync_album, albums, workers)
+        return {"synced_albums": stats["processed"] - stats["failed"], "failed_albums": stats["failed"]}
+
+    async def sync_tracks(self, only_missing: bool = True, workers: int = None, stale: bool = False) -> dict[str, int]:
+        if stale:
+            tracks = self.scrobble_repo.stream_stale_tracks(*self._staleness_limits())
+        else:
+            tracks = self.scrobble_repo.stream_tracks(only_missing)
+
+        stats = await self._run_ref_data_pool("Track data sync", self.sync_track, tracks, workers)
+        return {"synced_tracks": stats["processed"] - stats["failed"], "failed_tracks": stats["failed"]}
+
+    @staticmethod
+    def _staleness_limits() -> tuple[datetime, int]:
+        synced_before = datetime.now() - timedelta(days=config.REF_DATA_TTL_DAYS)
+        return synced_before, config.REF_DATA_MAX_PER_RUN
+
+    @staticmethod
+    async def _run_ref_data_pool(name, handler, keys, workers: int = None) -> dict[str, int]:
+        """
+        Stream entity keys from the scrobbles into a pool of workers that fetch and save
+        each entity concurrently, paced only by the shared Last.fm rate limiter.
+        """
+        pool = WorkerPool(
+            name=name,
+            handler=handler,
+            workers=workers or config.SYNC_WORKERS,
+            retry_on=is_transient_error,
+        )
+        # any blocking calls made by the sync yield to interactive ones
+        with background():
+            return await pool.run(keys)
 
     async def sync_artist(self, artist_name: str) -> None:
         from library.dependencies import get_lastfm_service
@@ -142,108 +413,94 @@ class SyncService:
         lastfm_service = await get_lastfm_service()
         to_db = []
         logger.info(f"Syncing artist: {artist_name}")
-        lastfm_artist = lastfm_service.network.get_artist(
-            lastfm_friendly(artist_name)
-        )
+        artist_data = await lastfm_service.get_artist(artist_name, with_details=True)
 
-        mbid = lastfm_artist.get_mbid()
-        url = lastfm_artist.get_url()
-        bio = lastfm_artist.get_bio_summary()
-        user_playcount = lastfm_artist.get_userplaycount()
-        listener_count = lastfm_artist.get_listener_count()
+        if not artist_data:
+            logger.warning(f"Artist not found on Last.fm: {artist_name}")
+            return
 
         db_artist: db_models.Artist = await self.ref_data_repo.get_artist(artist_name)
         if db_artist:
-            db_artist.mbid = mbid
-            db_artist.url = url
-            db_artist.bio = bio
-            db_artist.user_playcount = user_playcount
-            db_artist.listener_count = listener_count
+            db_artist.mbid = artist_data.mbid
+            db_artist.url = str(artist_data.url) if artist_data.url else None
+            db_artist.bio = artist_data.bio
+            db_artist.user_playcount = artist_data.user_playcount
+            db_artist.listener_count = artist_data.listener_count
+            db_artist.last_synced_at = datetime.now()
+            to_db.append(db_artist)
             logger.info(f"Updating artist in DB: {artist_name}")
         else:
             a = db_models.Artist(
                 name=artist_name,
-                mbid=mbid,
-                url=url,
-                bio=bio,
-                user_playcount=user_playcount,
-                listener_count=listener_count,
+                mbid=artist_data.mbid,
+                url=str(artist_data.url) if artist_data.url else None,
+                bio=artist_data.bio,
+                user_playcount=artist_data.user_playcount,
+                listener_count=artist_data.listener_count,
+                last_synced_at=datetime.now(),
             )
             to_db.append(a)
             logger.info(f"Adding artist to DB: {artist_name}")
 
-        top_tags: list[TopItem]  = lastfm_artist.get_top_tags()
-        for tag in top_tags:
-            tag_name = tag.item.name
-            weight = int(tag.weight)
-
-            db_artist_tag = await self.ref_data_repo.check_artist_tag(artist_name=artist_name, tag=tag_name)
+        db_tags = await self.ref_data_repo.get_artist_tags(artist_name)
+        for tag in artist_data.tags:
+            db_artist_tag = db_tags.get(tag["tag_name"])
             if db_artist_tag:
-                db_artist_tag.weight = weight
+                db_artist_tag.weight = tag["weight"]
             else:
-                at = db_models.ArtistTag(
+                db_artist_tag = db_models.ArtistTag(
                     artist_name=artist_name,
-                    tag=tag_name,
-                    weight=weight,
+                    tag=tag["tag_name"],
+                    weight=tag["weight"],
                 )
-                to_db.append(at)
-
-        similar = lastfm_artist.get_similar(limit=20)
-        for s in similar:
-            s_artist = s.item
-            s_name = s_artist.name
-            match = s.match
+                db_tags[tag["tag_name"]] = db_artist_tag
+            to_db.append(db_artist_tag)
 
-            db_similar_artist = await self.ref_data_repo.check_similar_artist(artist_name=artist_name, similar_artist_name=s_name)
+        db_similar_artists = await self.ref_data_repo.get_similar_artists(artist_name)
+        for s in artist_data.similar_artists:
+            db_similar_artist = db_similar_artists.get(s["artist_name"])
             if db_similar_artist:
-                db_similar_artist.match = match
+                db_similar_artist.match = s["match"]
             else:
-                sa = db_models.SimilarArtist(
+                db_similar_artist = db_models.SimilarArtist(
                     artist_name=artist_name,
-                    similar_artist_name=s_name,
-                    match=match,
+                    similar_artist_name=s["artist_name"],
+                    match=s["match"],
                 )
-                to_db.append(sa)
+                db_similar_artists[s["artist_name"]] = db_similar_artist
+            to_db.append(db_similar_artist)
 
-        top_tracks: list[TopItem] = lastfm_artist.get_top_tracks(limit=20)
-        top_tracks.sort(key=lambda x: x.weight , reverse=True)
-        for rank, t in enumerate(top_tracks, start=1):
-            weight = int(t.weight)
-            track = t.item
-            title = track.title
-
-            db_top_track = await self.ref_data_repo.check_artist_top_track(artist_name=artist_name, track_name=title)
+        db_top_tracks = await self.ref_data_repo.get_artist_top_tracks(artist_name)
+        for t in artist_data.top_tracks:
+            db_top_track = db_top_tracks.get(t["track_name"])
             if db_top_track:
-                db_top_track.weight = weight
-                db_top_track.rank = rank
+                db_top_track.weight = t["weight"]
+                db_top_track.rank = t["rank"]
             else:
-                att = db_models.ArtistTopTrack(
+                db_top_track = db_models.ArtistTopTrack(
                     artist_name=artist_name,
-                    track_name=title,
-                    weight=weight,
-                    rank=rank
+                    track_name=t["track_name"],
+                    weight=t["weight"],
+                    rank=t["rank"]
                 )
-                to_db.append(att)
-
-        top_albums: list[TopItem] = lastfm_artist.get_top_albums(limit=20)
-        top_albums.sort(key=lambda x: x.weight, reverse=True)
-        for rank, a in enumerate(top_albums, start=1):
-            weight = int(a.weight)
-            album = a.item
-            title = album.title
+                db_top_tracks[t["track_name"]] = db_top_track
+            to_db.append(db_top_track)
 
-            db_top_album = await self.ref_data_repo.check_artist_top_album(artist_name=artist_name, album_name=title)
+        db_top_albums = await self.ref_data_repo.get_artist_top_albums(artist_name)
+        for a in artist_data.top_albums:
+            db_top_album = db_top_albums.get(a["album_name"])
             if db_top_album:
-                db_top_album.weight = weight
-                db_top_album.rank = rank
+                db_top_album.weight = a["weight"]
+                db_top_album.rank = a["rank"]
             else:
-                ata = db_models.ArtistTopAlbum(
+                db_top_album = db_models.ArtistTopAlbum(
                     artist_name=artist_name,
-                    album_name=title,
-                    weight=weight,
-                    rank=rank
+                    album_name=a["album_name"],
+                    weight=a["weight"],
+                    rank=a["rank"]
                 )
-                to_db.append(ata)
+                db_top_albums[a["album_name"]] = db_top_album
+            to_db.append(db_top_album)
 
         await self.ref_data_repo.add_and_commit(to_db)
         logger.info(f"Artist data sync complete for {artist_name}.")
@@ -280,6 +537,8 @@ class SyncService:
             db_album.cover_image = album_data.cover_image
             db_album.user_playcount = album_data.user_playcount
             db_album.listener_count = album_data.listener_count
+            db_album.last_synced_at = datetime.now()
+            to_db.append(db_album)
             logger.info(f"Updating album in DB: {artist}")
         else:
             a = db_models.Album(
@@ -291,35 +550,40 @@ class SyncService:
                 cover_image=album_data.cover_image,
                 user_playcount=album_data.user_playcount,
                 listener_count=album_data.listener_count,
+                last_synced_at=datetime.now(),
             )
             to_db.append(a)
             logger.info(f"Adding album to DB: {title}")
 
+        db_tags = await self.ref_data_repo.get_album_tags(album_name=title, artist_name=artist)
         for tag in album_data.tags:
-            db_album_tag = await self.ref_data_repo.check_album_tag(album_name=title, tag=tag["tag_name"], artist_name=artist)
-            if db_album_tag and db_album_tag.weight != tag["weight"]:
+            db_album_tag = db_tags.get(tag["tag_name"])
+            if db_album_tag:
                 db_album_tag.weight = tag["weight"]
             else:
-                at = db_models.AlbumTag(
+                db_album_tag = db_models.AlbumTag(
                     album_name=title,
                     artist_name=artist,
                     tag=tag["tag_name"],
                     weight=tag["weight"],
                 )
-                to_db.append(at)
+                db_tags[tag["tag_name"]] = db_album_tag
+            to_db.append(db_album_tag)
 
+        db_tracks = await self.ref_data_repo.get_album_tracks(album_name=title, artist_name=artist)
         for track in album_data.tracks:
-            db_album_track: db_models.AlbumTrack = await self.ref_data_repo.check_album_track(album_name=title, track_name=track["track_name"])
-            if db_album_track and db_album_track.order != track["order"]:
-                db_album_track.order = track["order"]
+            db_album_track = db_tracks.get(track.name)
+            if db_album_track:
+                db_album_track.order = track.order
             else:
-                at = db_models.AlbumTrack(
+                db_album_track = db_models.AlbumTrack(
                     album_name=title,
-                    track_name=track["track_name"],
+                    track_name=track.name,
                     artist_name=artist,
-                    order=track["order"]
+                    order=track.order
                 )
-                to_db.append(at)
+                db_tracks[track.name] = db_album_track
+            to_db.append(db_album_track)
 
         await self.ref_data_repo.add_and_commit(to_db)
         logger.info(f"Album data sync complete for {title} by {artist}.")
@@ -331,55 +595,60 @@ class SyncService:
         to_db = []
         title = track[0]
         artist = track[1]
-        track_data = await lastfm_service.get_track(track_name=title, artist_name=artist)
+        track_data = await lastfm_service.get_track(track_name=title, artist_name=artist, with_similar=True)
+
+        if not track_data:
+            logger.warning(f"Track not found on Last.fm: {artist} - {title}")
+            return
 
         db_track: db_models.Track = await self.ref_data_repo.get_track(track_name=title, artist_name=artist)
         if db_track:
             db_track.mbid = track_data.mbid
-            db_track.url = track_data.url
+            db_track.url = str(track_data.url) if track_data.url else None
             db_track.wiki = track_data.wiki
-            db_track.duration = track_data.duration
-            db_track.cover_image = str(track_data.cover_image)
+            db_track.duration = track_data.duration or None  # 0 when Last.fm does not know it
+            db_track.cover_image = str(track_data.cover_image) if track_data.cover_image else None
             db_track.user_loved = track_data.user_loved
             db_track.user_playcount = track_data.user_playcount
             db_track.listener_count = track_data.listener_count
             db_track.listener_playcount = track_data.listener_playcount
+            db_track.last_synced_at = datetime.now()
+            to_db.append(db_track)
             logger.info(f"Updating track in DB: {artist}")
         else:
             t = db_models.Track(
                 title=title,
                 artist_name=artist,
                 mbid=track_data.mbid,
-                url=str(track_data.url),
+                url=str(track_data.url) if track_data.url else None,
                 wiki=track_data.wiki,
-                cover_image=str(track_data.cover_image),
+                duration=track_data.duration or None,
+                cover_image=str(track_data.cover_image) if track_data.cover_image else None,
                 user_loved=track_data.user_loved,
                 user_playcount=track_data.user_playcount,
                 listener_count=track_data.listener_count,
                 listener_playcount=track_data.listener_playcount,
+                last_synced_at=datetime.now(),
             )
             to_db.append(t)
             logger.info(f"Adding track to DB: {title}")
 
+        db_similar_tracks = await self.ref_data_repo.get_similar_tracks(track_name=title, artist_name=artist)
         for st in track_data.similar_tracks:
-            db_similar_track = await self.ref_data_repo.check_similar_track(
-                track_name=title,
-                artist_name=artist,
-                similar_track_name=st.similar_track_name,
-                similar_track_artist_name=st.similar_track_artist_name
-            )
-
+            key = (st.similar_track_name, st.similar_track_artist_name)
+            db_similar_track = db_similar_tracks.get(key)
             if db_similar_track:
                 db_similar_track.match = st.match
             else:
-                st = db_models.SimilarTrack(
+                db_similar_track = db_models.SimilarTrack(
                     track_name=title,
                     artist_name=artist,
                     similar_track_name=st.similar_track_name,
                     similar_track_artist_name=st.similar_track_artist_name,
                     match=st.match,
                 )
-                to_db.append(st)
+                db_similar_tracks[key] = db_similar_track
+            to_db.append(db_similar_track)
 
         await self.ref_data_repo.add_and_commit(to_db)
         logger.info(f"Track data sync complete for {title} by {artist}.")
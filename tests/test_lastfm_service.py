@@ -0,0 +1,196 @@
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import httpx
+
+from core import config
+from library.session_scrobbles import SessionScrobbles
+from models.schemas import Track
+from services.lastfm_service import (
+    LastFmService, LastFmApiError, album_memo, count_requests, rate_limiter, response_cache
+)
+
+
+def track(name: str) -> Track:
+    return Track(name=name, clean_name=name, artist="Artist", album="Album", clean_album="Album")
+
+
+def scrobble_response(*ignored_codes: int) -> dict:
+    """A track.scrobble payload with one entry per play, 0 meaning accepted."""
+    return {"scrobbles": {"scrobble": [
+        {"ignoredMessage": {"code": str(code), "#text": "Track ignored" if code else ""}}
+        for code in ignored_codes
+    ]}}
+
+
+class ScrobbleManyTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.service = LastFmService()
+        self.api_post = mock.AsyncMock()
+        self.service._api_post = self.api_post
+
+    async def test_maps_accepted_and_ignored_entries(self):
+        self.api_post.return_value = scrobble_response(0, 1, 5)
+        played_at = datetime(2025, 10, 6, 18, 0)
+        plays = [(track("One"), played_at), (track("Two"), played_at), (track("Three"), played_at)]
+
+        results = await self.service.scrobble_many(plays)
+
+        self.assertEqual([r.track for r in results], [t for t, _ in plays])
+        self.assertTrue(results[0].accepted)
+        self.assertEqual(results[0].scrobble.scrobbled_at, played_at)
+        self.assertFalse(results[0].retryable)
+
+        # 1: artist ignored, which would be ignored again
+        self.assertFalse(results[1].accepted)
+        self.assertEqual((results[1].ignored_code, results[1].ignored_message), (1, "Track ignored"))
+        self.assertFalse(results[1].retryable)
+
+        # 5: daily scrobble limit exceeded, worth another try
+        self.assertFalse(results[2].accepted)
+        self.assertEqual(results[2].ignored_code, 5)
+        self.assertTrue(results[2].retryable)
+
+    async def test_failed_batch_marks_only_its_plays_retryable(self):
+        self.api_post.side_effect = [
+            scrobble_response(*[0] * 50),
+            LastFmApiError(11, "Service Offline"),
+        ]
+        plays = [(track(f"Track {i}"), None) for i in range(60)]
+
+        results = await self.service.scrobble_many(plays)
+
+        self.assertEqual(self.api_post.await_count, 2)
+        self.assertTrue(all(r.accepted for r in results[:50]))
+        self.assertTrue(all(not r.accepted and r.retryable and r.error for r in results[50:]))
+
+    async def test_http_error_fails_the_batch(self):
+        self.api_post.side_effect = httpx.ConnectError("offline")
+
+        results = await self.service.scrobble_many([(track("One"), None)])
+
+        self.assertEqual(results[0].error, "offline")
+        self.assertTrue(results[0].retryable)
+
+    async def test_undated_plays_get_distinct_increasing_timestamps(self):
+        self.api_post.return_value = scrobble_response(0, 0, 0)
+        dated = datetime(2025, 10, 6, 18, 0)
+
+        await self.service.scrobble_many([(track("One"), None), (track("Two"), dated), (track("Three"), None)])
+
+        params = self.api_post.await_args.args[1]
+        first, last = params["timestamp[0]"], params["timestamp[2]"]
+        self.assertEqual(params["timestamp[1]"], int(dated.timestamp()))
+        self.assertEqual(last - first, 1)
+
+
+class PendingScrobblesTest(unittest.IsolatedAsyncioTestCase):
+    async def test_pending_plays_are_scrobbled_at_when_they_were_queued(self):
+        session = SessionScrobbles()
+        first, second = track("One"), track("Two")
+        with mock.patch("library.session_scrobbles.datetime") as clock:
+            clock.now.side_effect = [datetime(2025, 10, 6, 18, 0), datetime(2025, 10, 6, 18, 4)]
+            session.add_pending(first)
+            session.add_pending(second)
+
+        service = LastFmService()
+        service._api_post = mock.AsyncMock(return_value=scrobble_response(0, 5))
+
+        with mock.patch("library.session_scrobbles.internet", mock.AsyncMock(return_value=True)):
+            processed = await session.process_pending_scrobbles(service)
+
+        params = service._api_post.await_args.args[1]
+        self.assertEqual(params["timestamp[0]"], int(datetime(2025, 10, 6, 18, 0).timestamp()))
+        self.assertEqual(params["timestamp[1]"], int(datetime(2025, 10, 6, 18, 4).timestamp()))
+        self.assertEqual(processed, 1)
+        self.assertEqual(session.scrobbles[0].scrobbled_at, datetime(2025, 10, 6, 18, 0))
+        # the one over the daily limit stays pending for the next try
+        self.assertEqual(session.pending, [second])
+
+
+# the smallest payload each method is parsed from
+API_RESPONSES = {
+    "artist.getInfo": {"artist": {
+        "name": "Artist", "url": "https://www.last.fm/music/Artist",
+        "stats": {"listeners": "10", "playcount": "40", "userplaycount": "2"},
+    }},
+    "artist.getTopTags": {"toptags": {"tag": [{"name": "rock", "count": "100"}]}},
+    "artist.getSimilar": {"similarartists": {"artist": [{"name": "Other", "match": "0.5"}]}},
+    "artist.getTopTracks": {"toptracks": {"track": [{"name": "Song", "playcount": "7"}]}},
+    "artist.getTopAlbums": {"topalbums": {"album": [{"name": "Album", "playcount": "3"}]}},
+    "album.getInfo": {"album": {
+        "name": "Album", "artist": "Artist", "url": "https://www.last.fm/music/Artist/Album",
+        "tracks": {"track": {"name": "Song", "duration": "180"}},
+    }},
+    "album.getTopTags": {"toptags": {"tag": []}},
+    "track.getInfo": {"track": {"name": "Song", "artist": {"name": "Artist"}, "album": {"title": "Album"}, "duration": "0"}},
+    "track.getSimilar": {"similartracks": {"track": [{"name": "Other Song", "artist": {"name": "Other"}, "match": "0.9"}]}},
+}
+
+
+class EntityRequestCountTest(unittest.IsolatedAsyncioTestCase):
+    """Each entity fetch makes one *.getInfo request, plus one per detail asked for."""
+    async def asyncSetUp(self):
+        self.methods = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            method = request.url.params["method"]
+            self.methods.append(method)
+            return httpx.Response(200, json=API_RESPONSES[method])
+
+        for patcher in (
+            mock.patch.object(config, "LASTFM_STRICT_REQUEST_COUNTS", True),
+            mock.patch.object(response_cache, "enabled", False),
+            mock.patch.object(rate_limiter, "acquire", mock.AsyncMock()),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        album_memo._entries.clear()
+        self.addCleanup(album_memo._entries.clear)
+
+        self.service = LastFmService()
+        self.service.http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        self.addAsyncCleanup(self.service.http.aclose)
+
+    async def test_get_artist(self):
+        artist = await self.service.get_artist("Artist")
+        self.assertEqual(self.methods, ["artist.getInfo"])
+        self.assertEqual(artist.listener_count, 10)
+
+    async def test_get_artist_with_details(self):
+        artist = await self.service.get_artist("Artist", with_details=True)
+        self.assertEqual(self.methods[0], "artist.getInfo")
+        self.assertCountEqual(self.methods[1:], [
+            "artist.getTopTags", "artist.getSimilar", "artist.getTopTracks", "artist.getTopAlbums",
+        ])
+        self.assertEqual(artist.top_tracks, [{"track_name": "Song", "weight": 7, "rank": 1}])
+
+    async def test_get_album(self):
+        album = await self.service.get_album("Album", "Artist", with_tracks=True)
+        self.assertEqual(self.methods, ["album.getInfo"])
+        self.assertEqual([t.duration for t in album.tracks], [180_000])
+
+    async def test_get_album_with_tags(self):
+        await self.service.get_album("Album", "Artist", with_tags=True)
+        self.assertEqual(self.methods, ["album.getInfo", "album.getTopTags"])
+
+    async def test_get_track(self):
+        track = await self.service.get_track("Song", "Artist")
+        self.assertEqual(self.methods, ["track.getInfo"])
+        self.assertEqual(track.album, "Album")
+
+    async def test_get_track_with_similar(self):
+        track = await self.service.get_track("Song", "Artist", with_similar=True)
+        self.assertEqual(self.methods, ["track.getInfo", "track.getSimilar"])
+        self.assertEqual(track.similar_tracks[0].similar_track_name, "Other Song")
+
+    async def test_more_requests_than_expected_fail(self):
+        with self.assertRaisesRegex(AssertionError, "took 2 Last.fm requests"):
+            with count_requests("artist Artist", expected=1):
+                await self.service._api_get("artist.getInfo", {"artist": "Artist"})
+                await self.service._api_get("artist.getTopTags", {"artist": "Artist"})
+
+
+if __name__ == "__main__":
+    unittest.main()
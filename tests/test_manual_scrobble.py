@@ -0,0 +1,65 @@
+import unittest
+from unittest import mock
+
+from textual.app import App
+
+from library.memo import AsyncMemo
+from library.textual_widgets import ManualScrobbleWidget
+from models.schemas import Album, Track
+
+
+class MemoizedAlbums:
+    """Stands in for LastFmService, handing out one shared album like album_memo does."""
+    def __init__(self):
+        self.calls = 0
+
+    @AsyncMemo("test-album", ttl=60)
+    async def get_album(self, title: str, artist: str, with_tracks: bool = False) -> Album:
+        self.calls += 1
+        return Album(
+            title=title,
+            artist_name=artist,
+            tracks=[
+                Track(name=f"Track {order}", artist=artist, album=title, order=order, duration=180_000)
+                for order in range(1, 4)
+            ],
+        )
+
+
+class ManualScrobbleApp(App):
+    def __init__(self, widget: ManualScrobbleWidget):
+        super().__init__()
+        self.widget = widget
+
+    def compose(self):
+        yield self.widget
+
+
+class ManualScrobbleWidgetTest(unittest.IsolatedAsyncioTestCase):
+    async def test_search_does_not_modify_the_memoized_album(self):
+        service = MemoizedAlbums()
+        widget = ManualScrobbleWidget()
+
+        with mock.patch("library.textual_widgets.get_lastfm_service", mock.AsyncMock(return_value=service)):
+            async with ManualScrobbleApp(widget).run_test() as pilot:
+                widget.album_input.value = "Album"
+                widget.artist_input.value = "Artist"
+
+                widget.dt_input.value = "2025-10-06 18:00:00"
+                await widget.handle_search().wait()
+                first = [t.time_to_scrobble for t in widget.tracks]
+
+                widget.dt_input.value = "2025-10-07 20:00:00"
+                await widget.handle_search().wait()
+                second = [t.time_to_scrobble for t in widget.tracks]
+                await pilot.pause()
+
+        album = await service.get_album(title="Album", artist="Artist", with_tracks=True)
+        self.assertEqual(service.calls, 1)
+        self.assertEqual([t.time_to_scrobble for t in album.tracks], [None, None, None])
+        self.assertNotEqual(first, second)
+        self.assertEqual(second[-1].strftime("%Y-%m-%d %H:%M:%S"), "2025-10-07 19:57:00")
+
+
+if __name__ == "__main__":
+    unittest.main()
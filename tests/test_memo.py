@@ -0,0 +1,71 @@
+import asyncio
+import unittest
+
+from library.memo import AsyncMemo
+
+
+class AsyncMemoTest(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_calls_share_one_lookup(self):
+        memo = AsyncMemo("test", ttl=60)
+        calls = 0
+
+        @memo
+        async def lookup(name: str) -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return name.upper()
+
+        results = await asyncio.gather(*(lookup("Abbey  Road") for _ in range(5)), lookup("abbey road"))
+
+        self.assertEqual(results, ["ABBEY  ROAD"] * 5 + ["ABBEY  ROAD"])
+        self.assertEqual(calls, 1)
+        self.assertEqual(memo.coalesced, 5)
+
+    async def test_cancelling_first_caller_does_not_cancel_waiters(self):
+        memo = AsyncMemo("test", ttl=60)
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        @memo
+        async def lookup(name: str) -> str:
+            started.set()
+            await release.wait()
+            return name.upper()
+
+        first = asyncio.create_task(lookup("album"))
+        await started.wait()
+        waiter = asyncio.create_task(lookup("album"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+
+        release.set()
+        self.assertEqual(await waiter, "ALBUM")
+        # the lookup finished for the waiter, so the result is memoized for the next caller too
+        self.assertEqual(await lookup("album"), "ALBUM")
+        self.assertEqual(memo.hits, 1)
+
+    async def test_errors_reach_every_caller_and_are_not_kept(self):
+        memo = AsyncMemo("test", ttl=60)
+        calls = 0
+
+        @memo
+        async def lookup(name: str) -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise ValueError(name)
+
+        results = await asyncio.gather(lookup("a"), lookup("a"), return_exceptions=True)
+
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        with self.assertRaises(ValueError):
+            await lookup("a")
+        self.assertEqual(calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from library.response_cache import ResponseCache, Unresolved
+
+
+class ResponseCacheTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache.sqlite")
+        self.cache = ResponseCache(self.path)
+
+    def accessed_at(self) -> dict[str, float]:
+        with sqlite3.connect(self.path) as conn:
+            return dict(conn.execute("select method, accessed_at from responses"))
+
+    async def test_hits_are_written_on_flush(self):
+        @self.cache.cached("album.getInfo", ttl=60)
+        async def get_album(title: str) -> str:
+            return title.upper()
+
+        await get_album("Abbey Road")
+        stored = self.accessed_at()["album.getInfo"]
+
+        self.assertEqual(await get_album("abbey road"), "ABBEY ROAD")
+        self.assertEqual(self.accessed_at()["album.getInfo"], stored)
+
+        await self.cache.flush()
+        self.assertGreater(self.accessed_at()["album.getInfo"], stored)
+
+    async def test_stats_and_unresolved_report(self):
+        @self.cache.cached("artist.getInfo", ttl=60, negative_ttl=60)
+        async def get_artist(name: str) -> str:
+            raise Unresolved(6, "The artist you supplied could not be found")
+
+        for _ in range(3):
+            self.assertIsNone(await get_artist("Teh Beatles"))
+
+        stats = await self.cache.stats()
+        self.assertEqual(stats["unresolved"], {"entries": 1, "skipped": 2})
+        self.assertEqual(stats["methods"]["artist.getInfo"]["misses"], 3)
+
+        report = await self.cache.unresolved_report()
+        self.assertEqual(len(report), 1)
+        self.assertEqual(report[0]["params"], {"name": "Teh Beatles"})
+        self.assertEqual((report[0]["reason"], report[0]["skipped"]), (6, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
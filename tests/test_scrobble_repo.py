@@ -0,0 +1,55 @@
+import unittest
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from core import config
+from models.db import Base
+from repositories.scrobble_repo import ScrobbleRepository
+
+# tables are created in their own schema, so the scrobbles in DATABASE_URL are never touched
+SCHEMA = "test_scrobble_repo"
+
+
+@unittest.skipIf(config.DATABASE_URL is None, "DATABASE_URL is not set")
+class ScrobbleRepositoryTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.engine = create_async_engine(
+            config.DATABASE_URL,
+            connect_args={"server_settings": {"search_path": SCHEMA}},
+        )
+        async with self.engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+            await conn.run_sync(Base.metadata.create_all)
+        self.session_factory = async_sessionmaker(self.engine, expire_on_commit=False, class_=AsyncSession)
+
+    async def asyncTearDown(self):
+        async with self.engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await self.engine.dispose()
+
+    async def test_plays_by_weekday_and_hour(self):
+        scrobbled_at = [
+            datetime(2024, 3, 4, 8, 15),  # Monday
+            datetime(2024, 3, 4, 8, 45),
+            datetime(2024, 3, 11, 8, 5),
+            datetime(2024, 3, 4, 22, 30),
+            datetime(2024, 3, 10, 23, 59),  # Sunday
+            datetime(2023, 3, 6, 8, 15),  # Monday, the year before
+        ]
+        async with self.session_factory() as session:
+            await ScrobbleRepository(session).copy_scrobbles([
+                {"track_name": f"Track {i}", "artist_name": "Artist", "album_name": None, "scrobbled_at": at}
+                for i, at in enumerate(scrobbled_at)
+            ])
+
+        async with self.session_factory() as session:
+            plays = await ScrobbleRepository(session).get_plays_by_weekday_and_hour(2024)
+
+        self.assertEqual([tuple(row) for row in plays], [(1, 8, 3), (1, 22, 1), (7, 23, 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,193 @@
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest import mock
+
+from models.schemas import RecentTrackRow
+from services.sync_service import SyncService
+
+
+class FakeLastFm:
+    """user.getRecentTracks over a fixed list of plays: newest first, strictly between `from` and `to`."""
+    def __init__(self, plays: list[RecentTrackRow]):
+        self.plays = sorted(plays, key=lambda p: p.timestamp, reverse=True)
+        self.requests = []
+
+    async def get_recent_track_rows(self, time_to: int = None, time_from: int = None, limit: int = 200, **kwargs):
+        self.requests.append((time_from, time_to))
+        rows = [
+            p for p in self.plays
+            if (time_from is None or p.timestamp > time_from) and (time_to is None or p.timestamp < time_to)
+        ]
+        return rows[:limit]
+
+
+def plays_at(*timestamps: int) -> list[RecentTrackRow]:
+    return [RecentTrackRow(f"Track {i}", "Artist", None, ts) for i, ts in enumerate(timestamps)]
+
+
+def job(time_from: int | None, time_to: int, **fields) -> SimpleNamespace:
+    defaults = dict(
+        cursor=None, window_size=None, window_cursors={}, completed_windows=[], incremental=False, fetched=0, saved=0,
+    )
+    return SimpleNamespace(time_from=time_from, time_to=time_to, **{**defaults, **fields})
+
+
+class SyncServiceTestCase(unittest.IsolatedAsyncioTestCase):
+    """Runs SyncService against FakeLastFm, with the database replaced by an in-memory set of plays."""
+    stored: set
+
+    def sync_service(self, lastfm: FakeLastFm, stored: list[RecentTrackRow] = ()) -> SyncService:
+        self.stored = set(stored)
+        service = SyncService()
+
+        async def save_page(tracks, clean):
+            new = set(tracks) - self.stored
+            self.stored |= new
+            return len(new)
+
+        service._save_scrobbles_page = save_page
+        service._save_checkpoint = mock.AsyncMock()
+        patcher = mock.patch("library.dependencies.get_lastfm_service", mock.AsyncMock(return_value=lastfm))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return service
+
+
+class SequentialSyncTest(SyncServiceTestCase):
+    async def test_plays_sharing_the_page_boundary_second_are_all_saved(self):
+        # 200 plays fill the first page, the last 2 of them in the same second as 3 more on the next page
+        plays = plays_at(*range(1000, 1198), *[900] * 5, *range(100, 150))
+        lastfm = FakeLastFm(plays)
+        service = self.sync_service(lastfm)
+        sync_job = job(None, 2000)
+
+        result = await service._sync_scrobbles_sequential(sync_job, clean=False)
+
+        self.assertEqual(self.stored, set(plays))
+        self.assertEqual(result, {"fetched_scrobbles": len(plays), "new_scrobbles": len(plays)})
+        self.assertEqual(sync_job.fetched, len(plays))
+        self.assertEqual(lastfm.requests[1], (None, 901))
+
+    async def test_incremental_sync_continues_past_a_duplicate_within_a_page(self):
+        latest = 1000
+        plays = plays_at(latest, *range(1001, 1500))
+        # already stored: the high-water mark, and one play the last sync picked up out of order
+        stored = [plays[0], plays[300]]
+        lastfm = FakeLastFm(plays)
+        service = self.sync_service(lastfm, stored)
+
+        result = await service._sync_scrobbles_sequential(job(latest, 2000, incremental=True), clean=False)
+
+        self.assertEqual(self.stored, set(plays))
+        self.assertEqual(result["new_scrobbles"], len(plays) - 2)
+        self.assertEqual(len(lastfm.requests), 3)
+    async def test_resumed_sync_does_not_count_plays_twice(self):
+        plays = plays_at(*range(1000, 1198), *[900] * 5, *range(100, 300))
+        lastfm = FakeLastFm(plays)
+        service = self.sync_service(lastfm)
+        sync_job = job(None, 2000)
+
+        # interrupted after the first page was checkpointed
+        fail = mock.AsyncMock(side_effect=[plays[:200], ConnectionError("offline")])
+        with mock.patch.object(lastfm, "get_recent_track_rows", fail):
+            with self.assertRaises(ConnectionError):
+                await service._sync_scrobbles_sequential(sync_job, clean=False)
+        self.assertEqual((sync_job.fetched, sync_job.cursor), (198, 901))
+
+        result = await service._sync_scrobbles_sequential(sync_job, clean=False)
+
+        self.assertEqual(self.stored, set(plays))
+        self.assertEqual(result["fetched_scrobbles"], len(plays) - 198)
+        self.assertEqual((sync_job.fetched, sync_job.saved), (len(plays), len(plays)))
+
+
+class ResumeTest(SyncServiceTestCase):
+    async def asyncSetUp(self):
+        for patcher in (
+            mock.patch("services.sync_service.response_cache.stats", mock.AsyncMock(return_value={})),
+            mock.patch("services.sync_service.rate_limiter.stats", mock.Mock(return_value={})),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_incremental_mode_is_stored_on_the_job(self):
+        service = self.sync_service(FakeLastFm([]))
+        service.scrobble_repo.get_latest_scrobbled_at = mock.AsyncMock(return_value=datetime.fromtimestamp(1000))
+        service.sync_state_repo.create_job = mock.AsyncMock(return_value=job(1000, 2000, incremental=True))
+
+        await service.sync_scrobbles(time_to="2025-10-06", incremental=True)
+
+        self.assertTrue(service.sync_state_repo.create_job.await_args.kwargs["incremental"])
+
+    async def test_resumed_job_keeps_its_incremental_mode(self):
+        latest = 1000
+        plays = plays_at(*range(latest, 1400))
+        # `from` taken as inclusive, so a page can reach the latest stored scrobble
+        lastfm = FakeLastFm(plays)
+        lastfm_get = lastfm.get_recent_track_rows
+        lastfm.get_recent_track_rows = lambda time_to=None, time_from=None, **kwargs: lastfm_get(
+            time_to=time_to, time_from=time_from - 1, **kwargs
+        )
+        service = self.sync_service(lastfm, stored=plays[:1])
+        resumed = job(latest, 2000, incremental=True, cursor=1200, fetched=200, id=1)
+        service.sync_state_repo.claim_resumable_job = mock.AsyncMock(return_value=resumed)
+
+        # not asked for an incremental sync this time; the job's own mode is used
+        result = await service.sync_scrobbles(resume=True)
+
+        # the page reaching the latest stored scrobble is the last one requested
+        self.assertEqual(len(lastfm.requests), 1)
+        self.assertEqual(result["fetched_scrobbles"], 199)
+        self.assertEqual(resumed.fetched, 399)
+        self.assertEqual(resumed.status, "complete")
+
+class WindowedSyncTest(SyncServiceTestCase):
+    async def test_plays_on_a_window_boundary_are_saved_by_the_later_window_only(self):
+        in_range = plays_at(1000, 1500, 2000, 2000, 2000, 2999, 3000)
+        outside = plays_at(999, 3001)
+        lastfm = FakeLastFm(in_range + outside)
+        service = self.sync_service(lastfm)
+        sync_job = job(1000, 3000, window_size=1000)
+
+        result = await service._sync_scrobbles_parallel(sync_job, clean=False, workers=2)
+
+        self.assertEqual(self.stored, set(in_range))
+        self.assertEqual(result, {"fetched_scrobbles": len(in_range), "new_scrobbles": len(in_range)})
+        self.assertEqual(sync_job.fetched, len(in_range))
+        self.assertCountEqual(sync_job.completed_windows, [[1000, 2000], [2000, 3000]])
+        self.assertEqual(sync_job.window_cursors, {})
+        # each window asks for (window_from - 1, window_to + 1) and filters to its own half-open range
+        self.assertCountEqual(lastfm.requests, [(999, 2001), (1999, 3001)])
+
+    async def test_plays_sharing_a_page_boundary_second_within_a_window_are_all_saved(self):
+        # 198 plays, then 5 in one second: 2 of them end the first page and 3 start the second
+        plays = plays_at(*range(1500, 1698), *[1400] * 5, *range(1100, 1110))
+        lastfm = FakeLastFm(plays)
+        service = self.sync_service(lastfm)
+        sync_job = job(1000, 2000, window_size=1000)
+        cursors = []
+        service._save_checkpoint = mock.AsyncMock(side_effect=lambda j: cursors.append(dict(j.window_cursors)))
+
+        fetched, saved = await service._sync_scrobble_window(sync_job, 1000, 2000, clean=False, include_end=True)
+
+        self.assertEqual(self.stored, set(plays))
+        self.assertEqual((fetched, saved), (len(plays), len(plays)))
+        self.assertEqual(lastfm.requests, [(999, 2001), (999, 1401)])
+        self.assertEqual(cursors, [{"1000": 1401}, {}])
+        self.assertEqual(sync_job.completed_windows, [[1000, 2000]])
+
+    async def test_window_resumes_from_its_cursor(self):
+        plays = plays_at(1900, 1600, 1200)
+        lastfm = FakeLastFm(plays)
+        service = self.sync_service(lastfm, stored=plays[:1])
+        sync_job = job(1000, 2000, window_size=1000, window_cursors={"1000": 1700})
+
+        fetched, saved = await service._sync_scrobble_window(sync_job, 1000, 2000, clean=False)
+
+        self.assertEqual((fetched, saved), (2, 2))
+        self.assertEqual(lastfm.requests, [(999, 1700)])
+
+
+if __name__ == "__main__":
+    unittest.main()
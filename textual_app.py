@@ -9,7 +9,7 @@ from textual import work
 
 from core.database import session_manager
 from library.comparison import Comparison
-from library.dependencies import get_lastfm_service, get_spotify_service
+from library.dependencies import get_lastfm_service, get_spotify_service, close_services
 from library.integrations import Integration, PlaybackAction
 from library.state import AppState
 from models.schemas import Track
@@ -96,7 +96,8 @@ class ScrobblerApp(App):
         # widgets etc.
         self.now_playing.update(self.WAITING)
         self.artist_stats.update(self.WAITING)
-        self.years = range(self.state.user.registered.year, datetime.today().year + 1)
+        user = await self.state.get_user()
+        self.years = range(user.registered.year, datetime.today().year + 1)
         self.wrapped.years = self.years
         self.lastfm_user.refresh_data()
         self.update_progress_bar()
@@ -145,6 +146,8 @@ class ScrobblerApp(App):
         if self.db_connected:
             await session_manager.close_db()
 
+        await close_services()
+
         await asyncio.sleep(1)
         self.exit()
 